@@ -7,6 +7,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
+from k2deck.actions.volume import invalidate_session_cache
 from k2deck.core.audio_devices import (
     cycle_audio_devices,
     get_audio_devices,
@@ -41,6 +42,8 @@ class AudioSwitchAction(Action):
     }
     """
 
+    __slots__ = ("_devices", "_patterns_lower", "_device_type")
+
     def __init__(self, config: dict):
         """Initialize audio switch action.
 
@@ -49,6 +52,8 @@ class AudioSwitchAction(Action):
         """
         super().__init__(config)
         self._devices = config.get("devices", [])
+        # Device matching is case-insensitive; lowercase the patterns once
+        self._patterns_lower = tuple(p.lower() for p in self._devices)
         self._device_type = config.get("type", "output")
 
     def execute(self, event: "MidiEvent") -> None:
@@ -68,14 +73,20 @@ class AudioSwitchAction(Action):
         if len(self._devices) == 1:
             # Single device - just switch to it
             device = self._devices[0]
-            if set_default_audio_device_by_name(device, self._device_type):
+            if set_default_audio_device_by_name(
+                self._patterns_lower[0], self._device_type, lowered=True
+            ):
+                invalidate_session_cache()
                 logger.info("Switched to: %s", device)
             else:
                 logger.warning("Failed to switch to: %s", device)
         else:
             # Multiple devices - cycle through them
-            result = cycle_audio_devices(self._devices, self._device_type)
+            result = cycle_audio_devices(
+                self._patterns_lower, self._device_type, lowered=True
+            )
             if result:
+                invalidate_session_cache()
                 logger.info("Audio device cycled to: %s", result)
             else:
                 logger.warning("Failed to cycle audio devices")
@@ -94,6 +105,8 @@ class AudioListAction(Action):
     }
     """
 
+    __slots__ = ("_device_type",)
+
     def __init__(self, config: dict):
         """Initialize audio list action.
 
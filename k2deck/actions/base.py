@@ -8,7 +8,24 @@ if TYPE_CHECKING:
 
 
 class Action(ABC):
-    """Abstract base class for all actions."""
+    """Abstract base class for all actions.
+
+    Subclasses declare their instance attributes in __slots__, so action
+    instances (one per mapped control) carry no per-instance __dict__.
+    """
+
+    __slots__ = ("config", "name")
+
+    # Button releases (note_off) are only dispatched to actions that opt in
+    handles_release: bool = False
+
+    # Event type ("note_on" or "cc") the action reacts to; the app skips
+    # dispatching other types. None means the action sees every event.
+    handles_type: str | None = None
+
+    # Actions that build nested actions via create_action read their depth
+    # from config["_depth"]; only these get it injected
+    nests_actions: bool = False
 
     def __init__(self, config: dict):
         """Initialize action with config.
@@ -26,6 +43,16 @@ class Action(ABC):
         Must not block for more than 100ms.
         Must not raise exceptions (catch and log internally).
 
+        Guard on event type inline (e.g. ``if event.type != "cc": return``).
+        Event types are interned strings, so these checks are identity
+        compares and cheaper than calling a shared predicate. Keep the
+        guard even when handles_type is set: conditional, timer and web
+        callers invoke execute directly, bypassing the app's dispatcher.
+
+        MappingEngine reuses one instance per mapped control, and button
+        presses run on a worker pool, so execute can run concurrently on
+        the same instance. Guard mutable instance state with a lock.
+
         Args:
             event: The MIDI event that triggered this action.
         """
@@ -5,9 +5,11 @@ which apps are running, or the state of toggle buttons.
 """
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
+from k2deck.actions.multi import MultiToggleAction
 from k2deck.core.action_factory import MAX_ACTION_DEPTH, create_action
 from k2deck.core.context import is_app_focused, is_app_running
 
@@ -17,6 +19,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class _Lazy:
+    """Log argument that calls a function only when the record is formatted."""
+
+    __slots__ = ("_fn", "_args")
+
+    def __init__(self, fn: Callable[..., str], *args):
+        self._fn = fn
+        self._args = args
+
+    def __str__(self) -> str:
+        return self._fn(*self._args)
+
+
 class ConditionalAction(Action):
     """Execute different actions based on conditions.
 
@@ -49,6 +64,16 @@ class ConditionalAction(Action):
     }
     """
 
+    nests_actions = True
+
+    __slots__ = (
+        "_depth",
+        "_conditions",
+        "_default_config",
+        "_default_action",
+        "_branches",
+    )
+
     def __init__(self, config: dict):
         """Initialize conditional action.
 
@@ -65,6 +90,20 @@ class ConditionalAction(Action):
         if self._default_config:
             self._default_action = create_action(self._default_config, self._depth + 1)
 
+        # Compile each condition to a predicate and pre-create its "then"
+        # action so execute only dispatches (skipped at max depth, where
+        # execute never runs them anyway)
+        self._branches: list[tuple[Callable[[], bool], dict, Action | None]] = []
+        if self._depth < MAX_ACTION_DEPTH:
+            for condition in self._conditions:
+                then_config = condition.get("then")
+                then_action = None
+                if then_config:
+                    then_action = create_action(then_config, self._depth + 1)
+                self._branches.append(
+                    (self._compile_condition(condition), condition, then_action)
+                )
+
     def execute(self, event: "MidiEvent") -> None:
         """Execute the matching conditional action.
 
@@ -79,18 +118,16 @@ class ConditionalAction(Action):
             return
 
         # Evaluate conditions in order
-        for condition in self._conditions:
-            if self._check_condition(condition):
-                then_config = condition.get("then")
-                if then_config:
-                    action = create_action(then_config, self._depth + 1)
-                    if action:
-                        logger.debug(
-                            "Condition matched: %s -> %s",
-                            self._describe_condition(condition),
-                            then_config.get("action"),
-                        )
-                        action.execute(event)
+        for predicate, condition, action in self._branches:
+            if predicate():
+                if action:
+                    # Description is only built if a DEBUG record is emitted
+                    logger.debug(
+                        "Condition matched: %s -> %s",
+                        _Lazy(self._describe_condition, condition),
+                        condition["then"].get("action"),
+                    )
+                    action.execute(event)
                 return
 
         # No condition matched, execute default
@@ -109,48 +146,49 @@ class ConditionalAction(Action):
         Returns:
             True if condition is met, False otherwise.
         """
-        # Check app_focused condition
-        if "app_focused" in condition:
-            app_name = condition["app_focused"]
-            if not is_app_focused(app_name):
-                return False
-
-        # Check app_running condition
-        if "app_running" in condition:
-            app_name = condition["app_running"]
-            if not is_app_running(app_name):
-                return False
+        return self._compile_condition(condition)()
 
-        # Check toggle_state condition
-        if "toggle_state" in condition:
-            toggle_check = condition["toggle_state"]
-            if not self._check_toggle_state(toggle_check):
-                return False
+    def _compile_condition(self, condition: dict) -> Callable[[], bool]:
+        """Build a predicate for a condition, resolving its keys once.
 
-        # All conditions passed (or no conditions specified)
-        return True
-
-    def _check_toggle_state(self, toggle_check: dict) -> bool:
-        """Check toggle state condition.
+        Checks run in order app_focused, app_running, toggle_state and
+        short-circuit on the first failure.
 
         Args:
-            toggle_check: Dict with "note" (int) and "state" (bool).
+            condition: Condition dict to compile.
 
         Returns:
-            True if toggle state matches, False otherwise.
+            Zero-argument callable returning True if the condition is met.
         """
-        # Import here to avoid circular import
-        from k2deck.actions.multi import MultiToggleAction
+        checks: list[Callable[[], bool]] = []
 
-        note = toggle_check.get("note")
-        expected_state = toggle_check.get("state", True)
+        if "app_focused" in condition:
+            focused_name = condition["app_focused"]
+            checks.append(lambda: is_app_focused(focused_name))
 
-        if note is None:
-            logger.warning("toggle_state condition missing 'note' key")
-            return False
+        if "app_running" in condition:
+            running_name = condition["app_running"]
+            checks.append(lambda: is_app_running(running_name))
 
-        actual_state = MultiToggleAction.get_state(note)
-        return actual_state == expected_state
+        if "toggle_state" in condition:
+            toggle_check = condition["toggle_state"]
+            note = toggle_check.get("note")
+            expected_state = toggle_check.get("state", True)
+            if note is None:
+                logger.warning("toggle_state condition missing 'note' key")
+                checks.append(lambda: False)
+            else:
+                get_state = MultiToggleAction.get_state
+                checks.append(lambda: get_state(note) == expected_state)
+
+        if not checks:
+            # No conditions specified - always matches
+            return lambda: True
+        if len(checks) == 1:
+            return checks[0]
+
+        checks_tuple = tuple(checks)
+        return lambda: all(check() for check in checks_tuple)
 
     def _describe_condition(self, condition: dict) -> str:
         """Create human-readable description of a condition.
@@ -4,10 +4,11 @@ Useful for tracking kills, reps, pomodoros, or any countable metric.
 """
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
-from k2deck.core.counters import get_counter_manager
+from k2deck.core.counters import CounterManager, get_counter_manager
 
 if TYPE_CHECKING:
     from k2deck.core.midi_listener import MidiEvent
@@ -55,6 +56,8 @@ class CounterAction(Action):
     }
     """
 
+    __slots__ = ("_name", "_operation", "_amount", "_value", "_op")
+
     def __init__(self, config: dict) -> None:
         """Initialize counter action.
 
@@ -67,6 +70,14 @@ class CounterAction(Action):
         self._amount = config.get("amount", 1)
         self._value = config.get("value", 0)
 
+        # Resolve the operation once instead of comparing strings per press
+        self._op: Callable[[CounterManager], int] | None = {
+            "increment": self._increment,
+            "decrement": self._decrement,
+            "reset": self._reset,
+            "set": self._set,
+        }.get(self._operation)
+
     def execute(self, event: "MidiEvent") -> None:
         """Execute counter operation.
 
@@ -77,20 +88,27 @@ class CounterAction(Action):
         if event.type != "note_on" or event.value == 0:
             return
 
-        mgr = get_counter_manager()
-
-        if self._operation == "increment":
-            value = mgr.increment(self._name, self._amount)
-        elif self._operation == "decrement":
-            value = mgr.decrement(self._name, self._amount)
-        elif self._operation == "reset":
-            mgr.reset(self._name)
-            value = 0
-        elif self._operation == "set":
-            mgr.set(self._name, self._value)
-            value = self._value
-        else:
+        if self._op is None:
             logger.warning("CounterAction: unknown operation '%s'", self._operation)
             return
 
+        value = self._op(get_counter_manager())
         logger.info("Counter '%s': %d", self._name, value)
+
+    def _increment(self, mgr: CounterManager) -> int:
+        """Increment the counter by the configured amount."""
+        return mgr.increment(self._name, self._amount)
+
+    def _decrement(self, mgr: CounterManager) -> int:
+        """Decrement the counter by the configured amount."""
+        return mgr.decrement(self._name, self._amount)
+
+    def _reset(self, mgr: CounterManager) -> int:
+        """Reset the counter to zero."""
+        mgr.reset(self._name)
+        return 0
+
+    def _set(self, mgr: CounterManager) -> int:
+        """Set the counter to the configured value."""
+        mgr.set(self._name, self._value)
+        return self._value
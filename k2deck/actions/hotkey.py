@@ -5,7 +5,7 @@ games and apps that ignore virtual key codes.
 """
 
 import logging
-import time
+import threading
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
@@ -18,13 +18,17 @@ logger = logging.getLogger(__name__)
 
 
 def _focus_target_app(target_app: str | None) -> bool:
-    """Focus target app if specified."""
+    """Focus target app if specified.
+
+    Waits (up to 50ms) for the focus change only when the app was not
+    already in the foreground.
+    """
     if not target_app:
         return True
     try:
         from k2deck.actions.window import focus_app
 
-        return focus_app(target_app)
+        return focus_app(target_app, settle_timeout=0.05)
     except ImportError:
         logger.warning("Window focus not available")
         return False
@@ -39,11 +43,15 @@ def release_all_modifiers() -> None:
     keyboard.release_all_modifiers()
 
 
-def execute_hotkey(keys: list[str], release_after: bool = True) -> None:
+def execute_hotkey(
+    keys: list[str] | tuple[str, ...], release_after: bool = True
+) -> None:
     """Execute a keyboard hotkey combination.
 
     Uses Windows SendInput API with hardware scan codes for reliable
-    key simulation.
+    key simulation. A single key is sent as one press and one release
+    batch; chords keep a 10ms gap between key-downs, since some apps drop
+    keys that arrive together.
 
     Args:
         keys: List of key names to press simultaneously.
@@ -53,13 +61,15 @@ def execute_hotkey(keys: list[str], release_after: bool = True) -> None:
         return
 
     try:
-        keyboard.execute_hotkey(keys, hold_ms=15, between_ms=10)
+        between_ms = 10 if len(keys) > 1 else 0
+        keyboard.execute_hotkey(keys, hold_ms=15, between_ms=between_ms)
 
         # Extra safety: release ALL modifiers to prevent stuck keys
         if release_after:
             keyboard.release_all_modifiers()
 
-        logger.debug("Executed hotkey: %s", keys)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Executed hotkey: %s", keys)
     except Exception as e:
         logger.error("Failed to execute hotkey %s: %s", keys, e)
         # Make sure to release ALL held keys
@@ -77,47 +87,59 @@ class HotkeyAction(Action):
       - toggle: First press holds, second press releases
     """
 
-    _toggle_states: dict[int, bool] = {}  # Track toggle state per button
+    __slots__ = ("_keys", "_mode", "_on_press", "handles_release")
+
+    # Toggle state per button as a bitset over MIDI notes (bit N = note N held)
+    _toggle_states: int = 0
+    _toggle_lock = threading.Lock()
+
+    def __init__(self, config: dict):
+        """Initialize hotkey action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        # Normalize key names once (keyboard lookups are lowercase)
+        self._keys = tuple(key.lower() for key in config.get("keys") or ())
+        self._mode = config.get("mode", "tap")
+
+        # Resolve mode handlers once instead of comparing strings per event
+        self._on_press = {
+            "tap": self._execute_tap,
+            "hold": self._execute_hold_start,
+            "toggle": self._execute_toggle,
+        }.get(self._mode)
+        self.handles_release = self._mode == "hold"
 
     def execute(self, event: "MidiEvent") -> None:
         """Execute the hotkey based on mode."""
-        keys = self.config.get("keys", [])
+        keys = self._keys
         if not keys:
             return
 
-        mode = self.config.get("mode", "tap")
-
-        if event.type == "note_on":
-            if event.value > 0:
-                # Button pressed
-                if mode == "tap":
-                    self._execute_tap(keys)
-                elif mode == "hold":
-                    self._execute_hold_start(keys, event.note)
-                elif mode == "toggle":
-                    self._execute_toggle(keys, event.note)
-            else:
-                # Button released (note_on with velocity 0)
-                if mode == "hold":
-                    self._execute_hold_end(keys, event.note)
+        if event.type == "note_on" and event.value > 0:
+            # Button pressed
+            if self._on_press:
+                self._on_press(keys, event.note)
 
-        elif event.type == "note_off":
-            # Button released
-            if mode == "hold":
+        elif event.type in ("note_on", "note_off"):
+            # Button released (note_off or note_on with velocity 0)
+            if self.handles_release:
                 self._execute_hold_end(keys, event.note)
 
         elif event.type == "cc":
             # For CC-triggered hotkeys (like media keys on knobs)
             self._execute_tap(keys)
 
-    def _execute_tap(self, keys: list[str]) -> None:
+    def _execute_tap(self, keys: tuple[str, ...], note: int | None = None) -> None:
         """Standard tap: press and release immediately."""
         try:
             execute_hotkey(keys)
         except Exception as e:
             logger.error("HotkeyAction tap error: %s", e)
 
-    def _execute_hold_start(self, keys: list[str], note: int) -> None:
+    def _execute_hold_start(self, keys: tuple[str, ...], note: int) -> None:
         """Start holding keys."""
         try:
             for key in keys:
@@ -126,7 +148,7 @@ class HotkeyAction(Action):
         except Exception as e:
             logger.error("HotkeyAction hold start error: %s", e)
 
-    def _execute_hold_end(self, keys: list[str], note: int) -> None:
+    def _execute_hold_end(self, keys: tuple[str, ...], note: int) -> None:
         """Release held keys."""
         try:
             for key in reversed(keys):
@@ -136,27 +158,36 @@ class HotkeyAction(Action):
             logger.error("HotkeyAction hold end error: %s", e)
             keyboard.release_all_keys()
 
-    def _execute_toggle(self, keys: list[str], note: int) -> None:
+    def _execute_toggle(self, keys: tuple[str, ...], note: int) -> None:
         """Toggle: first press holds, second press releases."""
-        current_state = self._toggle_states.get(note, False)
+        mask = 1 << note
 
-        try:
-            if current_state:
-                # Currently held, release
-                for key in reversed(keys):
-                    keyboard.release_key(key)
-                self._toggle_states[note] = False
-                logger.debug("Toggle released: %s", keys)
-            else:
-                # Not held, press and hold
-                for key in keys:
-                    keyboard.press_key(key)
-                self._toggle_states[note] = True
-                logger.debug("Toggle pressed: %s", keys)
-        except Exception as e:
-            logger.error("HotkeyAction toggle error: %s", e)
-            keyboard.release_all_keys()
-            self._toggle_states[note] = False
+        # Pool workers may toggle different notes at once; keep the
+        # check-and-update of the shared bitset atomic.
+        with HotkeyAction._toggle_lock:
+            try:
+                if HotkeyAction._toggle_states & mask:
+                    # Currently held, release
+                    for key in reversed(keys):
+                        keyboard.release_key(key)
+                    HotkeyAction._toggle_states &= ~mask
+                    logger.debug("Toggle released: %s", keys)
+                else:
+                    # Not held, press and hold
+                    for key in keys:
+                        keyboard.press_key(key)
+                    HotkeyAction._toggle_states |= mask
+                    logger.debug("Toggle pressed: %s", keys)
+            except Exception as e:
+                logger.error("HotkeyAction toggle error: %s", e)
+                keyboard.release_all_keys()
+                HotkeyAction._toggle_states &= ~mask
+
+    @classmethod
+    def reset_toggle_states(cls) -> None:
+        """Reset all toggle states (for profile switch or testing)."""
+        with cls._toggle_lock:
+            cls._toggle_states = 0
 
 
 class HotkeyRelativeAction(Action):
@@ -168,38 +199,113 @@ class HotkeyRelativeAction(Action):
     - cw: keys for clockwise rotation
     - ccw: keys for counter-clockwise rotation
     - target_app: process name to focus before sending keys (e.g., "brave.exe")
+    - coalesce_ms: optional window (ms) to merge same-direction ticks into a
+      single batched send (default 0 = send every tick immediately)
     """
 
+    __slots__ = (
+        "_cw_keys",
+        "_ccw_keys",
+        "_target_app",
+        "_dir_table",
+        "_coalesce_s",
+        "_pending",
+        "_pending_lock",
+        "_flush_timer",
+    )
+
+    def __init__(self, config: dict):
+        """Initialize relative hotkey action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._cw_keys = tuple(key.lower() for key in config.get("cw") or ())
+        self._ccw_keys = tuple(key.lower() for key in config.get("ccw") or ())
+        self._target_app: str | None = config.get("target_app")
+
+        # Direction lookup by CC value (two's complement: 1-63 = CW,
+        # 65-127 = CCW, 0 and 64 = no movement)
+        cw = (self._cw_keys, "CW") if self._cw_keys else None
+        ccw = (self._ccw_keys, "CCW") if self._ccw_keys else None
+        self._dir_table: tuple[tuple[tuple[str, ...], str] | None, ...] = (
+            (None,) + (cw,) * 63 + (None,) + (ccw,) * 63
+        )
+
+        # Burst coalescing: pending [keys, direction, count] flushed by a timer
+        self._coalesce_s = max(0, config.get("coalesce_ms", 0)) / 1000.0
+        self._pending: list | None = None
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+
     def execute(self, event: "MidiEvent") -> None:
         """Execute directional hotkey based on encoder direction."""
         if event.type != "cc":
             return
 
-        # Focus target app if specified
-        target_app = self.config.get("target_app")
-        if target_app:
-            _focus_target_app(target_app)
-            time.sleep(0.05)  # Brief delay for window focus
-
-        # Determine direction from CC value
-        # Two's complement: 1-63 = CW, 65-127 = CCW (127 = -1)
-        value = event.value
-
-        if 1 <= value <= 63:
-            # Clockwise
-            keys = self.config.get("cw", [])
-            direction = "CW"
-        elif 65 <= value <= 127:
-            # Counter-clockwise
-            keys = self.config.get("ccw", [])
-            direction = "CCW"
-        else:
-            # Value 0 or 64 - ignore
+        entry = self._dir_table[event.value & 0x7F]
+        if entry is None:
             return
+        keys, direction = entry
 
-        if keys:
-            try:
-                execute_hotkey(keys)
+        if self._coalesce_s > 0:
+            self._queue_tick(keys, direction)
+            return
+
+        self._focus_target()
+
+        try:
+            execute_hotkey(keys)
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug("HotkeyRelative %s: %s", direction, keys)
-            except Exception as e:
-                logger.error("HotkeyRelativeAction error: %s", e)
+        except Exception as e:
+            logger.error("HotkeyRelativeAction error: %s", e)
+
+    def _focus_target(self) -> None:
+        """Focus target app if specified."""
+        if self._target_app:
+            _focus_target_app(self._target_app)
+
+    def _queue_tick(self, keys: tuple[str, ...], direction: str) -> None:
+        """Add a tick to the pending burst, flushing on direction change."""
+        flush_now = None
+        with self._pending_lock:
+            if self._pending and self._pending[1] != direction:
+                flush_now = self._pending
+                self._pending = None
+
+            if self._pending:
+                self._pending[2] += 1
+            else:
+                self._pending = [keys, direction, 1]
+
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._coalesce_s, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        if flush_now:
+            self._send_burst(*flush_now)
+
+    def _flush(self) -> None:
+        """Send the pending burst (timer callback)."""
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = None
+            self._flush_timer = None
+
+        if pending:
+            self._send_burst(*pending)
+
+    def _send_burst(self, keys: tuple[str, ...], direction: str, count: int) -> None:
+        """Send coalesced ticks as one batched keyboard call."""
+        self._focus_target()
+
+        try:
+            keyboard.tap_hotkey_repeated(keys, count)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("HotkeyRelative %s x%d: %s", direction, count, keys)
+        except Exception as e:
+            logger.error("HotkeyRelativeAction error: %s", e)
+            keyboard.release_all_keys()
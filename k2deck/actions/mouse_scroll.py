@@ -1,11 +1,10 @@
 """Mouse scroll action - Scroll simulation using pynput."""
 
 import logging
+import threading
 import time
 from typing import TYPE_CHECKING
 
-from pynput.mouse import Controller
-
 from k2deck.actions.base import Action
 
 if TYPE_CHECKING:
@@ -13,25 +12,86 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Mouse controller singleton
-_mouse = Controller()
+# Mouse controller singleton (created on first scroll, see _get_mouse)
+_mouse = None
+
+
+def _get_mouse():
+    """Get the pynput mouse controller, creating it on first use.
+
+    Importing pynput runs its backend discovery, so it is deferred until a
+    scroll mapping is actually used instead of slowing down startup.
+    """
+    global _mouse
+    if _mouse is None:
+        from pynput.mouse import Controller
+
+        _mouse = Controller()
+    return _mouse
+
+
+# Target apps with a background focus change in flight
+_focus_pending: set[str] = set()
+# Target app -> monotonic time of the last failed focus attempt
+_focus_failed: dict[str, float] = {}
+_focus_lock = threading.Lock()
+
+# After a failed focus, scroll the current window instead of dropping ticks
+FOCUS_RETRY_INTERVAL = 2.0  # seconds
+
+
+def _focus_worker(target_app: str) -> None:
+    """Focus target app off the dispatch thread (background thread body)."""
+    try:
+        from k2deck.actions.window import focus_app
+
+        focused = focus_app(target_app, settle_timeout=0.05)
+    except Exception as e:
+        logger.warning("Failed to focus %s: %s", target_app, e)
+        focused = False
+
+    with _focus_lock:
+        _focus_pending.discard(target_app)
+        if focused:
+            _focus_failed.pop(target_app, None)
+        else:
+            _focus_failed[target_app] = time.monotonic()
 
 
 def _focus_target_app(target_app: str | None) -> bool:
-    """Focus target app if specified.
+    """Make sure the target app is focused without blocking.
 
-    Returns True if focus was successful or no target specified.
+    If the app is not in the foreground, focusing starts on a background
+    thread and False is returned so the caller can drop the tick instead
+    of waiting for the focus change.
+
+    Returns True if the app is focused, no target is specified, or focusing
+    recently failed (the tick then goes to the current window, as before).
     """
     if not target_app:
         return True
 
     try:
-        from k2deck.actions.window import focus_app
-
-        return focus_app(target_app)
+        from k2deck.actions.window import is_foreground
     except ImportError:
         logger.warning("Window focus not available")
-        return False
+        return True
+
+    if is_foreground(target_app):
+        return True
+
+    with _focus_lock:
+        if target_app in _focus_pending:
+            return False
+        failed_at = _focus_failed.get(target_app)
+        if failed_at and time.monotonic() - failed_at < FOCUS_RETRY_INTERVAL:
+            return True
+        _focus_pending.add(target_app)
+
+    threading.Thread(
+        target=_focus_worker, args=(target_app,), name="k2deck-focus", daemon=True
+    ).start()
+    return False
 
 
 class MouseScrollAction(Action):
@@ -46,49 +106,94 @@ class MouseScrollAction(Action):
     - invert: if true, CW=down, CCW=up (default: true, like a volume knob)
     - acceleration: if true, faster rotation = more scroll (default: false)
     - target_app: process name to focus before scrolling (e.g., "Discord.exe")
+    - coalesce_ms: optional window (ms) to sum ticks into a single scroll
+      call (default 0 = scroll on every tick)
     """
 
+    __slots__ = (
+        "_target_app",
+        "_scroll_lut",
+        "_coalesce_s",
+        "_pending_amount",
+        "_pending_lock",
+        "_flush_timer",
+    )
+
+    def __init__(self, config: dict):
+        """Initialize mouse scroll action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        step = config.get("step", 3)
+        # Default inverted (like volume knob): CW scrolls down
+        sign = -1 if config.get("invert", True) else 1
+        acceleration = config.get("acceleration", False)
+        self._target_app: str | None = config.get("target_app")
+
+        # Signed scroll amount per CC value (0 and 64 = no movement)
+        lut = [0] * 128
+        for value in range(1, 64):
+            # Clockwise
+            ticks = min(value, 5) if acceleration else 1
+            lut[value] = sign * step * ticks
+        for value in range(65, 128):
+            # Counter-clockwise
+            ticks = min(128 - value, 5) if acceleration else 1
+            lut[value] = -sign * step * ticks
+        self._scroll_lut = tuple(lut)
+
+        # Burst coalescing: pending scroll amount flushed by a timer
+        self._coalesce_s = max(0, config.get("coalesce_ms", 0)) / 1000.0
+        self._pending_amount = 0
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+
     def execute(self, event: "MidiEvent") -> None:
         """Execute mouse scroll based on encoder direction."""
         if event.type != "cc":
             return
 
-        # Focus target app if specified
-        target_app = self.config.get("target_app")
-        if target_app:
-            _focus_target_app(target_app)
-            time.sleep(0.05)  # Brief delay for window focus
+        amount = self._scroll_lut[event.value & 0x7F]
+        if not amount:
+            return
 
-        step = self.config.get("step", 3)
-        invert = self.config.get("invert", True)  # Default inverted (like volume knob)
-        value = event.value
+        if self._coalesce_s > 0:
+            self._queue_scroll(amount)
+            return
 
-        try:
-            if 1 <= value <= 63:
-                # Clockwise
-                scroll_amount = step
-                if self.config.get("acceleration", False):
-                    scroll_amount = step * min(value, 5)
-
-                if invert:
-                    _mouse.scroll(0, -scroll_amount)  # CW = down
-                    logger.debug("Scroll down: %d", scroll_amount)
-                else:
-                    _mouse.scroll(0, scroll_amount)  # CW = up
-                    logger.debug("Scroll up: %d", scroll_amount)
-
-            elif 65 <= value <= 127:
-                # Counter-clockwise
-                scroll_amount = step
-                if self.config.get("acceleration", False):
-                    scroll_amount = step * min(128 - value, 5)
-
-                if invert:
-                    _mouse.scroll(0, scroll_amount)  # CCW = up
-                    logger.debug("Scroll up: %d", scroll_amount)
-                else:
-                    _mouse.scroll(0, -scroll_amount)  # CCW = down
-                    logger.debug("Scroll down: %d", scroll_amount)
+        self._scroll(amount)
+
+    def _queue_scroll(self, amount: int) -> None:
+        """Add a tick to the pending scroll amount."""
+        with self._pending_lock:
+            self._pending_amount += amount
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._coalesce_s, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Send the pending scroll amount (timer callback)."""
+        with self._pending_lock:
+            amount = self._pending_amount
+            self._pending_amount = 0
+            self._flush_timer = None
+
+        if amount:
+            self._scroll(amount)
+
+    def _scroll(self, amount: int) -> None:
+        """Focus the target app (if any) and scroll by a signed amount."""
+        # Drop the tick while the target app is being brought to front
+        if self._target_app and not _focus_target_app(self._target_app):
+            return
 
+        try:
+            _get_mouse().scroll(0, amount)
+            if logger.isEnabledFor(logging.DEBUG):
+                direction = "up" if amount > 0 else "down"
+                logger.debug("Scroll %s: %d", direction, abs(amount))
         except Exception as e:
             logger.error("MouseScrollAction error: %s", e)
@@ -4,8 +4,12 @@ Uses Windows SendInput API with hardware scan codes for reliable
 execution of complex multi-step macro sequences.
 """
 
+import array
 import logging
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
@@ -17,10 +21,85 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-# Global state tracker for toggle actions (keyed by button note)
-_toggle_states: dict[int, bool] = {}
-_last_toggle_time: dict[int, float] = {}
-_toggle_debounce_ms: float = 300  # Minimum time between toggle presses
+# Global state tracker for toggle actions, indexed by MIDI note (0-127)
+_toggle_states = bytearray(128)  # 1 = ON
+_last_toggle_time = array.array("q", bytes(8 * 128))  # monotonic ns
+_toggle_debounce_ns = 300_000_000  # Minimum time between toggle presses (300ms)
+
+# Last trigger time per button for MultiAction (monotonic ns)
+_last_trigger_time = array.array("q", bytes(8 * 128))
+
+# Sequences run on one dedicated thread so macros never interleave and
+# don't tie up the shared action workers
+MAX_PENDING_SEQUENCES = 2
+_seq_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="k2deck-macro")
+_seq_pending = 0
+_seq_lock = threading.Lock()
+
+
+def _sequence_done(_future: Future) -> None:
+    """Decrement the pending sequence count (Future callback)."""
+    global _seq_pending
+    with _seq_lock:
+        _seq_pending -= 1
+
+
+def _submit_sequence(fn: Callable[..., None], *args, bounded: bool = True) -> bool:
+    """Queue a key sequence on the macro thread.
+
+    Args:
+        fn: Function that plays the sequence.
+        *args: Arguments for fn.
+        bounded: If False, queue even when the backlog is full (for presses
+            that other state, such as a toggle LED, already depends on).
+
+    Returns:
+        True if queued, False if dropped because the backlog is full.
+    """
+    global _seq_pending
+    with _seq_lock:
+        if bounded and _seq_pending >= MAX_PENDING_SEQUENCES:
+            return False
+        _seq_pending += 1
+
+    _seq_executor.submit(fn, *args).add_done_callback(_sequence_done)
+    return True
+
+
+def _play_sequence(
+    sequence: list[list[str]],
+    delay_sec: float,
+    hold_ms: float,
+    between_ms: float,
+    step_log_level: int = logging.DEBUG,
+) -> None:
+    """Play hotkeys in order with modifier releases around the sequence.
+
+    Args:
+        sequence: Hotkeys to execute.
+        delay_sec: Delay after each step.
+        hold_ms: Hold time per hotkey.
+        between_ms: Delay between key presses within a hotkey.
+        step_log_level: Log level used to report each step.
+    """
+    # IMPORTANT: Release all modifiers first to prevent stuck keys, and give
+    # the release time to register
+    keyboard.release_all_modifiers()
+    time.sleep(0.05)
+
+    for i, keys in enumerate(sequence):
+        if keys:
+            try:
+                keyboard.execute_hotkey(keys, hold_ms=hold_ms, between_ms=between_ms)
+                logger.log(step_log_level, "  Step %d: %s", i + 1, keys)
+            except Exception as e:
+                logger.error("  Step %d FAILED: %s", i + 1, e)
+
+            # Delay after every action to ensure it registers
+            time.sleep(delay_sec)
+
+    # Final safety: release all modifiers
+    keyboard.release_all_modifiers()
 
 
 class MultiAction(Action):
@@ -34,40 +113,48 @@ class MultiAction(Action):
             ["win", "shift", "s"],
             ["ctrl", "v"]
         ],
-        "delay_ms": 100
+        "delay_ms": 100,
+        "debounce_ms": 150
     }
+
+    Presses of the same button within debounce_ms (default 150) are ignored
+    so repeated presses don't stack up long sequences.
     """
 
+    __slots__ = ("_debounce_ns",)
+
+    def __init__(self, config: dict):
+        """Initialize multi action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._debounce_ns = int(config.get("debounce_ms", 150) * 1_000_000)
+
     def execute(self, event: "MidiEvent") -> None:
         """Execute all hotkeys in sequence."""
         if event.type != "note_on" or event.value == 0:
             return
 
+        # Debounce: prevent rapid presses from queueing repeated sequences
+        note = event.note
+        now = time.monotonic_ns()
+        if now - _last_trigger_time[note] < self._debounce_ns:
+            logger.debug("Multi-action debounced (too fast)")
+            return
+        _last_trigger_time[note] = now
+
         sequence = self.config.get("sequence", [])
         delay_ms = self.config.get("delay_ms", 50)
         delay_sec = delay_ms / 1000.0
 
         name = self.config.get("name", "multi")
+        if not _submit_sequence(_play_sequence, sequence, delay_sec, 20, 10):
+            logger.warning("Multi-action %s dropped (macro backlog full)", name)
+            return
         logger.info("Executing multi-action: %s (%d steps)", name, len(sequence))
 
-        # Release all modifiers first to prevent stuck keys
-        keyboard.release_all_modifiers()
-        time.sleep(0.05)
-
-        for i, keys in enumerate(sequence):
-            if keys:
-                try:
-                    keyboard.execute_hotkey(keys, hold_ms=20, between_ms=10)
-                    logger.debug("Multi step %d: %s", i + 1, keys)
-                except Exception as e:
-                    logger.error("Multi step %d failed: %s", i + 1, e)
-
-                # Delay after each action
-                time.sleep(delay_sec)
-
-        # Final safety: release all modifiers
-        keyboard.release_all_modifiers()
-
 
 class MultiToggleAction(Action):
     """Toggle between two sequences of hotkeys.
@@ -93,6 +180,8 @@ class MultiToggleAction(Action):
     }
     """
 
+    __slots__ = ()
+
     def execute(self, event: "MidiEvent") -> None:
         """Execute on_sequence or off_sequence based on current state."""
         if event.type != "note_on" or event.value == 0:
@@ -101,14 +190,13 @@ class MultiToggleAction(Action):
         note = event.note
 
         # Debounce: prevent rapid double-presses
-        now = time.time() * 1000
-        last_time = _last_toggle_time.get(note, 0)
-        if now - last_time < _toggle_debounce_ms:
+        now = time.monotonic_ns()
+        if now - _last_toggle_time[note] < _toggle_debounce_ns:
             logger.debug("Multi-toggle debounced (too fast)")
             return
         _last_toggle_time[note] = now
 
-        current_state = _toggle_states.get(note, False)
+        current_state = _toggle_states[note] == 1
 
         # Select sequence based on state
         if current_state:
@@ -125,7 +213,15 @@ class MultiToggleAction(Action):
         delay_ms = self.config.get("delay_ms", 50)
         delay_sec = delay_ms / 1000.0
 
+        # Never dropped: the LED is toggled for every press, so a dropped
+        # press would leave the LED and the toggle state out of sync
         name = self.config.get("name", "multi_toggle")
+        _submit_sequence(
+            _play_sequence, sequence, delay_sec, 25, 15, logging.INFO, bounded=False
+        )
+
+        # Flip state on submit so the next press picks the right sequence
+        _toggle_states[note] = 1 if new_state else 0
         logger.info(
             "Multi-toggle %s: was=%s → now=%s (%d steps)",
             name,
@@ -134,38 +230,19 @@ class MultiToggleAction(Action):
             len(sequence),
         )
 
-        # IMPORTANT: Release all modifiers first to prevent stuck keys
-        keyboard.release_all_modifiers()
-        time.sleep(0.05)
-
-        for i, keys in enumerate(sequence):
-            if keys:
-                try:
-                    keyboard.execute_hotkey(keys, hold_ms=25, between_ms=15)
-                    logger.info("  Step %d: %s", i + 1, keys)
-                except Exception as e:
-                    logger.error("  Step %d FAILED: %s", i + 1, e)
-
-                # Delay after EVERY action to ensure it registers
-                time.sleep(delay_sec)
-
-        # Final safety: release all modifiers again
-        keyboard.release_all_modifiers()
-
-        # Update state
-        _toggle_states[note] = new_state
-
     @staticmethod
     def get_state(note: int) -> bool:
-        """Get current toggle state for a note."""
-        return _toggle_states.get(note, False)
+        """Get current toggle state for a note (False for invalid notes)."""
+        if note is None or not 0 <= note <= 127:
+            return False
+        return _toggle_states[note] == 1
 
     @staticmethod
     def set_state(note: int, state: bool) -> None:
         """Manually set toggle state (useful for LED sync)."""
-        _toggle_states[note] = state
+        _toggle_states[note] = 1 if state else 0
 
     @staticmethod
     def reset_all() -> None:
         """Reset all toggle states."""
-        _toggle_states.clear()
+        _toggle_states[:] = bytes(128)
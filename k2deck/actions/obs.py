@@ -8,7 +8,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
-from k2deck.core.obs_client import get_obs_client
+from k2deck.core.obs_client import OBSClientManager, get_obs_client
 
 if TYPE_CHECKING:
     from k2deck.core.midi_listener import MidiEvent
@@ -16,6 +16,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _resolve_client() -> OBSClientManager | None:
+    """Get the OBS client if obsws-python is installed.
+
+    Returns:
+        The shared OBS client, or None if OBS support is unavailable.
+    """
+    client = get_obs_client()
+    if not client.is_available:
+        logger.warning("OBS: obsws-python not installed")
+        return None
+    return client
+
+
 class OBSSceneAction(Action):
     """Switch to a specific OBS scene.
 
@@ -29,6 +42,8 @@ class OBSSceneAction(Action):
     }
     """
 
+    __slots__ = ("_client", "_scene")
+
     def __init__(self, config: dict) -> None:
         """Initialize OBS scene action.
 
@@ -36,6 +51,7 @@ class OBSSceneAction(Action):
             config: Action configuration.
         """
         super().__init__(config)
+        self._client = _resolve_client()
         self._scene = config.get("scene", "")
 
     def execute(self, event: "MidiEvent") -> None:
@@ -52,12 +68,10 @@ class OBSSceneAction(Action):
             logger.warning("OBSSceneAction: no scene configured")
             return
 
-        client = get_obs_client()
-        if not client.is_available:
-            logger.warning("OBS: obsws-python not installed")
+        if self._client is None:
             return
 
-        client.set_scene(self._scene)
+        self._client.set_scene(self._scene)
 
 
 class OBSSourceToggleAction(Action):
@@ -84,6 +98,8 @@ class OBSSourceToggleAction(Action):
     }
     """
 
+    __slots__ = ("_client", "_scene", "_source", "_visible")
+
     def __init__(self, config: dict) -> None:
         """Initialize OBS source toggle action.
 
@@ -91,6 +107,7 @@ class OBSSourceToggleAction(Action):
             config: Action configuration.
         """
         super().__init__(config)
+        self._client = _resolve_client()
         self._scene = config.get("scene", "")
         self._source = config.get("source", "")
         self._visible = config.get("visible")  # None = toggle
@@ -112,12 +129,10 @@ class OBSSourceToggleAction(Action):
             logger.warning("OBSSourceToggleAction: no source configured")
             return
 
-        client = get_obs_client()
-        if not client.is_available:
-            logger.warning("OBS: obsws-python not installed")
+        if self._client is None:
             return
 
-        client.toggle_source_visibility(self._scene, self._source, self._visible)
+        self._client.toggle_source_visibility(self._scene, self._source, self._visible)
 
 
 class OBSStreamAction(Action):
@@ -133,6 +148,8 @@ class OBSStreamAction(Action):
     }
     """
 
+    __slots__ = ("_client", "_mode")
+
     def __init__(self, config: dict) -> None:
         """Initialize OBS stream action.
 
@@ -140,6 +157,7 @@ class OBSStreamAction(Action):
             config: Action configuration.
         """
         super().__init__(config)
+        self._client = _resolve_client()
         self._mode = config.get("mode", "toggle")
 
     def execute(self, event: "MidiEvent") -> None:
@@ -152,12 +170,10 @@ class OBSStreamAction(Action):
         if event.type != "note_on" or event.value == 0:
             return
 
-        client = get_obs_client()
-        if not client.is_available:
-            logger.warning("OBS: obsws-python not installed")
+        if self._client is None:
             return
 
-        client.toggle_stream(self._mode)
+        self._client.toggle_stream(self._mode)
 
 
 class OBSRecordAction(Action):
@@ -173,6 +189,8 @@ class OBSRecordAction(Action):
     }
     """
 
+    __slots__ = ("_client", "_mode")
+
     def __init__(self, config: dict) -> None:
         """Initialize OBS record action.
 
@@ -180,6 +198,7 @@ class OBSRecordAction(Action):
             config: Action configuration.
         """
         super().__init__(config)
+        self._client = _resolve_client()
         self._mode = config.get("mode", "toggle")
 
     def execute(self, event: "MidiEvent") -> None:
@@ -192,12 +211,10 @@ class OBSRecordAction(Action):
         if event.type != "note_on" or event.value == 0:
             return
 
-        client = get_obs_client()
-        if not client.is_available:
-            logger.warning("OBS: obsws-python not installed")
+        if self._client is None:
             return
 
-        client.toggle_record(self._mode)
+        self._client.toggle_record(self._mode)
 
 
 class OBSMuteAction(Action):
@@ -221,6 +238,8 @@ class OBSMuteAction(Action):
     }
     """
 
+    __slots__ = ("_client", "_input", "_muted")
+
     def __init__(self, config: dict) -> None:
         """Initialize OBS mute action.
 
@@ -228,6 +247,7 @@ class OBSMuteAction(Action):
             config: Action configuration.
         """
         super().__init__(config)
+        self._client = _resolve_client()
         self._input = config.get("input", "")
         self._muted = config.get("muted")  # None = toggle
 
@@ -245,9 +265,7 @@ class OBSMuteAction(Action):
             logger.warning("OBSMuteAction: no input configured")
             return
 
-        client = get_obs_client()
-        if not client.is_available:
-            logger.warning("OBS: obsws-python not installed")
+        if self._client is None:
             return
 
-        client.toggle_mute(self._input, self._muted)
+        self._client.toggle_mute(self._input, self._muted)
@@ -11,7 +11,7 @@ import threading
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
-from k2deck.core.osc import OscSender
+from k2deck.core.osc import OscSender, build_osc_message
 
 if TYPE_CHECKING:
     from k2deck.core.midi_listener import MidiEvent
@@ -63,40 +63,59 @@ class OscSendAction(Action):
         curve: "linear" (default) or "exponential"
     """
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_address",
+        "_param",
+        "_sender",
+        "_min",
+        "_max",
+        "_curve",
+        "_lut",
+    )
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._host = config.get("osc_host", "127.0.0.1")
         self._port = config.get("osc_port", 9000)
         self._address = config.get("osc_address", "/pd/param")
         self._param = config.get("osc_param", "")
+        # OscSender is a per-(host, port) singleton; resolve it once here
+        self._sender = OscSender(self._host, self._port)
         self._min = float(config.get("min", 0.0))
         self._max = float(config.get("max", 1.0))
         self._curve = config.get("curve", "linear")
 
+        # MIDI 0-127 -> final output value, computed once per action
+        self._lut = tuple(
+            _scale_to_range(_apply_curve(v / 127.0, self._curve), self._min, self._max)
+            for v in range(128)
+        )
+
     def execute(self, event: "MidiEvent") -> None:
         """Normalize CC value, apply curve, scale, and send via OSC."""
         if event.type != "cc":
             return
 
         try:
-            normalized = event.value / 127.0
-            curved = _apply_curve(normalized, self._curve)
-            scaled = _scale_to_range(curved, self._min, self._max)
+            scaled = self._lut[event.value]
 
-            sender = OscSender(self._host, self._port)
+            sender = self._sender
             if self._param:
-                sender.send(self._address, self._param, float(scaled))
+                sender.send_async(self._address, self._param, scaled, coalesce=True)
             else:
-                sender.send(self._address, float(scaled))
-
-            logger.debug(
-                "OSC %s %s=%.3f (midi=%d, curve=%s)",
-                self._address,
-                self._param,
-                scaled,
-                event.value,
-                self._curve,
-            )
+                sender.send_async(self._address, scaled, coalesce=True)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "OSC %s %s=%.3f (midi=%d, curve=%s)",
+                    self._address,
+                    self._param,
+                    scaled,
+                    event.value,
+                    self._curve,
+                )
         except Exception as e:
             logger.error("OscSendAction error: %s", e)
 
@@ -119,6 +138,19 @@ class OscSendRelativeAction(Action):
         initial: Starting value (default: midpoint of min/max)
     """
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_address",
+        "_param",
+        "_sender",
+        "_min",
+        "_max",
+        "_delta_lut",
+        "_initial",
+        "_acc_key",
+    )
+
     _accumulators: dict[str, float] = {}
     _acc_lock = threading.Lock()
 
@@ -128,9 +160,16 @@ class OscSendRelativeAction(Action):
         self._port = config.get("osc_port", 9000)
         self._address = config.get("osc_address", "/pd/param")
         self._param = config.get("osc_param", "")
+        self._sender = OscSender(self._host, self._port)
         self._min = float(config.get("min", 0.0))
         self._max = float(config.get("max", 127.0))
-        self._step = float(config.get("step", 1.0))
+        step = float(config.get("step", 1.0))
+        # Two's complement deltas per CC value: 1-63 = CW, 65-127 = CCW,
+        # 0 and 64 = no movement
+        self._delta_lut = tuple(
+            v * step if v < 64 else (v - 128) * step if v > 64 else 0.0
+            for v in range(128)
+        )
 
         default_initial = (self._min + self._max) / 2.0
         self._initial = float(config.get("initial", default_initial))
@@ -143,13 +182,8 @@ class OscSendRelativeAction(Action):
             return
 
         try:
-            # Decode two's complement: 1-63 = CW, 65-127 = CCW
-            value = event.value
-            if 1 <= value <= 63:
-                delta = value * self._step
-            elif 65 <= value <= 127:
-                delta = (value - 128) * self._step
-            else:
+            delta = self._delta_lut[event.value]
+            if not delta:
                 return  # 0 or 64 — ignore
 
             with self._acc_lock:
@@ -159,19 +193,22 @@ class OscSendRelativeAction(Action):
                 new_value = max(self._min, min(self._max, current + delta))
                 self._accumulators[self._acc_key] = new_value
 
-            sender = OscSender(self._host, self._port)
+            sender = self._sender
             if self._param:
-                sender.send(self._address, self._param, float(new_value))
+                sender.send_async(
+                    self._address, self._param, float(new_value), coalesce=True
+                )
             else:
-                sender.send(self._address, float(new_value))
-
-            logger.debug(
-                "OSC relative %s %s=%.2f (delta=%.1f)",
-                self._address,
-                self._param,
-                new_value,
-                delta,
-            )
+                sender.send_async(self._address, float(new_value), coalesce=True)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "OSC relative %s %s=%.2f (delta=%.1f)",
+                    self._address,
+                    self._param,
+                    new_value,
+                    delta,
+                )
         except Exception as e:
             logger.error("OscSendRelativeAction error: %s", e)
 
@@ -193,7 +230,19 @@ class OscSendTriggerAction(Action):
         mode: "bang" (sends 1.0 on press) or "toggle" (alternates 0.0/1.0)
     """
 
+    __slots__ = (
+        "_host",
+        "_port",
+        "_address",
+        "_param",
+        "_sender",
+        "_mode",
+        "_toggle_key",
+        "_packets",
+    )
+
     _toggle_states: dict[str, bool] = {}
+    _toggle_lock = threading.Lock()
 
     def __init__(self, config: dict) -> None:
         super().__init__(config)
@@ -201,42 +250,53 @@ class OscSendTriggerAction(Action):
         self._port = config.get("osc_port", 9000)
         self._address = config.get("osc_address", "/pd/param")
         self._param = config.get("osc_param", "")
+        self._sender = OscSender(self._host, self._port)
         self._mode = config.get("mode", "bang")
 
         self._toggle_key = self._param or f"{self._address}_{self._port}"
 
+        # Only two messages are ever sent, so encode them once: (off, on).
+        # A bad osc_param disables the action instead of failing its creation.
+        prefix = (self._param,) if self._param else ()
+        self._packets: tuple[bytes, bytes] | None = None
+        try:
+            self._packets = (
+                build_osc_message(self._address, *prefix, 0.0),
+                build_osc_message(self._address, *prefix, 1.0),
+            )
+        except (ValueError, TypeError) as e:
+            logger.warning("OscSendTriggerAction '%s' disabled: %s", self.name, e)
+
     def execute(self, event: "MidiEvent") -> None:
         """Send bang or toggle via OSC on button press."""
         if event.type != "note_on" or event.value == 0:
             return
+        if self._packets is None:
+            return
 
         try:
-            sender = OscSender(self._host, self._port)
-
             if self._mode == "toggle":
-                current = self._toggle_states.get(self._toggle_key, False)
-                new_state = not current
-                self._toggle_states[self._toggle_key] = new_state
-                send_value = 1.0 if new_state else 0.0
+                with self._toggle_lock:
+                    new_state = not self._toggle_states.get(self._toggle_key, False)
+                    self._toggle_states[self._toggle_key] = new_state
             else:
-                send_value = 1.0
-
-            if self._param:
-                sender.send(self._address, self._param, float(send_value))
-            else:
-                sender.send(self._address, float(send_value))
-
-            logger.debug(
-                "OSC trigger %s %s=%.1f (mode=%s)",
-                self._address,
-                self._param,
-                send_value,
-                self._mode,
-            )
+                new_state = True
+
+            self._sender.send_packet_async(self._packets[new_state])
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "OSC trigger %s %s=%.1f (mode=%s)",
+                    self._address,
+                    self._param,
+                    1.0 if new_state else 0.0,
+                    self._mode,
+                )
         except Exception as e:
             logger.error("OscSendTriggerAction error: %s", e)
 
     @classmethod
     def reset_toggle_states(cls) -> None:
         """Reset all toggle states (for profile switch or testing)."""
-        cls._toggle_states.clear()
+        with cls._toggle_lock:
+            cls._toggle_states.clear()
@@ -1,11 +1,18 @@
 """Sound Playback Action - Play audio files on button press.
 
 Supports WAV files natively (no dependencies).
-MP3/OGG support requires pygame (optional).
+MP3/OGG support requires pygame (optional). When pygame is installed it
+plays WAV files too, from preloaded buffers on its mixer channels. pygame
+is imported and its mixer opened on first use, so configs without sound
+actions never pay for SDL's audio device setup.
 """
 
+import functools
 import logging
+import threading
+import time
 import winsound
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,18 +23,61 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Try to import pygame for MP3 support
-_pygame_available = False
-try:
-    import pygame.mixer
+# Mixer channels reserved for overlapping cues (pygame's default is 8)
+MIXER_CHANNELS = 16
+# 512-sample buffer (~12 ms at 44.1 kHz) instead of pygame's default 1024
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512
 
-    pygame.mixer.init()
-    _pygame_available = True
-    logger.debug("pygame.mixer available for MP3/OGG playback")
-except ImportError:
-    logger.debug("pygame not installed, only WAV files supported")
-except Exception as e:
-    logger.warning("pygame.mixer init failed: %s", e)
+# None until pygame has been probed by _ensure_pygame(); the module is
+# bound to ``pygame`` once it imports
+_pygame_available: bool | None = None
+pygame = None
+_pygame_lock = threading.Lock()
+
+
+def _ensure_pygame() -> bool:
+    """Import pygame and open the mixer on first call.
+
+    Returns:
+        True if pygame.mixer is usable.
+    """
+    global _pygame_available, pygame
+    if _pygame_available is not None:
+        return _pygame_available
+
+    with _pygame_lock:
+        if _pygame_available is None:
+            try:
+                import pygame.mixer
+
+                pygame.mixer.pre_init(
+                    frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=MIXER_BUFFER
+                )
+                pygame.mixer.init()
+                pygame.mixer.set_num_channels(MIXER_CHANNELS)
+                _pygame_available = True
+                logger.debug("pygame.mixer available for MP3/OGG playback")
+            except ImportError:
+                _pygame_available = False
+                logger.debug("pygame not installed, only WAV files supported")
+            except Exception as e:
+                _pygame_available = False
+                logger.warning("pygame.mixer init failed: %s", e)
+    return _pygame_available
+
+
+# Formats played through pygame (WAV too when pygame is available)
+_PYGAME_FORMATS = (".mp3", ".ogg", ".flac")
+
+# How long a successful file existence check is trusted
+EXISTS_CHECK_TTL_NS = 5_000_000_000
+
+# Actions are created on the MIDI thread (on first press), so the mixer open
+# and file decode of a preload run here instead
+_preload_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="k2deck-sound-preload"
+)
 
 
 def play_wav(file_path: str, async_play: bool = True) -> bool:
@@ -51,9 +101,26 @@ def play_wav(file_path: str, async_play: bool = True) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=32)
+def _load_sound(file_path: str) -> "pygame.mixer.Sound":
+    """Decode an audio file once; actions sharing a file share the buffer.
+
+    Args:
+        file_path: Path to audio file (WAV, MP3, OGG).
+
+    Returns:
+        The decoded pygame Sound.
+    """
+    return pygame.mixer.Sound(file_path)
+
+
 def play_with_pygame(file_path: str, volume: float = 1.0) -> bool:
     """Play audio file using pygame mixer.
 
+    The file is decoded on first use and cached, so repeat triggers play
+    straight from memory. The cached Sound is shared between actions, so
+    volume is set on the playing channel, not on the Sound.
+
     Args:
         file_path: Path to audio file (WAV, MP3, OGG).
         volume: Volume level 0.0-1.0.
@@ -61,14 +128,14 @@ def play_with_pygame(file_path: str, volume: float = 1.0) -> bool:
     Returns:
         True if playback started, False on error.
     """
-    if not _pygame_available:
+    if not _ensure_pygame():
         logger.warning("pygame not available for '%s'", file_path)
         return False
 
     try:
-        pygame.mixer.music.load(file_path)
-        pygame.mixer.music.set_volume(volume)
-        pygame.mixer.music.play()
+        channel = _load_sound(file_path).play()
+        if channel is not None:  # None when every mixer channel is busy
+            channel.set_volume(volume)
         return True
     except Exception as e:
         logger.error("Failed to play '%s' with pygame: %s", file_path, e)
@@ -83,10 +150,10 @@ def stop_playback() -> None:
     except Exception:
         pass
 
-    # Stop pygame if available
+    # Stop pygame if it has been started
     if _pygame_available:
         try:
-            pygame.mixer.music.stop()
+            pygame.mixer.stop()
         except Exception:
             pass
 
@@ -100,9 +167,15 @@ class SoundPlayAction(Action):
         stop_others: Stop other sounds before playing (default: False)
 
     Supported formats:
-        - WAV: Always supported (Windows native)
+        - WAV: Always supported (pygame if installed, else Windows native)
         - MP3, OGG: Requires pygame
 
+    The file path is resolved when the action is created, and pygame-played
+    files are decoded on a background worker, so presses don't touch the
+    disk and creating the action doesn't block MIDI input. The pygame mixer
+    plays sounds on separate channels, so rapid triggers can overlap; the
+    winsound fallback plays one WAV at a time.
+
     Config example:
     {
         "action": "sound_play",
@@ -111,6 +184,8 @@ class SoundPlayAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def __init__(self, config: dict):
         """Initialize sound play action.
 
@@ -122,6 +197,26 @@ class SoundPlayAction(Action):
         self._volume = config.get("volume", 100) / 100.0  # Convert to 0-1
         self._stop_others = config.get("stop_others", False)
 
+        self._path = Path(self._file)
+        self._ext = self._path.suffix.lower()
+        self._exists = bool(self._file) and self._path.exists()
+        self._exists_checked_ns = time.monotonic_ns()
+        self._preloaded = False
+
+        uses_pygame = self._ext == ".wav" or self._ext in _PYGAME_FORMATS
+        if self._exists and uses_pygame:
+            _preload_executor.submit(self._preload)
+
+    def _preload(self) -> None:
+        """Open the pygame mixer and decode the file (preload worker)."""
+        if not _ensure_pygame():
+            return
+        try:
+            _load_sound(str(self._path))
+            self._preloaded = True
+        except Exception as e:
+            logger.warning("Failed to preload sound '%s': %s", self._file, e)
+
     def execute(self, event: "MidiEvent") -> None:
         """Play the configured sound.
 
@@ -136,23 +231,30 @@ class SoundPlayAction(Action):
             logger.warning("SoundPlayAction: no file configured")
             return
 
-        # Validate file exists
-        path = Path(self._file)
-        if not path.exists():
-            logger.warning("Sound file not found: %s", self._file)
-            return
+        # Validate file exists. Preloaded sounds play from memory; otherwise
+        # a found file is trusted for EXISTS_CHECK_TTL_NS, a missing one is
+        # re-checked on every press.
+        path = self._path
+        if not self._preloaded:
+            now = time.monotonic_ns()
+            if not self._exists or now - self._exists_checked_ns > EXISTS_CHECK_TTL_NS:
+                self._exists = path.exists()
+                self._exists_checked_ns = now
+            if not self._exists:
+                logger.warning("Sound file not found: %s", self._file)
+                return
 
         # Stop other sounds if requested
         if self._stop_others:
             stop_playback()
 
         # Choose playback method based on file extension
-        ext = path.suffix.lower()
+        ext = self._ext
 
-        if ext == ".wav":
-            # Use native Windows API for WAV (fast, no dependencies)
+        if ext == ".wav" and not _ensure_pygame():
+            # Native Windows API for WAV when pygame is missing
             success = play_wav(str(path))
-        elif ext in (".mp3", ".ogg", ".flac"):
+        elif ext == ".wav" or ext in _PYGAME_FORMATS:
             # Use pygame for other formats
             success = play_with_pygame(str(path), self._volume)
         else:
@@ -174,6 +276,8 @@ class SoundStopAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def execute(self, event: "MidiEvent") -> None:
         """Stop all sounds.
 
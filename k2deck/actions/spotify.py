@@ -4,9 +4,12 @@ Uses Windows SendInput API for media key fallback when API is unavailable.
 """
 
 import logging
+import threading
+import time
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
+from k2deck.actions.volume import invalidate_session_cache, set_process_volume
 from k2deck.core import keyboard
 from k2deck.core.spotify_client import spotify
 
@@ -15,6 +18,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Encoder direction per CC value (two's complement): 1-63 = CW (+1),
+# 65-127 = CCW (-1), 0 and 64 = no movement
+_ENCODER_DIRECTION = tuple(1 if 0 < v < 64 else -1 if v > 64 else 0 for v in range(128))
+
 
 def _media_key_fallback(key_name: str) -> bool:
     """Send media key as fallback when API fails.
@@ -36,6 +43,8 @@ def _media_key_fallback(key_name: str) -> bool:
 class SpotifyPlayPauseAction(Action):
     """Toggle Spotify play/pause using media key for instant response."""
 
+    handles_type = "note_on"
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
             return
@@ -48,6 +57,8 @@ class SpotifyPlayPauseAction(Action):
 class SpotifyNextAction(Action):
     """Skip to next track using media key for instant response."""
 
+    handles_type = "note_on"
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
             return
@@ -59,6 +70,8 @@ class SpotifyNextAction(Action):
 class SpotifyPreviousAction(Action):
     """Go to previous track using media key for instant response."""
 
+    handles_type = "note_on"
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
             return
@@ -70,6 +83,8 @@ class SpotifyPreviousAction(Action):
 class SpotifyLikeAction(Action):
     """Toggle like status of current track."""
 
+    handles_type = "note_on"
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
             return
@@ -86,6 +101,8 @@ class SpotifyLikeAction(Action):
 class SpotifyShuffleAction(Action):
     """Toggle shuffle mode."""
 
+    handles_type = "note_on"
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
             return
@@ -102,6 +119,8 @@ class SpotifyShuffleAction(Action):
 class SpotifyRepeatAction(Action):
     """Cycle through repeat modes."""
 
+    handles_type = "note_on"
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
             return
@@ -124,27 +143,69 @@ class SpotifyVolumeAction(Action):
     Config options:
     - min_volume: Minimum volume (default: 0)
     - max_volume: Maximum volume (default: 100)
+    - coalesce_ms: window (ms) in which only the newest volume is applied,
+      so a fast knob turn makes one mixer call (default: 10, 0 = apply
+      every value)
     """
 
+    handles_type = "cc"
+
+    def __init__(self, config: dict):
+        """Initialize Spotify volume action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._min_vol = config.get("min_volume", 0) / 100.0
+        self._max_vol = config.get("max_volume", 100) / 100.0
+
+        # Trailing-edge coalescing: newest volume applied by a timer
+        self._coalesce_s = max(0, config.get("coalesce_ms", 10)) / 1000.0
+        self._pending_volume: float | None = None
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "cc":
             return
 
-        try:
-            from k2deck.actions.volume import (
-                invalidate_session_cache,
-                set_process_volume,
-            )
+        # Map MIDI value (0-127) to volume (0.0-1.0)
+        min_vol = self._min_vol
+        volume = min_vol + (event.value / 127.0) * (self._max_vol - min_vol)
 
-            # Map MIDI value (0-127) to volume (0.0-1.0)
-            min_vol = self.config.get("min_volume", 0) / 100.0
-            max_vol = self.config.get("max_volume", 100) / 100.0
-            volume = min_vol + (event.value / 127.0) * (max_vol - min_vol)
+        # Invalidate cache periodically to catch Spotify starting
+        if event.value == 0 or event.value == 127:
+            invalidate_session_cache()
 
-            # Invalidate cache periodically to catch Spotify starting
-            if event.value == 0 or event.value == 127:
-                invalidate_session_cache()
+        if self._coalesce_s > 0:
+            self._queue_volume(volume)
+            return
 
+        self._set_volume(volume)
+
+    def _queue_volume(self, volume: float) -> None:
+        """Replace the pending volume, arming the flush timer if idle."""
+        with self._pending_lock:
+            self._pending_volume = volume
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._coalesce_s, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Apply the pending volume (timer callback)."""
+        with self._pending_lock:
+            volume = self._pending_volume
+            self._pending_volume = None
+            self._flush_timer = None
+
+        if volume is not None:
+            self._set_volume(volume)
+
+    def _set_volume(self, volume: float) -> None:
+        """Set Spotify's mixer volume."""
+        try:
             if set_process_volume("Spotify.exe", volume):
                 logger.debug("Spotify volume: %.0f%%", volume * 100)
         except Exception as e:
@@ -158,26 +219,37 @@ class SpotifySeekAction(Action):
     - step_ms: Milliseconds to seek per encoder tick (default: 5000 = 5 seconds)
     """
 
+    handles_type = "cc"
+
+    def __init__(self, config: dict):
+        """Initialize seek action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        step_ms = int(config.get("step_ms", 5000))
+        # Seek delta per CC value. Two's complement: 1-63 = CW (forward),
+        # 65-127 = CCW (backward), accelerated up to 3 steps; 0/64 = none
+        self._delta_lut = tuple(
+            step_ms * min(v, 3)
+            if v < 64
+            else -step_ms * min(128 - v, 3)
+            if v > 64
+            else 0
+            for v in range(128)
+        )
+
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "cc":
             return
 
-        if not spotify.is_ready:
-            logger.debug("Spotify not connected, seek ignored")
+        delta = self._delta_lut[event.value]
+        if not delta:
             return
 
-        step_ms = self.config.get("step_ms", 5000)
-        value = event.value
-
-        # Determine direction from encoder value
-        # Two's complement: 1-63 = CW (forward), 65-127 = CCW (backward)
-        if 1 <= value <= 63:
-            # Clockwise = forward
-            delta = step_ms * min(value, 3)  # Some acceleration
-        elif 65 <= value <= 127:
-            # Counter-clockwise = backward
-            delta = -step_ms * min(128 - value, 3)
-        else:
+        if not spotify.is_ready:
+            logger.debug("Spotify not connected, seek ignored")
             return
 
         spotify.seek_relative(delta)
@@ -189,30 +261,44 @@ class SpotifyPrevNextAction(Action):
 
     CW = next track, CCW = previous track.
     Includes debounce to prevent multiple skips on fast rotation.
+
+    Config options:
+    - debounce_ms: Minimum time between skips (default: 300)
     """
 
-    _last_skip_time: float = 0
-    _debounce_ms: float = 300  # Minimum time between skips
+    handles_type = "cc"
+
+    def __init__(self, config: dict):
+        """Initialize prev/next action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._debounce_ns = int(config.get("debounce_ms", 300)) * 1_000_000
+        self._last_skip_ns = 0
+        self._skip_lock = threading.Lock()
 
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "cc":
             return
 
-        import time
-
-        now = time.time() * 1000
-        if now - self._last_skip_time < self._debounce_ms:
+        direction = _ENCODER_DIRECTION[event.value]
+        if not direction:
             return
 
-        value = event.value
+        # Check and claim the skip atomically; the instance is shared
+        now = time.monotonic_ns()
+        with self._skip_lock:
+            if now - self._last_skip_ns < self._debounce_ns:
+                return
+            self._last_skip_ns = now
 
-        if 1 <= value <= 63:
+        if direction > 0:
             # Clockwise = next
             _media_key_fallback("media_next")
             logger.debug("Spotify: next")
-            self._last_skip_time = now
-        elif 65 <= value <= 127:
+        else:
             # Counter-clockwise = previous
             _media_key_fallback("media_previous")
             logger.debug("Spotify: previous")
-            self._last_skip_time = now
@@ -1,18 +1,85 @@
 """System actions - Lock, screenshot, power commands, URL, clipboard."""
 
 import ctypes
+import functools
 import logging
 import subprocess
+import threading
 import webbrowser
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
 from k2deck.actions.base import Action
+from k2deck.core import keyboard
 
 if TYPE_CHECKING:
     from k2deck.core.midi_listener import MidiEvent
 
 logger = logging.getLogger(__name__)
 
+SW_SHOWNORMAL = 1
+# subprocess.CREATE_NO_WINDOW: run console tools without flashing a window
+CREATE_NO_WINDOW = 0x08000000
+# CoInitializeEx flags recommended for threads that call ShellExecute
+COINIT_APARTMENTTHREADED = 0x2
+COINIT_DISABLE_OLE1DDE = 0x4
+
+_com_thread_state = threading.local()
+
+
+@functools.cache
+def _get_shell_execute():
+    """Bind shell32.ShellExecuteW once, with argument types declared."""
+    shell_execute = ctypes.windll.shell32.ShellExecuteW
+    shell_execute.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_wchar_p,
+        ctypes.c_int,
+    ]
+    shell_execute.restype = ctypes.c_void_p
+    return shell_execute
+
+
+def _ensure_com_initialized() -> None:
+    """Enter a COM apartment once per calling thread.
+
+    ShellExecute may hand the request to COM-based shell extensions, so COM
+    must be initialized on the (executor) thread that calls it.
+    """
+    if getattr(_com_thread_state, "initialized", False):
+        return
+    hr = ctypes.windll.ole32.CoInitializeEx(
+        None, COINIT_APARTMENTTHREADED | COINIT_DISABLE_OLE1DDE
+    )
+    if hr < 0:
+        # e.g. RPC_E_CHANGED_MODE: already initialized as MTA, usable as is
+        logger.debug("CoInitializeEx: 0x%08x", hr & 0xFFFFFFFF)
+    _com_thread_state.initialized = True
+
+
+def _shell_open(target: str) -> bool:
+    """Open a URI or program through ShellExecuteW.
+
+    Protocol URIs (ms-settings:, ms-screenclip:) are dispatched by the shell
+    directly instead of spawning an explorer.exe process to forward them.
+
+    Args:
+        target: URI or executable to open.
+
+    Returns:
+        True if the shell accepted the request.
+    """
+    _ensure_com_initialized()
+    result = _get_shell_execute()(None, "open", target, None, None, SW_SHOWNORMAL)
+    # ShellExecuteW returns a value greater than 32 on success
+    if (result or 0) <= 32:
+        logger.error("ShellExecuteW failed for '%s' (code %s)", target, result)
+        return False
+    return True
+
 
 def lock_workstation() -> bool:
     """Lock the Windows workstation."""
@@ -27,9 +94,8 @@ def lock_workstation() -> bool:
 def take_screenshot() -> bool:
     """Take a screenshot using Windows Snipping Tool."""
     try:
-        # Win+Shift+S opens Snip & Sketch
-        subprocess.Popen(["explorer", "ms-screenclip:"])
-        return True
+        # Same as Win+Shift+S: opens the Snip & Sketch overlay
+        return _shell_open("ms-screenclip:")
     except Exception as e:
         logger.error("Failed to take screenshot: %s", e)
         return False
@@ -38,7 +104,7 @@ def take_screenshot() -> bool:
 def open_task_manager() -> bool:
     """Open Windows Task Manager."""
     try:
-        subprocess.Popen(["taskmgr"])
+        subprocess.Popen(["taskmgr"], close_fds=False)
         return True
     except Exception as e:
         logger.error("Failed to open Task Manager: %s", e)
@@ -48,8 +114,7 @@ def open_task_manager() -> bool:
 def open_settings() -> bool:
     """Open Windows Settings."""
     try:
-        subprocess.Popen(["explorer", "ms-settings:"])
-        return True
+        return _shell_open("ms-settings:")
     except Exception as e:
         logger.error("Failed to open Settings: %s", e)
         return False
@@ -86,7 +151,7 @@ def shutdown_computer(force: bool = False) -> bool:
         cmd = ["shutdown", "/s", "/t", "0"]
         if force:
             cmd.append("/f")
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, creationflags=CREATE_NO_WINDOW, close_fds=False)
         return True
     except Exception as e:
         logger.error("Failed to shutdown: %s", e)
@@ -103,13 +168,37 @@ def restart_computer(force: bool = False) -> bool:
         cmd = ["shutdown", "/r", "/t", "0"]
         if force:
             cmd.append("/f")
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, creationflags=CREATE_NO_WINDOW, close_fds=False)
         return True
     except Exception as e:
         logger.error("Failed to restart: %s", e)
         return False
 
 
+# Only web URLs may be opened (blocks file://, javascript://, etc.)
+_ALLOWED_URL_SCHEMES = frozenset(("http", "https"))
+
+
+def _is_allowed_url(url: str) -> bool:
+    """Check that a URL uses an allowed scheme, logging why if not.
+
+    Args:
+        url: URL to validate.
+
+    Returns:
+        True if the URL may be opened.
+    """
+    try:
+        scheme = urlparse(url).scheme
+    except Exception as e:
+        logger.warning("Invalid URL: %s - %s", url, e)
+        return False
+    if scheme not in _ALLOWED_URL_SCHEMES:
+        logger.warning("Blocked non-HTTP URL: %s (scheme: %s)", url, scheme)
+        return False
+    return True
+
+
 def open_url(url: str) -> bool:
     """Open a URL in the default browser.
 
@@ -119,17 +208,29 @@ def open_url(url: str) -> bool:
     Returns:
         True if successful, False if URL is invalid or failed.
     """
-    from urllib.parse import urlparse
+    if not _is_allowed_url(url):
+        return False
+    return _launch_url(url)
+
+
+def _launch_url(url: str) -> bool:
+    """Open an already validated URL in the default browser.
 
-    # Validate URL scheme to prevent file://, javascript://, etc.
+    The URL goes straight to ShellExecuteW; webbrowser (which probes for
+    browser backends first) is only used if the shell call fails.
+
+    Args:
+        url: URL to open.
+
+    Returns:
+        True if successful, False on error.
+    """
     try:
-        parsed = urlparse(url)
-        if parsed.scheme not in ("http", "https"):
-            logger.warning("Blocked non-HTTP URL: %s (scheme: %s)", url, parsed.scheme)
-            return False
+        if _shell_open(url):
+            logger.info("Opened URL: %s", url)
+            return True
     except Exception as e:
-        logger.warning("Invalid URL: %s - %s", url, e)
-        return False
+        logger.warning("ShellExecuteW unavailable for URL: %s", e)
 
     try:
         webbrowser.open(url)
@@ -143,6 +244,9 @@ def open_url(url: str) -> bool:
 def paste_to_clipboard(text: str) -> bool:
     """Copy text to clipboard and paste it.
 
+    ASCII text is stored as CF_TEXT (one byte per char); Windows
+    synthesizes CF_UNICODETEXT for readers that ask for it.
+
     Args:
         text: Text to paste.
     """
@@ -154,7 +258,8 @@ def paste_to_clipboard(text: str) -> bool:
         win32clipboard.OpenClipboard()
         try:
             win32clipboard.EmptyClipboard()
-            win32clipboard.SetClipboardText(text, win32con.CF_UNICODETEXT)
+            fmt = win32con.CF_TEXT if text.isascii() else win32con.CF_UNICODETEXT
+            win32clipboard.SetClipboardText(text, fmt)
         finally:
             win32clipboard.CloseClipboard()
 
@@ -174,6 +279,8 @@ class SystemAction(Action):
         force: For shutdown/restart, force close apps (default: False).
     """
 
+    handles_type = "note_on"
+
     COMMANDS = {
         "lock": lock_workstation,
         "screenshot": take_screenshot,
@@ -184,14 +291,26 @@ class SystemAction(Action):
         "hibernate": hibernate_computer,
     }
 
+    def __init__(self, config: dict):
+        """Initialize system action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._command = config.get("command", "").lower()
+        self._force = bool(config.get("force", False))
+
     def execute(self, event: "MidiEvent") -> None:
         """Execute system command on Note On."""
         if event.type != "note_on" or event.value == 0:
             return
 
-        command = self.config.get("command", "").lower()
-        force = self.config.get("force", False)
+        command = self._command
+        force = self._force
 
+        # Command functions are looked up here rather than bound in __init__,
+        # so patching them (e.g. in tests) always takes effect.
         # Handle shutdown/restart with force parameter
         if command == "shutdown":
             shutdown_computer(force=force)
@@ -237,19 +356,33 @@ class OpenURLAction(Action):
         "action": "open_url",
         "url": "https://github.com"
     }
+
+    The URL is validated once when the action is created.
     """
 
+    handles_type = "note_on"
+
+    def __init__(self, config: dict):
+        """Initialize open URL action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._url = config.get("url", "")
+        self._valid = bool(self._url) and _is_allowed_url(self._url)
+
     def execute(self, event: "MidiEvent") -> None:
         """Open URL on Note On."""
         if event.type != "note_on" or event.value == 0:
             return
 
-        url = self.config.get("url", "")
-        if not url:
+        if not self._url:
             logger.warning("OpenURLAction: No URL configured")
             return
 
-        open_url(url)
+        if self._valid:
+            _launch_url(self._url)
 
 
 class ClipboardPasteAction(Action):
@@ -268,12 +401,24 @@ class ClipboardPasteAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
+    def __init__(self, config: dict):
+        """Initialize clipboard paste action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._text = config.get("text", "")
+        self._paste = config.get("paste", False)
+
     def execute(self, event: "MidiEvent") -> None:
         """Copy text to clipboard on Note On."""
         if event.type != "note_on" or event.value == 0:
             return
 
-        text = self.config.get("text", "")
+        text = self._text
         if not text:
             logger.warning("ClipboardPasteAction: No text configured")
             return
@@ -281,12 +426,8 @@ class ClipboardPasteAction(Action):
         if not paste_to_clipboard(text):
             return
 
-        # Optionally paste with Ctrl+V
-        if self.config.get("paste", False):
-            import time
-
-            from k2deck.core import keyboard
-
-            time.sleep(0.05)  # Small delay for clipboard to be ready
+        # Optionally paste with Ctrl+V. CloseClipboard has already committed
+        # the data, so the keystroke can follow immediately.
+        if self._paste:
             keyboard.execute_hotkey(["ctrl", "v"], hold_ms=20)
             logger.info("Pasted text (%d chars)", len(text))
@@ -5,51 +5,50 @@ Completion callbacks can trigger any K2 Deck action (sound, TTS, etc.).
 """
 
 import logging
-import time
 from collections.abc import Callable
-from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
+from k2deck.core.action_factory import create_action
+from k2deck.core.midi_listener import NOTE_ON, MidiEvent
 from k2deck.core.timer_manager import get_timer_manager
 
-if TYPE_CHECKING:
-    from k2deck.core.midi_listener import MidiEvent
-
 logger = logging.getLogger(__name__)
 
+# Event passed to on_complete actions (no action reads the timestamp)
+_COMPLETION_EVENT = MidiEvent(
+    type=NOTE_ON, channel=0, note=0, cc=None, value=127, timestamp=0.0
+)
+
 
 def _build_completion_callback(
-    on_complete_config: dict | None,
+    on_complete_config: dict | None, depth: int = 0
 ) -> Callable[[], None] | None:
-    """Build a callback that creates and executes an action on timer completion.
+    """Build a callback that executes an action on timer completion.
+
+    The action is created once here, not each time the timer fires.
 
     Args:
-        on_complete_config: Action config dict (e.g., {"action": "sound_play", "file": "bell.wav"}).
+        on_complete_config: Action config dict
+            (e.g., {"action": "sound_play", "file": "bell.wav"}).
+        depth: Nesting depth of the timer action (see create_action).
 
     Returns:
-        Callback function, or None if no config provided.
+        Callback function, or None if no config provided or the action
+        could not be created.
     """
     if not on_complete_config or not isinstance(on_complete_config, dict):
         return None
 
+    action = create_action(on_complete_config, depth + 1)
+    if action is None:
+        logger.warning("Timer on_complete action could not be created")
+        return None
+
     def callback() -> None:
-        from k2deck.core.action_factory import create_action
-        from k2deck.core.midi_listener import MidiEvent
-
-        action = create_action(on_complete_config)
-        if action:
-            synthetic_event = MidiEvent(
-                type="note_on",
-                channel=0,
-                note=0,
-                cc=None,
-                value=127,
-                timestamp=time.time(),
-            )
-            try:
-                action.execute(synthetic_event)
-            except Exception as e:
-                logger.error("Timer on_complete action error: %s", e)
+        try:
+            action.execute(_COMPLETION_EVENT)
+        except Exception as e:
+            logger.error("Timer on_complete action error: %s", e)
 
     return callback
 
@@ -76,11 +75,16 @@ class TimerStartAction(Action):
     }
     """
 
+    handles_type = "note_on"
+    nests_actions = True
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._timer_name = config.get("name", "default")
         self._seconds = max(1, float(config.get("seconds", 60)))
-        self._on_complete_cb = _build_completion_callback(config.get("on_complete"))
+        self._on_complete_cb = _build_completion_callback(
+            config.get("on_complete"), config.get("_depth", 0)
+        )
 
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
@@ -110,6 +114,8 @@ class TimerStopAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._timer_name = config.get("name", "default")
@@ -145,11 +151,16 @@ class TimerToggleAction(Action):
     }
     """
 
+    handles_type = "note_on"
+    nests_actions = True
+
     def __init__(self, config: dict) -> None:
         super().__init__(config)
         self._timer_name = config.get("name", "default")
         self._seconds = max(1, float(config.get("seconds", 60)))
-        self._on_complete_cb = _build_completion_callback(config.get("on_complete"))
+        self._on_complete_cb = _build_completion_callback(
+            config.get("on_complete"), config.get("_depth", 0)
+        )
 
     def execute(self, event: "MidiEvent") -> None:
         if event.type != "note_on" or event.value == 0:
@@ -4,6 +4,8 @@ Useful for alerts, notifications, or accessibility.
 """
 
 import logging
+import queue
+import threading
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
@@ -22,6 +24,61 @@ except ImportError:
     pyttsx3 = None
     HAS_TTS = False
 
+# Speech runs on one worker thread: runAndWait blocks for the whole
+# utterance, and the SAPI engine must stay on the thread that created it
+_speech_queue: "queue.SimpleQueue[tuple[str, int, float]]" = queue.SimpleQueue()
+_speech_worker: threading.Thread | None = None
+_speech_lock = threading.Lock()
+
+
+def _submit_speech(text: str, rate: int, volume: float) -> None:
+    """Queue text for the speech worker, starting it if needed.
+
+    Args:
+        text: Text to speak.
+        rate: Speech rate in words per minute.
+        volume: Volume 0.0 to 1.0.
+    """
+    global _speech_worker
+    if _speech_worker is None:
+        with _speech_lock:
+            if _speech_worker is None:
+                worker = threading.Thread(
+                    target=_run_speech_worker, name="k2deck-tts", daemon=True
+                )
+                worker.start()
+                _speech_worker = worker
+    _speech_queue.put((text, rate, volume))
+
+
+def _run_speech_worker() -> None:
+    """Speak queued utterances one at a time, forever."""
+    while True:
+        _speak(*_speech_queue.get())
+
+
+def _speak(text: str, rate: int, volume: float) -> None:
+    """Speak text on the shared engine (blocks until finished).
+
+    Args:
+        text: Text to speak.
+        rate: Speech rate in words per minute.
+        volume: Volume 0.0 to 1.0.
+    """
+    engine = TTSAction._get_engine()
+    if engine is None:
+        logger.warning("TTSAction: TTS engine not available")
+        return
+
+    try:
+        engine.setProperty("rate", rate)
+        engine.setProperty("volume", volume)
+        engine.say(text)
+        engine.runAndWait()
+        logger.info("TTS: %s", text[:50])
+    except Exception as e:
+        logger.error("TTS failed: %s", e)
+
 
 class TTSAction(Action):
     """Speak text using text-to-speech.
@@ -38,8 +95,13 @@ class TTSAction(Action):
         "rate": 150,
         "volume": 0.8
     }
+
+    Speech is queued and spoken in order on a background thread, so the
+    action returns immediately.
     """
 
+    handles_type = "note_on"
+
     _engine = None
 
     def __init__(self, config: dict) -> None:
@@ -55,7 +117,10 @@ class TTSAction(Action):
 
     @classmethod
     def _get_engine(cls):
-        """Get or create TTS engine (lazy initialization)."""
+        """Get or create TTS engine (lazy initialization).
+
+        Only called from the speech worker thread.
+        """
         if cls._engine is None and HAS_TTS:
             try:
                 cls._engine = pyttsx3.init()
@@ -81,16 +146,4 @@ class TTSAction(Action):
             logger.warning("TTSAction: no text configured")
             return
 
-        engine = self._get_engine()
-        if engine is None:
-            logger.warning("TTSAction: TTS engine not available")
-            return
-
-        try:
-            engine.setProperty("rate", self._rate)
-            engine.setProperty("volume", self._volume)
-            engine.say(self._text)
-            engine.runAndWait()
-            logger.info("TTS: %s", self._text[:50])
-        except Exception as e:
-            logger.error("TTS failed: %s", e)
+        _submit_speech(self._text, self._rate, self._volume)
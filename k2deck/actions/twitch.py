@@ -7,6 +7,7 @@ import logging
 from typing import TYPE_CHECKING
 
 from k2deck.actions.base import Action
+from k2deck.core.twitch_client import TwitchClient, get_twitch_client
 
 if TYPE_CHECKING:
     from k2deck.core.midi_listener import MidiEvent
@@ -14,6 +15,24 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _ready_client() -> TwitchClient | None:
+    """Get the Twitch client if it is installed and connected.
+
+    Returns:
+        The shared Twitch client, or None if it can't take requests.
+    """
+    client = get_twitch_client()
+    if not client.is_available:
+        logger.debug("Twitch not available (twitchAPI not installed)")
+        return None
+
+    if not client.is_connected:
+        logger.debug("Twitch not connected")
+        return None
+
+    return client
+
+
 class TwitchMarkerAction(Action):
     """Create a Twitch stream marker.
 
@@ -27,6 +46,8 @@ class TwitchMarkerAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def __init__(self, config: dict) -> None:
         """Initialize marker action.
 
@@ -46,15 +67,8 @@ class TwitchMarkerAction(Action):
         if event.type != "note_on" or event.value == 0:
             return
 
-        from k2deck.core.twitch_client import get_twitch_client
-
-        client = get_twitch_client()
-        if not client.is_available:
-            logger.debug("Twitch not available (twitchAPI not installed)")
-            return
-
-        if not client.is_connected:
-            logger.debug("Twitch not connected")
+        client = _ready_client()
+        if client is None:
             return
 
         client.create_marker(self._description)
@@ -69,6 +83,8 @@ class TwitchClipAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def __init__(self, config: dict) -> None:
         """Initialize clip action.
 
@@ -87,15 +103,8 @@ class TwitchClipAction(Action):
         if event.type != "note_on" or event.value == 0:
             return
 
-        from k2deck.core.twitch_client import get_twitch_client
-
-        client = get_twitch_client()
-        if not client.is_available:
-            logger.debug("Twitch not available (twitchAPI not installed)")
-            return
-
-        if not client.is_connected:
-            logger.debug("Twitch not connected")
+        client = _ready_client()
+        if client is None:
             return
 
         clip_url = client.create_clip()
@@ -116,6 +125,8 @@ class TwitchChatAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def __init__(self, config: dict) -> None:
         """Initialize chat action.
 
@@ -139,15 +150,8 @@ class TwitchChatAction(Action):
             logger.warning("TwitchChatAction: no message configured")
             return
 
-        from k2deck.core.twitch_client import get_twitch_client
-
-        client = get_twitch_client()
-        if not client.is_available:
-            logger.debug("Twitch not available (twitchAPI not installed)")
-            return
-
-        if not client.is_connected:
-            logger.debug("Twitch not connected")
+        client = _ready_client()
+        if client is None:
             return
 
         client.send_chat(self._message)
@@ -166,6 +170,8 @@ class TwitchTitleAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def __init__(self, config: dict) -> None:
         """Initialize title action.
 
@@ -189,15 +195,8 @@ class TwitchTitleAction(Action):
             logger.warning("TwitchTitleAction: no title configured")
             return
 
-        from k2deck.core.twitch_client import get_twitch_client
-
-        client = get_twitch_client()
-        if not client.is_available:
-            logger.debug("Twitch not available (twitchAPI not installed)")
-            return
-
-        if not client.is_connected:
-            logger.debug("Twitch not connected")
+        client = _ready_client()
+        if client is None:
             return
 
         client.update_title(self._title)
@@ -216,6 +215,8 @@ class TwitchGameAction(Action):
     }
     """
 
+    handles_type = "note_on"
+
     def __init__(self, config: dict) -> None:
         """Initialize game action.
 
@@ -239,15 +240,8 @@ class TwitchGameAction(Action):
             logger.warning("TwitchGameAction: no game configured")
             return
 
-        from k2deck.core.twitch_client import get_twitch_client
-
-        client = get_twitch_client()
-        if not client.is_available:
-            logger.debug("Twitch not available (twitchAPI not installed)")
-            return
-
-        if not client.is_connected:
-            logger.debug("Twitch not connected")
+        client = _ready_client()
+        if client is None:
             return
 
         client.update_game(self._game)
@@ -3,6 +3,7 @@
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import POINTER, cast
 from typing import TYPE_CHECKING
 
@@ -22,8 +23,37 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _init_com_thread() -> None:
+    """Enter a COM apartment once for the lifetime of the COM worker."""
+    pythoncom.CoInitialize()
+
+
+# All pycaw calls run on this single thread, so COM is initialized once and
+# the cached session/endpoint objects never cross apartments
+_com_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="k2deck-com", initializer=_init_com_thread
+)
+
+
+def _activate_endpoint_volume():
+    """Activate the default output device's IAudioEndpointVolume."""
+    devices = AudioUtilities.GetSpeakers()
+    interface = devices.Activate(
+        IAudioEndpointVolume._iid_,
+        CLSCTX_ALL,
+        None,
+    )
+    return cast(interface, POINTER(IAudioEndpointVolume))
+
+
 class SessionCache:
-    """Cache for audio sessions to avoid frequent enumeration."""
+    """Cache for audio sessions to avoid frequent enumeration.
+
+    Also holds the default output device's endpoint volume interface, so
+    master volume changes skip device activation. The COM objects are only
+    touched from the COM worker thread; invalidate() may be called from any
+    thread and just marks them stale.
+    """
 
     def __init__(self, refresh_interval: float = 5.0):
         """Initialize session cache.
@@ -31,59 +61,112 @@ class SessionCache:
         Args:
             refresh_interval: Seconds between cache refreshes.
         """
-        self._cache: dict[str, list] = {}
+        # {process_name_lower: [(session, ISimpleAudioVolume), ...]}
+        self._cache: dict[str, list[tuple]] = {}
         self._last_refresh = 0.0
         self._refresh_interval = refresh_interval
+        self._endpoint = None
+        self._endpoint_refresh = 0.0
         self._lock = threading.Lock()
 
-    def get_sessions(self, process_name: str) -> list:
+    def get_sessions(self, process_name_lower: str) -> list[tuple]:
         """Get audio sessions for a process.
 
         Args:
-            process_name: Name of process (e.g., "Spotify.exe").
+            process_name_lower: Lowercased name of process (e.g.,
+                "spotify.exe"); callers lowercase it once up front.
 
         Returns:
-            List of matching audio sessions.
+            List of (session, ISimpleAudioVolume) pairs for the process.
+            The volume interface is queried once per refresh, not per call.
         """
         with self._lock:
             now = time.monotonic()
             if now - self._last_refresh > self._refresh_interval:
                 self._refresh_cache()
 
-            return self._cache.get(process_name.lower(), [])
+            return self._cache.get(process_name_lower, [])
+
+    def get_endpoint_volume(self):
+        """Get the default output device's endpoint volume interface.
+
+        Returns:
+            IAudioEndpointVolume pointer, re-activated after the refresh
+            interval or an invalidation.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._endpoint is None
+                or now - self._endpoint_refresh > self._refresh_interval
+            ):
+                self._endpoint = _activate_endpoint_volume()
+                self._endpoint_refresh = now
+            return self._endpoint
 
     def _refresh_cache(self) -> None:
         """Refresh the session cache."""
         self._cache.clear()
         try:
-            pythoncom.CoInitialize()
-            try:
-                sessions = AudioUtilities.GetAllSessions()
-                for session in sessions:
-                    if session.Process:
-                        name = session.Process.name().lower()
-                        if name not in self._cache:
-                            self._cache[name] = []
-                        self._cache[name].append(session)
-                self._last_refresh = time.monotonic()
-                logger.debug(
-                    "Refreshed audio session cache: %d processes", len(self._cache)
-                )
-            finally:
-                pythoncom.CoUninitialize()
+            sessions = AudioUtilities.GetAllSessions()
+            for session in sessions:
+                if session.Process:
+                    name = session.Process.name().lower()
+                    try:
+                        volume = session._ctl.QueryInterface(ISimpleAudioVolume)
+                    except Exception as e:
+                        logger.debug("Skipping session for %s: %s", name, e)
+                        continue
+                    if name not in self._cache:
+                        self._cache[name] = []
+                    self._cache[name].append((session, volume))
+            self._last_refresh = time.monotonic()
+            logger.debug(
+                "Refreshed audio session cache: %d processes", len(self._cache)
+            )
         except Exception as e:
             logger.error("Failed to refresh session cache: %s", e)
 
     def invalidate(self) -> None:
-        """Force cache refresh on next access."""
+        """Force cache refresh on next access.
+
+        Only resets the timestamps: the cached COM objects are replaced (and
+        so released) by the COM worker on its next refresh, never by the
+        calling thread.
+        """
         with self._lock:
             self._last_refresh = 0.0
+            self._endpoint_refresh = 0.0
 
 
 # Global session cache
 _session_cache = SessionCache()
 
 
+def _set_process_volume(process_name: str, volume: float) -> bool:
+    """Set a process's session volume. Runs on the COM worker thread.
+
+    process_name must already be lowercase.
+    """
+    sessions = _session_cache.get_sessions(process_name)
+
+    if not sessions:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("No audio session for: %s", process_name)
+        return False
+
+    success = False
+    for _, volume_interface in sessions:
+        try:
+            volume_interface.SetMasterVolume(volume, None)
+            success = True
+        except Exception as e:
+            # Session may have ended; re-enumerate on the next call
+            _session_cache.invalidate()
+            logger.error("Failed to set volume for %s: %s", process_name, e)
+    return success
+
+
 def set_process_volume(process_name: str, volume: float) -> bool:
     """Set volume for a specific process.
 
@@ -94,29 +177,23 @@ def set_process_volume(process_name: str, volume: float) -> bool:
     Returns:
         True if volume was set, False otherwise.
     """
-    sessions = _session_cache.get_sessions(process_name)
-
-    if not sessions:
-        logger.debug("No audio session for: %s", process_name)
-        return False
-
-    success = False
     try:
-        pythoncom.CoInitialize()
-        try:
-            for session in sessions:
-                try:
-                    volume_interface = session._ctl.QueryInterface(ISimpleAudioVolume)
-                    volume_interface.SetMasterVolume(volume, None)
-                    success = True
-                except Exception as e:
-                    logger.error("Failed to set volume for %s: %s", process_name, e)
-        finally:
-            pythoncom.CoUninitialize()
+        return _com_executor.submit(
+            _set_process_volume, process_name.lower(), volume
+        ).result()
     except Exception as e:
         logger.error("COM error for %s: %s", process_name, e)
+        return False
 
-    return success
+
+def _set_master_volume(volume: float) -> None:
+    """Set the endpoint volume. Runs on the COM worker thread."""
+    try:
+        _session_cache.get_endpoint_volume().SetMasterVolumeLevelScalar(volume, None)
+    except Exception:
+        # Device may have gone away; re-activate on the next call
+        _session_cache.invalidate()
+        raise
 
 
 def set_master_volume(volume: float) -> bool:
@@ -129,24 +206,18 @@ def set_master_volume(volume: float) -> bool:
         True if volume was set, False otherwise.
     """
     try:
-        pythoncom.CoInitialize()
-        try:
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(
-                IAudioEndpointVolume._iid_,
-                CLSCTX_ALL,
-                None,
-            )
-            volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
-            volume_interface.SetMasterVolumeLevelScalar(volume, None)
-            return True
-        finally:
-            pythoncom.CoUninitialize()
+        _com_executor.submit(_set_master_volume, volume).result()
+        return True
     except Exception as e:
         logger.error("Failed to set master volume: %s", e)
         return False
 
 
+def _get_master_volume() -> float:
+    """Read the endpoint volume. Runs on the COM worker thread."""
+    return _session_cache.get_endpoint_volume().GetMasterVolumeLevelScalar()
+
+
 def get_master_volume() -> float | None:
     """Get current system master volume.
 
@@ -154,47 +225,99 @@ def get_master_volume() -> float | None:
         Volume level 0.0 to 1.0, or None on error.
     """
     try:
-        pythoncom.CoInitialize()
-        try:
-            devices = AudioUtilities.GetSpeakers()
-            interface = devices.Activate(
-                IAudioEndpointVolume._iid_,
-                CLSCTX_ALL,
-                None,
-            )
-            volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
-            return volume_interface.GetMasterVolumeLevelScalar()
-        finally:
-            pythoncom.CoUninitialize()
+        return _com_executor.submit(_get_master_volume).result()
     except Exception as e:
         logger.error("Failed to get master volume: %s", e)
         return None
 
 
+# Minimum time between fader volume writes (caps COM traffic at 50 Hz)
+VOLUME_APPLY_INTERVAL = 0.02
+
+# CC value (0-127) -> volume scalar (0.0-1.0)
+_CC_TO_VOLUME = tuple(value / 127.0 for value in range(128))
+
+# Newest requested fader volume per target, applied by the COM worker
+_pending_volumes: dict[str, float] = {}
+_pending_lock = threading.Lock()
+_drain_scheduled = False
+_last_apply = 0.0
+
+
+def _queue_volume(target: str, volume: float) -> None:
+    """Record a target volume, scheduling a COM-thread drain if none is due.
+
+    Values queued before the drain runs overwrite each other, so a fader
+    sweep costs one COM write per target per drain.
+    """
+    global _drain_scheduled
+    with _pending_lock:
+        _pending_volumes[target] = volume
+        if _drain_scheduled:
+            return
+        _drain_scheduled = True
+    _com_executor.submit(_drain_volumes)
+
+
+def _drain_volumes() -> None:
+    """Apply the newest pending volumes. Runs on the COM worker thread."""
+    global _drain_scheduled, _last_apply
+    wait = _last_apply + VOLUME_APPLY_INTERVAL - time.monotonic()
+    if wait > 0:
+        time.sleep(wait)
+
+    with _pending_lock:
+        pending = dict(_pending_volumes)
+        _pending_volumes.clear()
+        _drain_scheduled = False
+
+    for target, volume in pending.items():
+        _apply_volume(target, volume)
+    _last_apply = time.monotonic()
+
+
+def _apply_volume(target: str, volume: float) -> None:
+    """Set master or process volume. Runs on the COM worker thread."""
+    try:
+        if target == "__master__":
+            _set_master_volume(volume)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Master volume: %.0f%%", volume * 100)
+        elif _set_process_volume(target, volume):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s volume: %.0f%%", target, volume * 100)
+    except Exception as e:
+        logger.error("VolumeAction error: %s", e)
+
+
 class VolumeAction(Action):
     """Action for controlling per-app or master volume.
 
+    Fader values are handed to the COM worker and coalesced, so only the
+    newest value per target is written when a fader moves quickly.
+
     Config options:
         target_process: Process name (e.g., "Spotify.exe") or "__master__".
+            Matched case-insensitively; lowercased once at init.
     """
 
+    __slots__ = ("_target",)
+
+    def __init__(self, config: dict):
+        """Initialize volume action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._target = config.get("target_process", "__master__").lower()
+
     def execute(self, event: "MidiEvent") -> None:
         """Set volume based on CC value (0-127 -> 0.0-1.0)."""
         if event.type != "cc":
             return
 
-        target = self.config.get("target_process", "__master__")
-        volume = event.value / 127.0
-
-        try:
-            if target == "__master__":
-                set_master_volume(volume)
-                logger.debug("Master volume: %.0f%%", volume * 100)
-            else:
-                if set_process_volume(target, volume):
-                    logger.debug("%s volume: %.0f%%", target, volume * 100)
-        except Exception as e:
-            logger.error("VolumeAction error: %s", e)
+        _queue_volume(self._target, _CC_TO_VOLUME[event.value])
 
 
 def invalidate_session_cache() -> None:
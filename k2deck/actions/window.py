@@ -1,23 +1,59 @@
 """Window actions - Focus and launch apps using pywin32."""
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
+import psutil
 import win32con
 import win32gui
 import win32process
 
 from k2deck.actions.base import Action
+from k2deck.core.context import get_foreground_app, invalidate_foreground_cache
 
 if TYPE_CHECKING:
     from k2deck.core.midi_listener import MidiEvent
 
 logger = logging.getLogger(__name__)
 
+FOREGROUND_POLL_INTERVAL = 0.005  # seconds between foreground checks
+
+
+# Last window found per process: {process_name_lower: (hwnd, pid)}
+_hwnd_cache: dict[str, tuple[int, int]] = {}
+
+
+def _cached_window(process_name_lower: str) -> int | None:
+    """Return the cached window for a process if it is still valid.
+
+    The cached hwnd is trusted while it still exists, is visible and is
+    owned by the same pid it was found under (handles can be reused).
+    """
+    cached = _hwnd_cache.get(process_name_lower)
+    if cached is None:
+        return None
+
+    hwnd, pid = cached
+    try:
+        if (
+            win32gui.IsWindow(hwnd)
+            and win32gui.IsWindowVisible(hwnd)
+            and win32process.GetWindowThreadProcessId(hwnd)[1] == pid
+        ):
+            return hwnd
+    except Exception:
+        pass
+    _hwnd_cache.pop(process_name_lower, None)  # another thread may have dropped it
+    return None
+
 
 def find_window_by_process(process_name: str) -> int | None:
     """Find a window handle by process name.
 
+    Reuses the window found by the previous call while it is still valid,
+    and only enumerates top-level windows on a miss.
+
     Args:
         process_name: Process name (e.g., "Spotify.exe", "Discord.exe")
 
@@ -25,23 +61,31 @@ def find_window_by_process(process_name: str) -> int | None:
         Window handle (hwnd) or None if not found.
     """
     process_name_lower = process_name.lower()
+    hwnd = _cached_window(process_name_lower)
+    if hwnd is not None:
+        return hwnd
+
     result = None
+    result_pid = 0
+    # Process names seen during this scan; most pids own several windows
+    names: dict[int, str] = {}
 
     def enum_callback(hwnd: int, _) -> bool:
-        nonlocal result
+        nonlocal result, result_pid
         if not win32gui.IsWindowVisible(hwnd):
             return True
 
         try:
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            import psutil
-
-            proc = psutil.Process(pid)
-            if proc.name().lower() == process_name_lower:
+            name = names.get(pid)
+            if name is None:
+                name = names[pid] = psutil.Process(pid).name().lower()
+            if name == process_name_lower:
                 # Prefer windows with titles (main windows)
                 title = win32gui.GetWindowText(hwnd)
                 if title:
                     result = hwnd
+                    result_pid = pid
                     return False  # Stop enumeration
         except Exception:
             pass
@@ -52,6 +96,8 @@ def find_window_by_process(process_name: str) -> int | None:
     except Exception as e:
         logger.debug("EnumWindows stopped: %s", e)
 
+    if result is not None:
+        _hwnd_cache[process_name_lower] = (result, result_pid)
     return result
 
 
@@ -77,18 +123,73 @@ def focus_window(hwnd: int) -> bool:
         return False
 
 
-def focus_app(process_name: str) -> bool:
+def wait_for_foreground(hwnd: int, timeout: float) -> bool:
+    """Wait until a window becomes the foreground window.
+
+    Polls GetForegroundWindow instead of sleeping for the full timeout, so
+    the caller resumes as soon as the focus change lands.
+
+    Args:
+        hwnd: Window handle.
+        timeout: Maximum seconds to wait.
+
+    Returns:
+        True if the window reached the foreground within the timeout.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if win32gui.GetForegroundWindow() == hwnd:
+                return True
+        except Exception as e:
+            logger.debug("GetForegroundWindow failed: %s", e)
+            return False
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(FOREGROUND_POLL_INTERVAL)
+
+
+def is_foreground(process_name: str) -> bool:
+    """Check if a process owns the foreground window.
+
+    Uses the context cache (refreshed every 100ms), so it is cheap enough
+    to call on every encoder tick.
+
+    Args:
+        process_name: Process name (e.g., "Spotify.exe")
+
+    Returns:
+        True if the foreground window belongs to the process.
+    """
+    app = get_foreground_app()
+    return app is not None and app.name.lower() == process_name.lower()
+
+
+def focus_app(process_name: str, settle_timeout: float = 0.0) -> bool:
     """Focus an application by process name.
 
+    Returns immediately if the app is already in the foreground, skipping
+    the window enumeration.
+
     Args:
         process_name: Process name (e.g., "Spotify.exe")
+        settle_timeout: If > 0, wait up to this many seconds for the window
+            to actually reach the foreground after focusing it.
 
     Returns:
         True if app was focused successfully.
     """
+    if is_foreground(process_name):
+        return True
+
     hwnd = find_window_by_process(process_name)
     if hwnd:
-        return focus_window(hwnd)
+        if not focus_window(hwnd):
+            return False
+        if settle_timeout > 0:
+            wait_for_foreground(hwnd, settle_timeout)
+        invalidate_foreground_cache()
+        return True
     else:
         logger.warning("Could not find window for: %s", process_name)
         return False
@@ -105,17 +206,29 @@ class FocusAction(Action):
     }
     """
 
+    __slots__ = ("_target", "_label")
+
+    def __init__(self, config: dict):
+        """Initialize focus action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._target = config.get("target_app")
+        self._label = config.get("name", self._target)
+
     def execute(self, event: "MidiEvent") -> None:
         """Focus the target application."""
         if event.type == "note_on" and event.value == 0:
             return  # Ignore note off
 
-        target = self.config.get("target_app")
+        target = self._target
         if not target:
             logger.warning("FocusAction missing target_app")
             return
 
-        name = self.config.get("name", target)
+        name = self._label
         if focus_app(target):
             logger.info("Focused: %s", name)
         else:
@@ -134,12 +247,24 @@ class LaunchAction(Action):
     }
     """
 
+    __slots__ = ("_target", "_launch_path")
+
+    def __init__(self, config: dict):
+        """Initialize launch action.
+
+        Args:
+            config: Action configuration.
+        """
+        super().__init__(config)
+        self._target = config.get("target_app")
+        self._launch_path = config.get("launch_path")
+
     def execute(self, event: "MidiEvent") -> None:
         """Launch or focus the target application."""
         if event.type == "note_on" and event.value == 0:
             return
 
-        target = self.config.get("target_app")
+        target = self._target
         if not target:
             logger.warning("LaunchAction missing target_app")
             return
@@ -150,7 +275,7 @@ class LaunchAction(Action):
             return
 
         # If not running, try to launch
-        launch_path = self.config.get("launch_path")
+        launch_path = self._launch_path
         if launch_path:
             import os
             import subprocess
@@ -15,6 +15,10 @@ logger = logging.getLogger(__name__)
 # Maximum recursion depth for nested actions (e.g., conditional inside conditional)
 MAX_ACTION_DEPTH = 3
 
+# mapping_engine.ACTION_TYPES, bound on first use (importing it at module
+# load would be circular)
+_action_types: "dict[str, type[Action]] | None" = None
+
 
 class ActionCreationError(Exception):
     """Raised when action creation fails."""
@@ -50,21 +54,32 @@ def create_action(config: dict, depth: int = 0) -> "Action | None":
         logger.warning("Action config missing 'action' key")
         return None
 
-    # Lazy import to avoid circular dependency
-    from k2deck.core.mapping_engine import ACTION_TYPES
+    if not isinstance(action_type, str):
+        # Unhashable values (lists, dicts) would raise on the table lookup
+        logger.warning(
+            "Action type must be a string, got: %s", type(action_type).__name__
+        )
+        return None
+
+    global _action_types
+    if _action_types is None:
+        # Lazy import to avoid circular dependency
+        from k2deck.core.mapping_engine import ACTION_TYPES
+
+        _action_types = ACTION_TYPES
 
-    if action_type not in ACTION_TYPES:
+    action_class = _action_types.get(action_type)
+    if action_class is None:
         logger.warning("Unknown action type: %s", action_type)
         return None
 
-    action_class = ACTION_TYPES[action_type]
-
-    # Inject depth for actions that support it (like ConditionalAction)
-    config_with_depth = config.copy()
-    config_with_depth["_depth"] = depth
+    # Inject depth only for actions that create nested actions (like
+    # ConditionalAction); the rest get the caller's dict as-is
+    if action_class.nests_actions:
+        config = {**config, "_depth": depth}
 
     try:
-        return action_class(config_with_depth)
+        return action_class(config)
     except Exception as e:
         logger.error("Failed to create action '%s': %s", action_type, e)
         return None
@@ -80,9 +95,4 @@ def create_actions(configs: list[dict], depth: int = 0) -> list["Action"]:
     Returns:
         List of successfully created Action instances.
     """
-    actions = []
-    for config in configs:
-        action = create_action(config, depth)
-        if action:
-            actions.append(action)
-    return actions
+    return [action for config in configs if (action := create_action(config, depth))]
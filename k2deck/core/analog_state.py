@@ -9,8 +9,10 @@ This module persists the last known positions and uses Jump mode for sync:
 
 import json
 import logging
+import os
 import threading
 import time
+from array import array
 from collections.abc import Callable
 from pathlib import Path
 
@@ -22,6 +24,14 @@ DEFAULT_STATE_FILE = Path.home() / ".k2deck" / "analog_state.json"
 # Debounce save operations (don't save on every CC message)
 SAVE_DEBOUNCE_SECONDS = 1.0
 
+# Marks a CC with no known position in the positions array
+UNSET = -1
+
+
+def _empty_positions() -> array:
+    """Create a positions array with every CC (0-127) unset."""
+    return array("b", [UNSET] * 128)
+
 
 class AnalogStateManager:
     """Singleton manager for analog control positions.
@@ -50,13 +60,19 @@ class AnalogStateManager:
         if self._initialized:
             return
 
-        self._positions: dict[int, int] = {}  # cc -> value (0-127)
-        self._callbacks: list[Callable[[int, int], None]] = []
+        # Indexed by CC number; value 0-127 or UNSET
+        self._positions = _empty_positions()
+        # Replaced, never mutated, so update() iterates without a copy or lock
+        self._callbacks: tuple[Callable[[int, int], None], ...] = ()
         self._state_file = DEFAULT_STATE_FILE
         self._save_lock = threading.RLock()  # Reentrant lock to allow nested calls
         self._last_save_time = 0.0
         self._pending_save = False
-        self._save_timer: threading.Timer | None = None
+        self._dirty = False  # Positions changed since the last write
+        self._dir_ensured = False  # State directory created/verified
+        # Delayed saves run on one lazily started worker, woken per burst
+        self._save_event = threading.Event()
+        self._save_thread: threading.Thread | None = None
         self._initialized = True
 
         # Load saved state
@@ -70,6 +86,7 @@ class AnalogStateManager:
         """
         if state_file:
             self._state_file = Path(state_file)
+            self._dir_ensured = False
             self._load()
 
     def _load(self) -> None:
@@ -78,48 +95,79 @@ class AnalogStateManager:
             if self._state_file.exists():
                 with open(self._state_file, encoding="utf-8") as f:
                     data = json.load(f)
-                    # Convert string keys to int (JSON only supports string keys)
-                    self._positions = {int(k): v for k, v in data.items()}
+                positions = _empty_positions()
+                # Convert string keys to int (JSON only supports string keys)
+                for k, v in data.items():
+                    cc = int(k)
+                    if 0 <= cc <= 127 and 0 <= v <= 127:
+                        positions[cc] = v
+                self._positions = positions
                 logger.info(
                     "Loaded %d analog positions from %s",
-                    len(self._positions),
+                    len(data),
                     self._state_file,
                 )
-        except (json.JSONDecodeError, OSError) as e:
+        except (json.JSONDecodeError, OSError, TypeError, ValueError) as e:
             logger.warning("Failed to load analog state: %s", e)
-            self._positions = {}
+            self._positions = _empty_positions()
 
     def _save(self) -> None:
         """Save positions to disk (debounced)."""
         with self._save_lock:
             now = time.time()
 
-            # If we recently saved, schedule a delayed save
+            # If we recently saved, have the worker save once the window ends
             if now - self._last_save_time < SAVE_DEBOUNCE_SECONDS:
                 if not self._pending_save:
                     self._pending_save = True
-                    delay = SAVE_DEBOUNCE_SECONDS - (now - self._last_save_time)
-                    self._save_timer = threading.Timer(delay, self._do_save)
-                    self._save_timer.daemon = True
-                    self._save_timer.start()
+                    if self._save_thread is None:
+                        self._save_thread = threading.Thread(
+                            target=self._save_loop,
+                            name="k2deck-analog-save",
+                            daemon=True,
+                        )
+                        self._save_thread.start()
+                    self._save_event.set()
                 return
 
             self._do_save()
 
+    def _save_loop(self) -> None:
+        """Worker: write the pending save once the debounce window ends."""
+        while True:
+            self._save_event.wait()
+            self._save_event.clear()
+            delay = SAVE_DEBOUNCE_SECONDS - (time.time() - self._last_save_time)
+            if delay > 0:
+                time.sleep(delay)
+            with self._save_lock:
+                # reset() cancels a pending save by clearing the flag
+                if self._pending_save:
+                    self._do_save()
+
     def _do_save(self) -> None:
-        """Actually write to disk."""
+        """Write to disk atomically (temp file + rename), if anything changed."""
         with self._save_lock:
             self._pending_save = False
+            if not self._dirty:
+                return
+            self._dirty = False
             self._last_save_time = time.time()
+            data = json.dumps(self.get_all(), indent=2).encode()
 
             try:
-                # Ensure directory exists
-                self._state_file.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(self._state_file, "w", encoding="utf-8") as f:
-                    json.dump(self._positions, f, indent=2)
+                # Ensure directory exists (once; a failed write re-checks)
+                if not self._dir_ensured:
+                    self._state_file.parent.mkdir(parents=True, exist_ok=True)
+                    self._dir_ensured = True
+
+                path = self._state_file
+                tmp_path = path.with_suffix(path.suffix + ".tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
                 logger.debug("Saved analog state to %s", self._state_file)
             except OSError as e:
+                self._dir_ensured = False
                 logger.error("Failed to save analog state: %s", e)
 
     def update(self, cc: int, value: int) -> None:
@@ -131,28 +179,36 @@ class AnalogStateManager:
             cc: CC number of the control.
             value: New value (0-127).
         """
-        if not 0 <= value <= 127:
+        if not 0 <= value <= 127 or not 0 <= cc <= 127:
             logger.warning("Invalid analog value %d for CC %d", value, cc)
             return
 
-        old_value = self._positions.get(cc)
+        old_value = self._positions[cc]
 
         # Only update if changed
         if old_value == value:
             return
 
         self._positions[cc] = value
-        logger.debug("Analog CC %d: %d -> %d", cc, old_value or 0, value)
-
-        # Notify callbacks (for WebSocket broadcast)
-        for callback in self._callbacks:
-            try:
-                callback(cc, value)
-            except Exception as e:
-                logger.error("Analog callback error: %s", e)
-
-        # Schedule save
-        self._save()
+        self._dirty = True
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Analog CC %d: %d -> %d", cc, max(old_value, 0), value)
+
+        # Notify callbacks (for WebSocket broadcast); usually there are none
+        callbacks = self._callbacks
+        if callbacks:
+            for callback in callbacks:
+                try:
+                    callback(cc, value)
+                except Exception as e:
+                    logger.error("Analog callback error: %s", e)
+
+        # Schedule save, unless a delayed save is already queued: it writes
+        # whatever is dirty when it fires. _dirty is set above, before the
+        # flag is read, so a save finishing concurrently cannot miss this
+        # change.
+        if not self._pending_save:
+            self._save()
 
     def get(self, cc: int) -> int:
         """Get position of a specific control.
@@ -163,7 +219,8 @@ class AnalogStateManager:
         Returns:
             Current value (0-127), or 0 if unknown.
         """
-        return self._positions.get(cc, 0)
+        value = self._positions[cc] if 0 <= cc <= 127 else UNSET
+        return value if value >= 0 else 0
 
     def get_all(self) -> dict[int, int]:
         """Get all analog positions.
@@ -171,7 +228,7 @@ class AnalogStateManager:
         Returns:
             Dict of cc -> value for all known controls.
         """
-        return self._positions.copy()
+        return {cc: v for cc, v in enumerate(self._positions) if v >= 0}
 
     def register_callback(self, callback: Callable[[int, int], None]) -> None:
         """Register callback for position changes.
@@ -182,7 +239,7 @@ class AnalogStateManager:
             callback: Function to call on position change.
         """
         if callback not in self._callbacks:
-            self._callbacks.append(callback)
+            self._callbacks = (*self._callbacks, callback)
 
     def unregister_callback(self, callback: Callable[[int, int], None]) -> None:
         """Unregister a callback.
@@ -191,18 +248,16 @@ class AnalogStateManager:
             callback: Function to remove.
         """
         if callback in self._callbacks:
-            self._callbacks.remove(callback)
+            self._callbacks = tuple(cb for cb in self._callbacks if cb != callback)
 
     def reset(self) -> None:
         """Reset all positions to 0."""
-        # Cancel any pending save timer
+        # Cancel any pending delayed save
         with self._save_lock:
-            if self._save_timer is not None:
-                self._save_timer.cancel()
-                self._save_timer = None
-                self._pending_save = False
+            self._pending_save = False
 
-        self._positions.clear()
+        self._positions = _empty_positions()
+        self._dirty = True
         self._save()
         logger.info("Analog state reset")
 
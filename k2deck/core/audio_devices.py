@@ -9,6 +9,8 @@ References:
 """
 
 import logging
+import threading
+import time
 from ctypes import HRESULT, c_int
 from typing import NamedTuple
 
@@ -18,6 +20,27 @@ from pycaw.pycaw import AudioUtilities, IMMDeviceEnumerator
 
 logger = logging.getLogger(__name__)
 
+# Enumerating endpoints is slow (hundreds of ms with many devices), so results
+# are cached per device type and refreshed on device-change notifications.
+DEVICE_CACHE_TTL = 5.0  # seconds
+
+_device_cache: dict[str, tuple[float, list["AudioDevice"]]] = {}
+_cache_lock = threading.Lock()
+_dirty = False
+_notification_client = None  # Keep a reference so COM doesn't release it
+
+# One IMMDeviceEnumerator reused by every enumeration (and owning the
+# notification registration), so CoCreateInstance runs once, not per call
+_device_enumerator = None
+_enumerator_lock = threading.Lock()
+
+# IPolicyConfig instance reused across default-device switches
+_policy_config = None
+_policy_config_lock = threading.Lock()
+
+# Per-thread record of COM initialization (actions run on pool threads)
+_com_thread_state = threading.local()
+
 
 # ERole enumeration - audio endpoint roles
 class ERole:
@@ -76,25 +99,159 @@ class IPolicyConfig(IUnknown):
 # CPolicyConfigClient class ID
 CLSID_CPolicyConfigClient = GUID("{870af99c-171d-4f9e-af0d-e63df40c2bc9}")
 
+# MMDeviceEnumerator class ID
+CLSID_MMDeviceEnumerator = GUID("{BCDE0395-E52F-467C-8E3D-C4579291692E}")
+
+
+def _mark_dirty() -> None:
+    """Flag the device cache as stale (called from COM notification thread)."""
+    global _dirty
+    _dirty = True
+
+
+def _register_device_notifications(device_enumerator) -> None:
+    """Register an IMMNotificationClient that invalidates the device cache.
+
+    Best effort: if pycaw lacks callback support, the TTL still applies.
+    """
+    global _notification_client
+    if _notification_client is not None:
+        return
+
+    try:
+        from pycaw.callbacks import MMNotificationClient
+
+        class _CacheInvalidator(MMNotificationClient):
+            def on_device_state_changed(self, *args):
+                _mark_dirty()
+
+            def on_default_device_changed(self, *args):
+                _mark_dirty()
+
+            def on_device_added(self, *args):
+                _mark_dirty()
+
+            def on_device_removed(self, *args):
+                _mark_dirty()
+
+        client = _CacheInvalidator()
+        device_enumerator.RegisterEndpointNotificationCallback(client)
+        _notification_client = client
+        logger.debug("Registered audio device change notifications")
+    except Exception as e:
+        logger.debug("Audio device notifications unavailable: %s", e)
+
+
+def _ensure_com_initialized() -> None:
+    """Enter a COM apartment once per calling thread."""
+    if getattr(_com_thread_state, "initialized", False):
+        return
+    try:
+        comtypes.CoInitialize()
+    except OSError as e:
+        # Already initialized with another concurrency model; usable as is
+        logger.debug("CoInitialize: %s", e)
+    _com_thread_state.initialized = True
+
+
+def _get_policy_config():
+    """Return the shared IPolicyConfig instance, creating it on first use."""
+    global _policy_config
+    with _policy_config_lock:
+        if _policy_config is None:
+            _policy_config = comtypes.CoCreateInstance(
+                CLSID_CPolicyConfigClient, IPolicyConfig, comtypes.CLSCTX_ALL
+            )
+        return _policy_config
+
+
+def _invalidate_policy_config() -> None:
+    """Drop the shared IPolicyConfig after a COM failure."""
+    global _policy_config
+    with _policy_config_lock:
+        _policy_config = None
+
+
+def _get_device_enumerator():
+    """Return the shared IMMDeviceEnumerator, creating it on first use."""
+    global _device_enumerator
+    with _enumerator_lock:
+        if _device_enumerator is None:
+            _device_enumerator = comtypes.CoCreateInstance(
+                CLSID_MMDeviceEnumerator,
+                IMMDeviceEnumerator,
+                comtypes.CLSCTX_INPROC_SERVER,
+            )
+            _register_device_notifications(_device_enumerator)
+        return _device_enumerator
+
+
+def _reset_device_enumerator() -> None:
+    """Drop the shared enumerator after a COM failure; recreated on next use."""
+    global _device_enumerator, _notification_client
+    with _enumerator_lock:
+        if _device_enumerator is not None and _notification_client is not None:
+            try:
+                _device_enumerator.UnregisterEndpointNotificationCallback(
+                    _notification_client
+                )
+            except Exception:
+                pass
+        _device_enumerator = None
+        _notification_client = None
+
+
+def invalidate_device_cache() -> None:
+    """Drop cached device lists so the next call re-enumerates."""
+    global _dirty
+    with _cache_lock:
+        _device_cache.clear()
+        _dirty = False
+
 
 def get_audio_devices(device_type: str = "output") -> list[AudioDevice]:
-    """Get list of audio devices.
+    """Get list of audio devices (cached for DEVICE_CACHE_TTL seconds).
 
     Args:
         device_type: "output" for speakers/headphones, "input" for microphones.
 
+    Returns:
+        List of AudioDevice objects.
+    """
+    global _dirty
+    now = time.monotonic()
+
+    with _cache_lock:
+        if _dirty:
+            _device_cache.clear()
+            _dirty = False
+        cached = _device_cache.get(device_type)
+        if cached and now - cached[0] < DEVICE_CACHE_TTL:
+            return list(cached[1])
+
+    devices = _enumerate_audio_devices(device_type)
+
+    if devices:
+        with _cache_lock:
+            _device_cache[device_type] = (now, devices)
+
+    return list(devices)
+
+
+def _enumerate_audio_devices(device_type: str) -> list[AudioDevice]:
+    """Enumerate audio devices via COM (uncached).
+
+    Args:
+        device_type: "output" or "input".
+
     Returns:
         List of AudioDevice objects.
     """
     devices = []
 
     try:
-        # Get the device enumerator
-        device_enumerator = comtypes.CoCreateInstance(
-            GUID("{BCDE0395-E52F-467C-8E3D-C4579291692E}"),
-            IMMDeviceEnumerator,
-            comtypes.CLSCTX_INPROC_SERVER,
-        )
+        _ensure_com_initialized()
+        device_enumerator = _get_device_enumerator()
 
         # Determine flow direction
         flow = EDataFlow.eRender if device_type == "output" else EDataFlow.eCapture
@@ -127,6 +284,7 @@ def get_audio_devices(device_type: str = "output") -> list[AudioDevice]:
 
     except Exception as e:
         logger.error("Failed to enumerate audio devices: %s", e)
+        _reset_device_enumerator()
         # Fallback to pycaw's simpler method
         try:
             for device in AudioUtilities.GetAllDevices():
@@ -143,69 +301,129 @@ def get_audio_devices(device_type: str = "output") -> list[AudioDevice]:
     return devices
 
 
-def set_default_audio_device(device_id: str, role: int | None = None) -> bool:
+def _get_default_device_id(flow: int, role: int) -> str | None:
+    """Get the ID of the current default endpoint for a flow and role.
+
+    Args:
+        flow: EDataFlow value.
+        role: ERole value.
+
+    Returns:
+        Device ID, or None if there is no default or the query failed.
+    """
+    try:
+        device = _get_device_enumerator().GetDefaultAudioEndpoint(flow, role)
+        return device.GetId() if device else None
+    except Exception as e:
+        logger.debug("Could not query default audio endpoint: %s", e)
+        _reset_device_enumerator()
+        return None
+
+
+def set_default_audio_device(
+    device_id: str, role: int | None = None, device_type: str = "output"
+) -> bool:
     """Set the default audio device.
 
+    Roles whose default is already device_id are skipped, so re-selecting
+    the current device makes no IPolicyConfig calls.
+
     Args:
         device_id: The device ID string.
         role: Specific role to set (eConsole, eMultimedia, eCommunications).
               If None, sets for all roles.
+        device_type: "output" or "input", the flow device_id belongs to.
 
     Returns:
         True if successful, False otherwise.
     """
-    try:
-        # Create PolicyConfig instance
-        policy_config = comtypes.CoCreateInstance(
-            CLSID_CPolicyConfigClient, IPolicyConfig, comtypes.CLSCTX_ALL
+    _ensure_com_initialized()
+    flow = EDataFlow.eRender if device_type == "output" else EDataFlow.eCapture
+    roles = tuple(
+        r
+        for r in (
+            (role,)
+            if role is not None
+            else (ERole.eConsole, ERole.eMultimedia, ERole.eCommunications)
         )
+        if _get_default_device_id(flow, r) != device_id
+    )
+    if not roles:
+        logger.debug("Audio device already default: %s", device_id[:50])
+        return True
 
-        if role is not None:
-            # Set for specific role
-            policy_config.SetDefaultEndpoint(device_id, role)
-        else:
-            # Set for all roles
-            for r in [ERole.eConsole, ERole.eMultimedia, ERole.eCommunications]:
+    # A cached IPolicyConfig can go stale (e.g. audio service restart), so
+    # on failure drop it and retry once with a fresh instance
+    for attempt in range(2):
+        try:
+            policy_config = _get_policy_config()
+            for r in roles:
                 policy_config.SetDefaultEndpoint(device_id, r)
 
-        logger.info("Set default audio device: %s", device_id[:50])
-        return True
+            logger.info("Set default audio device: %s", device_id[:50])
+            invalidate_device_cache()
+            return True
 
-    except Exception as e:
-        logger.error("Failed to set default audio device: %s", e)
-        return False
+        except Exception as e:
+            _invalidate_policy_config()
+            if attempt:
+                logger.error("Failed to set default audio device: %s", e)
+    return False
+
+
+def _find_device(devices: list[AudioDevice], pattern_lower: str) -> AudioDevice | None:
+    """Find the first device whose name contains a lowercased pattern.
+
+    Args:
+        devices: Devices to search.
+        pattern_lower: Already-lowercased name fragment.
+
+    Returns:
+        Matching AudioDevice, or None.
+    """
+    for device in devices:
+        if pattern_lower in device.name.lower():
+            return device
+    return None
 
 
-def set_default_audio_device_by_name(name: str, device_type: str = "output") -> bool:
+def set_default_audio_device_by_name(
+    name: str, device_type: str = "output", *, lowered: bool = False
+) -> bool:
     """Set default audio device by friendly name (partial match).
 
     Args:
         name: Partial name to match (case-insensitive).
         device_type: "output" or "input".
+        lowered: True if name is already lowercase, so it is used as is.
 
     Returns:
         True if device found and set, False otherwise.
     """
-    devices = get_audio_devices(device_type)
-    name_lower = name.lower()
-
-    for device in devices:
-        if name_lower in device.name.lower():
-            logger.info("Found device '%s' matching '%s'", device.name, name)
-            return set_default_audio_device(device.id)
+    device = _find_device(
+        get_audio_devices(device_type), name if lowered else name.lower()
+    )
+    if device:
+        logger.info("Found device '%s' matching '%s'", device.name, name)
+        return set_default_audio_device(device.id, device_type=device_type)
 
     logger.warning("No device found matching '%s'", name)
     return False
 
 
 def cycle_audio_devices(
-    device_names: list[str], device_type: str = "output"
+    device_names: list[str] | tuple[str, ...],
+    device_type: str = "output",
+    *,
+    lowered: bool = False,
 ) -> str | None:
     """Cycle through a list of audio devices.
 
     Args:
         device_names: List of device name patterns to cycle through.
         device_type: "output" or "input".
+        lowered: True if the patterns are already lowercase, so callers that
+            cycle repeatedly can lowercase them once up front.
 
     Returns:
         Name of the device switched to, or None if failed.
@@ -219,28 +437,27 @@ def cycle_audio_devices(
         logger.warning("No audio devices found")
         return None
 
+    # Lowercase patterns and device names once instead of per comparison
+    patterns = device_names if lowered else [p.lower() for p in device_names]
+    names = [(d, d.name.lower()) for d in devices]
+
     # Find current default device
-    current_default = next((d for d in devices if d.is_default), None)
-    current_name = current_default.name.lower() if current_default else ""
+    current_name = next((n for d, n in names if d.is_default), "")
 
     # Find which device in our list is current
-    current_index = -1
-    for i, pattern in enumerate(device_names):
-        if pattern.lower() in current_name:
-            current_index = i
-            break
+    current_index = next(
+        (i for i, pattern in enumerate(patterns) if pattern in current_name), -1
+    )
 
     # Get next device in cycle
-    next_index = (current_index + 1) % len(device_names)
-    next_pattern = device_names[next_index]
+    next_index = (current_index + 1) % len(patterns)
 
     # Find and set the next device
-    for device in devices:
-        if next_pattern.lower() in device.name.lower():
-            if set_default_audio_device(device.id):
-                logger.info("Cycled to: %s", device.name)
-                return device.name
-            break
+    next_pattern = patterns[next_index]
+    device = next((d for d, n in names if next_pattern in n), None)
+    if device and set_default_audio_device(device.id, device_type=device_type):
+        logger.info("Cycled to: %s", device.name)
+        return device.name
 
-    logger.warning("Could not cycle to device matching '%s'", next_pattern)
+    logger.warning("Could not cycle to device matching '%s'", device_names[next_index])
     return None
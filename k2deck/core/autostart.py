@@ -5,8 +5,10 @@ that launches K2 Deck with the correct venv and arguments.
 The VBS approach avoids a visible console window on login.
 """
 
+import codecs
 import logging
 import os
+import subprocess
 import sys
 from pathlib import Path
 
@@ -67,22 +69,24 @@ def enable_autostart(
     if debug:
         args.append("--debug")
 
-    # Build VBS content using chr(34) for robust quoting
+    # Quote the command line once, the way Windows' argv parser reads it,
+    # and embed it as a single VBS string literal ("" escapes a quote).
     # WshShell.Run(command, windowStyle, waitOnReturn)
     # windowStyle 0 = hidden window
-    q = "chr(34)"
-    parts = ' & " " & '.join(f'{q} & "{a}" & {q}' for a in args)
-    cmd_expr = parts
+    cmdline = subprocess.list2cmdline(args).replace('"', '""')
+    workdir = str(project_dir).replace('"', '""')
 
     vbs_lines = [
         'Set WshShell = CreateObject("WScript.Shell")',
-        f'WshShell.CurrentDirectory = "{project_dir}"',
-        f"WshShell.Run {cmd_expr}, 0, False",
+        f'WshShell.CurrentDirectory = "{workdir}"',
+        f'WshShell.Run "{cmdline}", 0, False',
     ]
     vbs_content = "\r\n".join(vbs_lines) + "\r\n"
 
+    # WSH reads files without a BOM in the ANSI code page; UTF-16 with a
+    # BOM keeps non-ASCII paths intact
     startup_path = _get_startup_path()
-    startup_path.write_text(vbs_content, encoding="utf-8")
+    startup_path.write_bytes(codecs.BOM_UTF16_LE + vbs_content.encode("utf-16-le"))
     logger.info("Auto-start enabled: %s", startup_path)
 
 
@@ -1,8 +1,11 @@
 """Context utilities - Foreground app detection with caching."""
 
+import ctypes
+import functools
 import logging
 import threading
 import time
+from ctypes import wintypes
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -15,6 +18,81 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Toolhelp API constants
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+MAX_PATH = 260
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", ctypes.c_wchar * MAX_PATH),
+    ]
+
+
+@functools.cache
+def _get_toolhelp():
+    """Bind the kernel32 Toolhelp functions once, with explicit signatures."""
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    entry_ptr = ctypes.POINTER(PROCESSENTRY32W)
+
+    create_snapshot = kernel32.CreateToolhelp32Snapshot
+    create_snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+    create_snapshot.restype = wintypes.HANDLE
+
+    process_first = kernel32.Process32FirstW
+    process_first.argtypes = (wintypes.HANDLE, entry_ptr)
+    process_first.restype = wintypes.BOOL
+
+    process_next = kernel32.Process32NextW
+    process_next.argtypes = (wintypes.HANDLE, entry_ptr)
+    process_next.restype = wintypes.BOOL
+
+    close_handle = kernel32.CloseHandle
+    close_handle.argtypes = (wintypes.HANDLE,)
+    close_handle.restype = wintypes.BOOL
+
+    return create_snapshot, process_first, process_next, close_handle
+
+
+def _list_processes() -> list[tuple[int, str]]:
+    """List running processes from a single Toolhelp snapshot.
+
+    The snapshot carries every process's executable name, so unlike
+    psutil.process_iter no handle is opened per process.
+
+    Returns:
+        List of (pid, executable name) tuples.
+
+    Raises:
+        OSError: If the snapshot cannot be taken.
+    """
+    create_snapshot, process_first, process_next, close_handle = _get_toolhelp()
+    snapshot = create_snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        processes = []
+        found = process_first(snapshot, ctypes.byref(entry))
+        while found:
+            processes.append((entry.th32ProcessID, entry.szExeFile))
+            found = process_next(snapshot, ctypes.byref(entry))
+        return processes
+    finally:
+        close_handle(snapshot)
+
 
 @dataclass
 class AppInfo:
@@ -42,29 +120,52 @@ class ContextCache:
         self._foreground_app: AppInfo | None = None
         self._last_refresh = 0.0
         self._refresh_interval = refresh_interval
-        self._lock = threading.Lock()
-        self._running_apps: dict[str, list[int]] = {}  # name -> list of PIDs
+        # Serializes foreground refreshes only; fresh reads take no lock
+        self._foreground_lock = threading.Lock()
+        self._lock = threading.Lock()  # Guards the running apps cache
+        self._running_names: set[str] = set()  # Lowercased process names
+        # The same names joined as "|a.exe|b.exe|" so substring checks are
+        # one C-level search ("|" cannot appear in a file name)
+        self._running_names_blob = "|"
         self._running_apps_refresh = 0.0
         self._running_apps_interval = 2.0  # Refresh running apps every 2s
 
     def get_foreground_app(self) -> AppInfo | None:
         """Get the currently focused application.
 
+        Fresh values are read without locking (attribute reads and stores
+        are atomic). When the value is stale one caller refreshes it; the
+        others return the previous value instead of waiting, unless the
+        cache was invalidated, in which case they wait for the new value.
+
         Returns:
             AppInfo for the foreground app, or None if detection fails.
         """
-        with self._lock:
-            now = time.monotonic()
-            if now - self._last_refresh > self._refresh_interval:
-                self._refresh_foreground()
+        now = time.monotonic()
+        last_refresh = self._last_refresh
+        if now - last_refresh <= self._refresh_interval:
             return self._foreground_app
 
-    def _refresh_foreground(self) -> None:
-        """Refresh the foreground app cache."""
+        if self._foreground_lock.acquire(blocking=last_refresh == 0.0):
+            try:
+                # A refresh that finished while we waited stamped a later time
+                if now - self._last_refresh > self._refresh_interval:
+                    self._refresh_foreground(now)
+            finally:
+                self._foreground_lock.release()
+        return self._foreground_app
+
+    def _refresh_foreground(self, now: float) -> None:
+        """Refresh the foreground app cache.
+
+        Args:
+            now: The time.monotonic() value the caller read for this access.
+        """
         try:
             hwnd = win32gui.GetForegroundWindow()
             if not hwnd:
                 self._foreground_app = None
+                self._last_refresh = now
                 return
 
             title = win32gui.GetWindowText(hwnd)
@@ -82,7 +183,7 @@ class ContextCache:
                 pid=pid,
                 hwnd=hwnd,
             )
-            self._last_refresh = time.monotonic()
+            self._last_refresh = now
             logger.debug("Foreground app: %s (%s)", name, title[:50] if title else "")
 
         except Exception as e:
@@ -118,42 +219,42 @@ class ContextCache:
         with self._lock:
             now = time.monotonic()
             if now - self._running_apps_refresh > self._running_apps_interval:
-                self._refresh_running_apps()
+                self._refresh_running_apps(now)
 
             app_name_lower = app_name.lower()
-            for name in self._running_apps:
-                if app_name_lower in name.lower():
-                    return True
-            return False
+            if app_name_lower in self._running_names:
+                return True
+            return (
+                "|" not in app_name_lower and app_name_lower in self._running_names_blob
+            )
 
-    def _refresh_running_apps(self) -> None:
-        """Refresh the running apps cache."""
+    def _refresh_running_apps(self, now: float) -> None:
+        """Refresh the running apps cache.
+
+        Args:
+            now: The time.monotonic() value the caller read for this access.
+        """
         try:
-            self._running_apps.clear()
-            for proc in psutil.process_iter(["pid", "name"]):
-                try:
-                    name = proc.info["name"]
-                    pid = proc.info["pid"]
-                    if name:
-                        name_lower = name.lower()
-                        if name_lower not in self._running_apps:
-                            self._running_apps[name_lower] = []
-                        self._running_apps[name_lower].append(pid)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-
-            self._running_apps_refresh = time.monotonic()
+            names = {name.lower() for _, name in _list_processes() if name}
+            self._running_names = names
+            self._running_names_blob = "|" + "|".join(names) + "|"
+
+            self._running_apps_refresh = now
             logger.debug(
-                "Refreshed running apps cache: %d processes", len(self._running_apps)
+                "Refreshed running apps cache: %d processes", len(self._running_names)
             )
 
         except Exception as e:
             logger.error("Failed to refresh running apps: %s", e)
 
+    def invalidate_foreground(self) -> None:
+        """Force foreground app refresh on next access."""
+        self._last_refresh = 0.0
+
     def invalidate(self) -> None:
         """Force cache refresh on next access."""
+        self._last_refresh = 0.0
         with self._lock:
-            self._last_refresh = 0.0
             self._running_apps_refresh = 0.0
 
 
@@ -197,3 +298,8 @@ def is_app_running(app_name: str) -> bool:
 def invalidate_context_cache() -> None:
     """Force context cache refresh."""
     _context_cache.invalidate()
+
+
+def invalidate_foreground_cache() -> None:
+    """Force foreground app refresh (e.g., after changing focus)."""
+    _context_cache.invalidate_foreground()
@@ -6,17 +6,23 @@ Useful for tracking kills, reps, pomodoros, etc.
 
 import json
 import logging
+import os
+import threading
+import time
 from collections.abc import Callable
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Coalesce rapid changes (kill counters, reps) into one write
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 
 class CounterManager:
     """Manages persistent counters.
 
     Singleton pattern ensures all actions share the same state.
-    Counters persist to ~/.k2deck/counters.json.
+    Counters persist to ~/.k2deck/counters.json (debounced, atomic writes).
     """
 
     _instance: "CounterManager | None" = None
@@ -36,6 +42,9 @@ class CounterManager:
 
         self._counters: dict[str, int] = {}
         self._callbacks: dict[str, list[Callable[[int], None]]] = {}
+        self._save_lock = threading.RLock()
+        self._last_save_time = 0.0
+        self._save_timer: threading.Timer | None = None
         self._load()
         self._initialized = True
 
@@ -50,12 +59,52 @@ class CounterManager:
             self._counters = {}
 
     def _save(self) -> None:
-        """Save counters to disk."""
-        try:
-            self.COUNTERS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            self.COUNTERS_FILE.write_text(json.dumps(self._counters, indent=2))
-        except Exception as e:
-            logger.error("Failed to save counters: %s", e)
+        """Save counters to disk (debounced).
+
+        Writes immediately if the last write was long enough ago, otherwise
+        schedules one trailing write for the whole burst.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                return  # Trailing write already scheduled
+
+            path = self.COUNTERS_FILE
+            elapsed = time.monotonic() - self._last_save_time
+            if elapsed >= SAVE_DEBOUNCE_SECONDS:
+                self._do_save(path)
+                return
+
+            self._save_timer = threading.Timer(
+                SAVE_DEBOUNCE_SECONDS - elapsed, self._do_save, args=(path,)
+            )
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _do_save(self, path: Path) -> None:
+        """Write counters to disk atomically (temp file + rename).
+
+        Args:
+            path: Destination file.
+        """
+        with self._save_lock:
+            self._save_timer = None
+            self._last_save_time = time.monotonic()
+            data = json.dumps(self._counters, separators=(",", ":")).encode()
+
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(path.suffix + ".tmp")
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.error("Failed to save counters: %s", e)
+
+    def flush(self) -> None:
+        """Write any pending changes to disk immediately."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._do_save(self.COUNTERS_FILE)
 
     def get(self, name: str) -> int:
         """Get counter value.
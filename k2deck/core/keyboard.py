@@ -12,6 +12,7 @@ Benefits over pynput/virtual key codes:
 """
 
 import ctypes
+import functools
 import logging
 import threading
 import time
@@ -424,10 +425,122 @@ def tap_key(key: str, hold_ms: float = 10) -> bool:
     return release_key(key)
 
 
+def _create_input_for_key(key_lower: str, key_up: bool) -> INPUT | None:
+    """Create the INPUT structure for a lowercased key name.
+
+    Args:
+        key_lower: Lowercased key name.
+        key_up: True for key release, False for key press.
+
+    Returns:
+        INPUT structure, or None if the key is unknown.
+    """
+    if key_lower in MEDIA_VK_CODES:
+        return _create_vk_input(MEDIA_VK_CODES[key_lower], key_up)
+    if key_lower in SCAN_CODES:
+        scan_code, extended = SCAN_CODES[key_lower]
+        return _create_key_input(scan_code, extended, key_up)
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_hotkey(
+    keys: tuple[str, ...],
+) -> tuple[tuple[str, ...], list[INPUT], list[INPUT]] | None:
+    """Resolve a key combination to its press and release INPUTs (memoized).
+
+    Hotkeys come from a fixed config, so each combination is parsed once.
+
+    Args:
+        keys: Key names in press order.
+
+    Returns:
+        Tuple of (lowercased keys, press INPUTs, release INPUTs in reverse
+        order), or None if any key is unknown.
+    """
+    keys_lower = tuple(key.lower() for key in keys)
+    downs = []
+    ups = []
+    for key_lower in keys_lower:
+        down = _create_input_for_key(key_lower, key_up=False)
+        if down is None:
+            return None
+        downs.append(down)
+        ups.append(_create_input_for_key(key_lower, key_up=True))
+    ups.reverse()
+    return keys_lower, downs, ups
+
+
+def _execute_hotkey_batched(keys: list[str], hold_ms: float) -> bool:
+    """Execute a hotkey with one SendInput call for presses and one for releases.
+
+    SendInput inserts a batch atomically, so the chord can't be interleaved
+    with other input.
+
+    Args:
+        keys: List of key names.
+        hold_ms: Milliseconds to hold the combination.
+
+    Returns:
+        True if all keys were known and sent.
+    """
+    resolved = _resolve_hotkey(tuple(keys))
+    if resolved is None:
+        logger.error("Unknown key in hotkey: %s", keys)
+        return False
+    keys_lower, downs, ups = resolved
+
+    with _lock:
+        sent = _send_input(downs)
+        _held_keys.update(keys_lower)
+
+    try:
+        if hold_ms > 0:
+            time.sleep(hold_ms / 1000.0)
+    finally:
+        with _lock:
+            _send_input(ups)
+            _held_keys.difference_update(keys_lower)
+
+    return sent == len(downs)
+
+
+def tap_hotkey_repeated(keys: list[str], count: int) -> bool:
+    """Tap a hotkey several times in a single SendInput batch.
+
+    Used to flush coalesced encoder ticks with one kernel transition.
+
+    Args:
+        keys: List of key names.
+        count: Number of taps.
+
+    Returns:
+        True if all inputs were sent.
+    """
+    if not keys or count <= 0:
+        return True
+
+    resolved = _resolve_hotkey(tuple(keys))
+    if resolved is None:
+        logger.error("Unknown key in hotkey: %s", keys)
+        return False
+    _, downs, ups = resolved
+
+    inputs = (downs + ups) * count
+    with _lock:
+        sent = _send_input(inputs)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SendInput hotkey x%d: %s", count, keys)
+    return sent == len(inputs)
+
+
 def execute_hotkey(keys: list[str], hold_ms: float = 10, between_ms: float = 5) -> bool:
     """Execute a hotkey combination.
 
     Presses all keys in sequence, holds, then releases in reverse order.
+    With between_ms=0 the presses and the releases are each sent as a
+    single SendInput batch.
 
     Args:
         keys: List of key names (e.g., ["ctrl", "shift", "s"]).
@@ -440,7 +553,11 @@ def execute_hotkey(keys: list[str], hold_ms: float = 10, between_ms: float = 5)
     if not keys:
         return True
 
-    logger.debug("SendInput hotkey: %s", keys)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SendInput hotkey: %s", keys)
+
+    if between_ms <= 0:
+        return _execute_hotkey_batched(keys, hold_ms)
 
     pressed: list[str] = []
     success = True
@@ -469,37 +586,44 @@ def execute_hotkey(keys: list[str], hold_ms: float = 10, between_ms: float = 5)
     return success
 
 
+# Modifier names released by release_all_modifiers
+_RELEASE_MODIFIERS = (
+    "ctrl",
+    "ctrl_l",
+    "ctrl_r",
+    "alt",
+    "alt_l",
+    "alt_r",
+    "shift",
+    "shift_l",
+    "shift_r",
+    "win",
+    "win_l",
+    "win_r",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_modifier_release_inputs() -> list[INPUT]:
+    """Get the cached key-up INPUTs for every modifier (one per scan code)."""
+    codes = dict.fromkeys(SCAN_CODES[mod] for mod in _RELEASE_MODIFIERS)
+    return [
+        _create_key_input(scan_code, extended, key_up=True)
+        for scan_code, extended in codes
+    ]
+
+
 def release_all_modifiers() -> None:
     """Release all modifier keys to prevent stuck keys.
 
     This is critical for preventing stuck Ctrl, Alt, Shift, Win keys
-    after complex sequences.
+    after complex sequences. All releases go out in one SendInput call.
     """
-    modifiers = [
-        "ctrl",
-        "ctrl_l",
-        "ctrl_r",
-        "alt",
-        "alt_l",
-        "alt_r",
-        "shift",
-        "shift_l",
-        "shift_r",
-        "win",
-        "win_l",
-        "win_r",
-    ]
-
     with _lock:
-        for mod in modifiers:
-            if mod in SCAN_CODES:
-                scan_code, extended = SCAN_CODES[mod]
-                inp = _create_key_input(scan_code, extended, key_up=True)
-                _send_input([inp])
+        _send_input(_get_modifier_release_inputs())
 
         # Clear tracked held keys for modifiers
-        for mod in modifiers:
-            _held_keys.discard(mod)
+        _held_keys.difference_update(_RELEASE_MODIFIERS)
 
     logger.debug("Released all modifiers")
 
@@ -59,6 +59,7 @@ from k2deck.actions.twitch import (
 from k2deck.actions.volume import VolumeAction
 from k2deck.actions.window import FocusAction, LaunchAction
 from k2deck.core import folders, layers
+from k2deck.core.midi_listener import CC, NOTE_OFF, NOTE_ON
 
 if TYPE_CHECKING:
     from k2deck.core.midi_listener import MidiEvent
@@ -154,6 +155,8 @@ class MappingEngine:
         self._mappings: dict = {}
         self._zones: dict[int, dict] = {}  # Channel -> zone mappings
         self._led_offsets: dict[str, int] = {"red": 0, "amber": 36, "green": 72}
+        # (id(raw mapping), layer) -> (raw mapping, action, resolved config)
+        self._action_cache: dict[tuple[int, int], tuple[dict, Action | None, dict]] = {}
 
         if config_path:
             self.load_config(config_path)
@@ -199,6 +202,7 @@ class MappingEngine:
                 raise ConfigValidationError(f"Invalid JSON: {e}")
 
         self._validate_config()
+        self._action_cache.clear()
         self._led_offsets = self._config.get(
             "led_color_offsets",
             {"red": 0, "amber": 36, "green": 72},
@@ -367,15 +371,16 @@ class MappingEngine:
         zone_mappings = self._zones.get(event.channel, self._mappings)
 
         # Handle layer button specially
-        if event.type == "note_on" and layers.is_layer_button(event.note):
+        if event.type == NOTE_ON and layers.is_layer_button(event.note):
             if layers.handle_layer_button(event):
                 # Layer button consumed the event
                 return None, None
 
+        action = None
         mapping_config = None
 
-        if event.type == "note_on":
-            # Check if we're in a folder (folders only affect note_on mappings)
+        if event.type == NOTE_ON or event.type == NOTE_OFF:
+            # Check if we're in a folder (folders only affect note mappings)
             folder_mgr = folders.get_folder_manager()
             if folder_mgr.in_folder:
                 # Look in folder mappings first
@@ -386,7 +391,7 @@ class MappingEngine:
                 raw_config = folder_note_mappings.get(str(event.note))
                 if raw_config:
                     # Resolve layer-specific mapping from folder
-                    mapping_config = layers.resolve_layer_mapping(
+                    action, mapping_config = self._resolve_mapping(
                         raw_config, event.note
                     )
 
@@ -395,13 +400,13 @@ class MappingEngine:
                 note_mappings = zone_mappings.get("note_on", {})
                 raw_config = note_mappings.get(str(event.note))
                 # Resolve layer-specific mapping
-                mapping_config = layers.resolve_layer_mapping(raw_config, event.note)
+                action, mapping_config = self._resolve_mapping(raw_config, event.note)
 
-        elif event.type == "note_off":
-            # Note off typically doesn't trigger actions
-            return None, None
+            # Releases only go to actions that handle them (e.g. hold hotkeys)
+            if event.type == NOTE_OFF and not (action and action.handles_release):
+                return None, None
 
-        elif event.type == "cc":
+        elif event.type == CC:
             # Determine if relative or absolute based on value
             # Two's complement: 1-63 or 65-127 suggests relative encoder
             # Values across full 0-127 range suggest absolute fader/knob
@@ -413,25 +418,57 @@ class MappingEngine:
                 # Check if value looks like relative (1, 127, or similar)
                 if value in (1, 127) or (1 <= value <= 63) or (65 <= value <= 127):
                     raw_config = relative_mappings.get(str(event.cc))
-                    mapping_config = layers.resolve_layer_mapping(raw_config, event.cc)
+                    action, mapping_config = self._resolve_mapping(raw_config, event.cc)
 
             # If not found in relative, check absolute
             if mapping_config is None:
                 absolute_mappings = zone_mappings.get("cc_absolute", {})
                 raw_config = absolute_mappings.get(str(event.cc))
-                mapping_config = layers.resolve_layer_mapping(raw_config, event.cc)
+                action, mapping_config = self._resolve_mapping(raw_config, event.cc)
+
+        if action is None:
+            return None, None
 
+        return action, mapping_config
+
+    def _resolve_mapping(
+        self, raw_config: dict | None, note_or_cc: int
+    ) -> tuple[Action | None, dict | None]:
+        """Resolve a raw mapping for the current layer to an action instance.
+
+        Action instances are created once per mapping and layer, then reused
+        until the config is reloaded. The instance is shared by every press
+        of the control, including presses running concurrently on the app's
+        worker pool (see Action.execute).
+
+        Args:
+            raw_config: Raw mapping config from the zone/folder section.
+            note_or_cc: The note or CC number.
+
+        Returns:
+            Tuple of (Action or None if unknown type, resolved config),
+            or (None, None) if there is no mapping for this layer.
+        """
+        if raw_config is None:
+            return None, None
+
+        key = (id(raw_config), layers.get_current_layer())
+        cached = self._action_cache.get(key)
+        if cached is not None and cached[0] is raw_config:
+            return cached[1], cached[2]
+
+        mapping_config = layers.resolve_layer_mapping(raw_config, note_or_cc)
         if mapping_config is None:
             return None, None
 
-        # Create action instance
         action_type = mapping_config.get("action")
         if action_type not in ACTION_TYPES:
             logger.debug("Unknown action type: %s", action_type)
-            return None, None
+            return None, mapping_config
 
-        action_class = ACTION_TYPES[action_type]
-        return action_class(mapping_config), mapping_config
+        action = ACTION_TYPES[action_type](mapping_config)
+        self._action_cache[key] = (raw_config, action, mapping_config)
+        return action, mapping_config
 
     def reload(self) -> None:
         """Reload config from file.
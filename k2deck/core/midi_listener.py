@@ -6,6 +6,7 @@ is disconnected.
 """
 
 import logging
+import sys
 import threading
 import time
 from collections.abc import Callable
@@ -15,6 +16,15 @@ import mido
 
 logger = logging.getLogger(__name__)
 
+# Event type values. Interned so every producer shares one object and
+# equality checks against them hit the identity fast path. Kept as plain
+# strings rather than an IntEnum: comparing an interned str is cheaper than
+# an enum member lookup, and the web API, profiles and tests all use the
+# string names.
+NOTE_ON = sys.intern("note_on")
+NOTE_OFF = sys.intern("note_off")
+CC = sys.intern("cc")
+
 
 @dataclass
 class MidiEvent:
@@ -35,7 +45,7 @@ class MidiEvent:
 
         if msg.type == "note_on":
             return cls(
-                type="note_on" if msg.velocity > 0 else "note_off",
+                type=NOTE_ON if msg.velocity > 0 else NOTE_OFF,
                 channel=channel,
                 note=msg.note,
                 cc=None,
@@ -44,7 +54,7 @@ class MidiEvent:
             )
         elif msg.type == "note_off":
             return cls(
-                type="note_off",
+                type=NOTE_OFF,
                 channel=channel,
                 note=msg.note,
                 cc=None,
@@ -53,7 +63,7 @@ class MidiEvent:
             )
         elif msg.type == "control_change":
             return cls(
-                type="cc",
+                type=CC,
                 channel=channel,
                 note=None,
                 cc=msg.control,
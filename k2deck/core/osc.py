@@ -7,6 +7,7 @@ OSC spec: http://opensoundcontrol.org/spec-1_0
 """
 
 import logging
+import queue
 import socket
 import struct
 import threading
@@ -104,6 +105,12 @@ class OscSender:
     _instances: dict[tuple[str, int], "OscSender"] = {}
     _lock = threading.Lock()
 
+    # Background send queue shared by all destinations (see send_async).
+    # Items are (sender, address, args, coalesce_key) or None to stop;
+    # prebuilt packets are queued as (sender, packet, None, None).
+    _queue: "queue.SimpleQueue[tuple | None]" = queue.SimpleQueue()
+    _worker: threading.Thread | None = None
+
     def __new__(cls, host: str = "127.0.0.1", port: int = 9000) -> "OscSender":
         """Get or create singleton instance for (host, port)."""
         key = (host, port)
@@ -153,15 +160,118 @@ class OscSender:
             True if sent successfully, False on error.
         """
         try:
-            msg = build_osc_message(address, *args)
+            packet = build_osc_message(address, *args)
+        except ValueError as e:
+            logger.error("OSC send to %s:%d failed: %s", self._host, self._port, e)
+            return False
+        return self.send_packet(packet)
+
+    def send_packet(self, packet: bytes) -> bool:
+        """Send a prebuilt OSC message.
+
+        Thread-safe. Never raises — logs errors and returns False.
+
+        Args:
+            packet: Encoded OSC message (see build_osc_message).
+
+        Returns:
+            True if sent successfully, False on error.
+        """
+        try:
             with self._send_lock:
                 sock = self._ensure_socket()
-                sock.sendto(msg, (self._host, self._port))
+                sock.sendto(packet, (self._host, self._port))
             return True
         except Exception as e:
             logger.error("OSC send to %s:%d failed: %s", self._host, self._port, e)
             return False
 
+    def send_async(
+        self, address: str, *args: int | float | str, coalesce: bool = False
+    ) -> None:
+        """Queue an OSC message for the background sender thread.
+
+        Keeps UDP syscalls off the action dispatch thread. A single daemon
+        thread sends queued messages in order. Never raises.
+
+        Args:
+            address: OSC address pattern (e.g., "/pd/param").
+            *args: Message arguments (int, float, or str).
+            coalesce: If True, the message carries an absolute value and
+                only the latest one still queued for the same destination,
+                address and parameter is sent. Leave False for triggers.
+        """
+        key = None
+        if coalesce:
+            key = (self, address, args[0] if len(args) > 1 else None)
+        if OscSender._worker is None:
+            OscSender._start_worker()
+        OscSender._queue.put((self, address, args, key))
+
+    def send_packet_async(self, packet: bytes) -> None:
+        """Queue a prebuilt OSC message for the background sender thread.
+
+        For actions that always send the same few messages, so encoding
+        happens once at init rather than per event. Never coalesced.
+
+        Args:
+            packet: Encoded OSC message (see build_osc_message).
+        """
+        if OscSender._worker is None:
+            OscSender._start_worker()
+        OscSender._queue.put((self, packet, None, None))
+
+    @classmethod
+    def _start_worker(cls) -> None:
+        """Start the background sender thread if it is not running."""
+        with cls._lock:
+            if cls._worker is None:
+                worker = threading.Thread(
+                    target=cls._run_worker, name="k2deck-osc", daemon=True
+                )
+                worker.start()
+                cls._worker = worker
+
+    @classmethod
+    def _run_worker(cls) -> None:
+        """Send queued messages until a None sentinel is received.
+
+        Everything already queued is drained as one batch, so a fast encoder
+        burst collapses to a single packet per parameter.
+        """
+        while True:
+            batch = [cls._queue.get()]
+            while True:
+                try:
+                    batch.append(cls._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            if stop:
+                batch = batch[: batch.index(None)]
+
+            # Index of the newest message for each coalescing key
+            latest = {item[3]: i for i, item in enumerate(batch) if item[3]}
+            for i, (sender, address, args, key) in enumerate(batch):
+                if args is None:
+                    sender.send_packet(address)
+                elif key is None or latest[key] == i:
+                    sender.send(address, *args)
+
+            if stop:
+                return
+
+    @classmethod
+    def _stop_worker(cls, timeout: float = 1.0) -> None:
+        """Send pending messages, then stop the background sender thread."""
+        with cls._lock:
+            worker = cls._worker
+            cls._worker = None
+        if worker is not None:
+            cls._queue.put(None)
+            worker.join(timeout)
+
     def close(self) -> None:
         """Close the UDP socket."""
         with self._send_lock:
@@ -172,6 +282,7 @@ class OscSender:
     @classmethod
     def close_all(cls) -> None:
         """Close all cached sockets (call on app shutdown)."""
+        cls._stop_worker()
         with cls._lock:
             for sender in cls._instances.values():
                 sender.close()
@@ -1,16 +1,43 @@
 """Timer Manager - Countdown timers with completion callbacks.
 
-Manages named timers that count down in background threads.
+Manages named timers that count down on a single shared worker thread,
+which sleeps until the earliest pending tick in a deadline heap.
+Completion callbacks run on a separate pool, so a slow on_complete action
+(a macro, a system command) never delays other timers' ticks.
 Timers are transient (not persisted to disk).
 """
 
+import heapq
+import itertools
 import logging
 import threading
+import time
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+TICK_NS = 1_000_000_000
+
+# Runs on_complete callbacks off the tick thread (threads start on first use)
+_completion_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="k2deck-timer-complete"
+)
+
+
+def _run_completion(name: str, on_complete: Callable[[], None]) -> None:
+    """Run a timer's completion callback, logging any error.
+
+    Args:
+        name: Timer identifier.
+        on_complete: The callback.
+    """
+    try:
+        on_complete()
+    except Exception as e:
+        logger.error("Timer '%s' on_complete error: %s", name, e)
+
 
 @dataclass
 class TimerState:
@@ -20,8 +47,7 @@ class TimerState:
     duration: float
     remaining: float
     running: bool = True
-    _stop_event: threading.Event = field(default_factory=threading.Event)
-    thread: threading.Thread | None = None
+    next_tick_ns: int = 0
     on_tick: Callable[[float], None] | None = (
         None  # Reserved for future WebSocket tick broadcast
     )
@@ -51,6 +77,11 @@ class TimerManager:
 
         self._timers: dict[str, TimerState] = {}
         self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # (next_tick_ns, seq, state); stopped timers are skipped when popped
+        self._heap: list[tuple[int, int, TimerState]] = []
+        self._seq = itertools.count()
+        self._worker: threading.Thread | None = None
         self._initialized = True
 
     def start_timer(
@@ -69,7 +100,8 @@ class TimerManager:
             name: Timer identifier.
             seconds: Countdown duration in seconds (minimum 1).
             on_tick: Called every second with remaining time.
-            on_complete: Called when timer reaches zero.
+            on_complete: Called when timer reaches zero, on the completion
+                pool rather than the timer thread.
         """
         seconds = max(1.0, float(seconds))
 
@@ -77,51 +109,72 @@ class TimerManager:
             # Stop existing timer with same name
             if name in self._timers and self._timers[name].running:
                 self._timers[name].running = False
-                self._timers[name]._stop_event.set()
 
             state = TimerState(
                 name=name,
                 duration=seconds,
                 remaining=seconds,
+                next_tick_ns=time.monotonic_ns() + TICK_NS,
                 on_tick=on_tick,
                 on_complete=on_complete,
             )
             self._timers[name] = state
+            self._schedule(state)
 
-            thread = threading.Thread(
-                target=self._run_timer,
-                args=(state,),
-                daemon=True,
-                name=f"timer-{name}",
-            )
-            state.thread = thread
-            thread.start()
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, daemon=True, name="k2deck-timers"
+                )
+                self._worker.start()
+            else:
+                self._wakeup.notify()
 
         logger.info("Timer '%s' started: %.0fs", name, seconds)
 
-    def _run_timer(self, state: TimerState) -> None:
-        """Timer thread loop. Ticks every 1s until stopped or complete."""
-        while state.running and state.remaining > 0:
-            state._stop_event.wait(1.0)
-            if not state.running:
-                break
-            state.remaining = max(0.0, state.remaining - 1.0)
+    def _schedule(self, state: TimerState) -> None:
+        """Queue a timer's next tick. Caller must hold the lock."""
+        heapq.heappush(self._heap, (state.next_tick_ns, next(self._seq), state))
+
+    def _run_worker(self) -> None:
+        """Worker loop. Fires due ticks in deadline order; exits when idle."""
+        while True:
+            with self._lock:
+                while True:
+                    if not self._heap:
+                        self._worker = None
+                        return
+                    deadline_ns = self._heap[0][0]
+                    wait_ns = deadline_ns - time.monotonic_ns()
+                    if wait_ns <= 0:
+                        break
+                    self._wakeup.wait(wait_ns / 1e9)
+
+                _, _, state = heapq.heappop(self._heap)
+                if not state.running:
+                    continue
+                state.remaining = max(0.0, state.remaining - 1.0)
+                completed = state.remaining <= 0
+                if completed:
+                    state.running = False
+                else:
+                    # Next tick is relative to the deadline, so ticks don't drift
+                    state.next_tick_ns = deadline_ns + TICK_NS
+                    self._schedule(state)
 
-            if state.on_tick and state.running:
+            # Callbacks run outside the lock so they may start/stop timers
+            if state.on_tick:
                 try:
                     state.on_tick(state.remaining)
                 except Exception as e:
                     logger.error("Timer '%s' on_tick error: %s", state.name, e)
 
-        # Fire completion callback only if timer ran to zero (not stopped)
-        if state.remaining <= 0 and state.running:
-            state.running = False
-            logger.info("Timer '%s' completed", state.name)
-            if state.on_complete:
-                try:
-                    state.on_complete()
-                except Exception as e:
-                    logger.error("Timer '%s' on_complete error: %s", state.name, e)
+            # Fire completion callback only if timer ran to zero (not stopped)
+            if completed:
+                logger.info("Timer '%s' completed", state.name)
+                if state.on_complete:
+                    _completion_executor.submit(
+                        _run_completion, state.name, state.on_complete
+                    )
 
     def stop_timer(self, name: str) -> bool:
         """Stop a running timer.
@@ -136,7 +189,6 @@ class TimerManager:
             state = self._timers.get(name)
             if state and state.running:
                 state.running = False
-                state._stop_event.set()
                 logger.info(
                     "Timer '%s' stopped (%.0fs remaining)", name, state.remaining
                 )
@@ -165,7 +217,6 @@ class TimerManager:
             state = self._timers.get(name)
             if state and state.running:
                 state.running = False
-                state._stop_event.set()
                 logger.info("Timer '%s' toggled off", name)
                 return False
 
@@ -218,10 +269,10 @@ class TimerManager:
         """Stop all running timers (call on app shutdown)."""
         with self._lock:
             for state in self._timers.values():
-                if state.running:
-                    state.running = False
-                    state._stop_event.set()
+                state.running = False
             self._timers.clear()
+            self._heap.clear()
+            self._wakeup.notify()
         logger.info("All timers stopped")
 
 
@@ -102,6 +102,7 @@ class TwitchClient:
         self._connected = False
         self._initialized = False
         self._last_action_time = 0.0
+        self._game_ids: dict[str, str] = {}  # game name -> category ID
         self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="twitch")
         self._loop: asyncio.AbstractEventLoop | None = None
 
@@ -444,13 +445,15 @@ class TwitchClient:
         """
 
         async def _update():
-            # First search for the game to get its ID
-            games = await self._twitch.get_games(names=[game_name])
-            if not games or not games.data:
-                logger.warning("Game not found: %s", game_name)
-                return False
+            # Look up the game's ID once; repeat presses skip the search
+            game_id = self._game_ids.get(game_name)
+            if game_id is None:
+                games = await self._twitch.get_games(names=[game_name])
+                if not games or not games.data:
+                    logger.warning("Game not found: %s", game_name)
+                    return False
+                game_id = self._game_ids[game_name] = games.data[0].id
 
-            game_id = games.data[0].id
             await self._twitch.modify_channel_information(
                 broadcaster_id=self._broadcaster_id, game_id=game_id
             )
@@ -7,6 +7,7 @@ import argparse
 import logging
 import sys
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
@@ -19,7 +20,7 @@ except ImportError:
     ImageDraw = None
 
 from k2deck.core.mapping_engine import MappingEngine
-from k2deck.core.midi_listener import MidiEvent, MidiListener
+from k2deck.core.midi_listener import CC, NOTE_ON, MidiEvent, MidiListener
 from k2deck.core.midi_output import MidiOutput
 from k2deck.core.throttle import FaderDebouncer, ThrottleManager
 from k2deck.feedback.led_manager import LedManager
@@ -133,6 +134,11 @@ class K2DeckApp:
         self._throttle = ThrottleManager(max_hz=30)
         self._fader_debouncer = FaderDebouncer(delay_ms=50)
         self._executor = ThreadPoolExecutor(max_workers=4)
+        # Single worker keeps encoder/fader ticks and hold press/release in
+        # arrival order (the pool above may reorder them)
+        self._ordered_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="k2deck-ordered"
+        )
 
         # State
         self._status = "Disconnected"
@@ -192,7 +198,7 @@ class K2DeckApp:
     def _on_midi_event(self, event: MidiEvent) -> None:
         """Handle incoming MIDI event."""
         # For CC events, check if this is a fader (cc_absolute)
-        if event.type == "cc":
+        if event.type == CC:
             mappings = self._mapping_engine._mappings
             cc_absolute = mappings.get("cc_absolute", {})
             is_fader = str(event.cc) in cc_absolute
@@ -234,10 +240,30 @@ class K2DeckApp:
                 )
             return
 
-        logger.info("Executing: %s", action)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing: %s", action)
+
+        # Execute action off the MIDI thread
+        self._submit_action(action, event, mapping_config)
+
+    def _submit_action(
+        self, action, event: MidiEvent, mapping_config: dict | None
+    ) -> None:
+        """Queue an action for execution on a worker thread.
 
-        # Execute action in thread pool
-        self._executor.submit(self._execute_action, action, event, mapping_config)
+        CC events and release-aware actions go to the ordered single-worker
+        lane; everything else runs in the shared pool. Actions that declare
+        a different handles_type are skipped without queuing.
+        """
+        handles_type = action.handles_type
+        if handles_type is not None and event.type != handles_type:
+            return
+
+        if event.type == CC or action.handles_release:
+            executor = self._ordered_executor
+        else:
+            executor = self._executor
+        executor.submit(self._execute_action, action, event, mapping_config)
 
     def _apply_fader_value(self, cc: int, channel: int, value: int) -> None:
         """Apply debounced fader value.
@@ -246,20 +272,19 @@ class K2DeckApp:
         """
         # Create a synthetic event for the final value
         final_event = MidiEvent(
-            type="cc",
+            type=CC,
             channel=channel,
             note=None,
             cc=cc,
             value=value,
+            timestamp=time.time(),
         )
 
         # Resolve and execute
         action, mapping_config = self._mapping_engine.resolve(final_event)
         if action:
             logger.info("Applying final fader value: cc_%d = %d", cc, value)
-            self._executor.submit(
-                self._execute_action, action, final_event, mapping_config
-            )
+            self._submit_action(action, final_event, mapping_config)
 
     def _execute_action(
         self,
@@ -274,7 +299,7 @@ class K2DeckApp:
             logger.error("Action execution error: %s", e)
 
         # Handle LED feedback
-        if mapping_config and self._led_manager and event.type == "note_on":
+        if mapping_config and self._led_manager and event.type == NOTE_ON:
             led_config = mapping_config.get("led")
             if led_config and event.note is not None:
                 self._handle_led_feedback(event.note, led_config)
@@ -347,14 +372,19 @@ class K2DeckApp:
             self._mapping_engine.load_config(self._config_path)
             self._setup_defaults()
 
-            # Reset OSC action state for clean profile switch
+            # Reset OSC and toggle hotkey state for clean profile switch
+            from k2deck.actions.hotkey import HotkeyAction
             from k2deck.actions.osc_send import (
                 OscSendRelativeAction,
                 OscSendTriggerAction,
             )
+            from k2deck.core import keyboard
 
             OscSendRelativeAction.reset_accumulators()
             OscSendTriggerAction.reset_toggle_states()
+            HotkeyAction.reset_toggle_states()
+            # Keys held by toggle hotkeys would otherwise stay down
+            keyboard.release_all_keys()
 
             logger.info("Config reloaded successfully")
         except Exception as e:
@@ -481,6 +511,7 @@ class K2DeckApp:
         if self._midi_output:
             self._midi_output.close()
         self._executor.shutdown(wait=False)
+        self._ordered_executor.shutdown(wait=False)
 
         # Close OSC sockets
         from k2deck.core.osc import OscSender
@@ -492,6 +523,11 @@ class K2DeckApp:
 
         get_timer_manager().stop_all()
 
+        # Write any debounced counter changes
+        from k2deck.core.counters import get_counter_manager
+
+        get_counter_manager().flush()
+
         logger.info("K2 Deck stopped")
         return 0
 
@@ -32,10 +32,16 @@ class TestCreateAction:
         assert create_action({"action": ""}) is None
         assert create_action({"action": None}) is None
 
+    def test_returns_none_for_non_string_action(self):
+        """Should return None, not raise, if action is not a string."""
+        assert create_action({"action": ["hotkey"]}) is None
+        assert create_action({"action": {"type": "hotkey"}}) is None
+        assert create_action({"action": 7}) is None
+
     def test_returns_none_for_unknown_action_type(self):
         """Should return None for unregistered action type."""
-        # ACTION_TYPES is imported lazily inside the function from mapping_engine
-        with patch("k2deck.core.mapping_engine.ACTION_TYPES", {}):
+        # ACTION_TYPES is bound from mapping_engine on first use
+        with patch("k2deck.core.action_factory._action_types", {}):
             assert create_action({"action": "nonexistent"}) is None
 
     def test_raises_on_depth_exceeded(self):
@@ -50,7 +56,7 @@ class TestCreateAction:
         mock_class.return_value = mock_instance
 
         with patch(
-            "k2deck.core.mapping_engine.ACTION_TYPES",
+            "k2deck.core.action_factory._action_types",
             {"hotkey": mock_class},
         ):
             result = create_action({"action": "hotkey", "keys": ["f1"]})
@@ -65,7 +71,7 @@ class TestCreateAction:
         mock_class = MagicMock()
 
         with patch(
-            "k2deck.core.mapping_engine.ACTION_TYPES",
+            "k2deck.core.action_factory._action_types",
             {"hotkey": mock_class},
         ):
             create_action({"action": "hotkey"}, depth=2)
@@ -73,12 +79,27 @@ class TestCreateAction:
         call_args = mock_class.call_args[0][0]
         assert call_args["_depth"] == 2
 
+    def test_passes_config_unchanged_to_leaf_actions(self):
+        """Actions that don't nest others should get the caller's dict."""
+        mock_class = MagicMock()
+        mock_class.nests_actions = False
+        config = {"action": "hotkey"}
+
+        with patch(
+            "k2deck.core.action_factory._action_types",
+            {"hotkey": mock_class},
+        ):
+            create_action(config, depth=2)
+
+        assert mock_class.call_args[0][0] is config
+        assert "_depth" not in config
+
     def test_returns_none_on_action_init_exception(self):
         """Should return None if action constructor raises."""
         mock_class = MagicMock(side_effect=ValueError("bad config"))
 
         with patch(
-            "k2deck.core.mapping_engine.ACTION_TYPES",
+            "k2deck.core.action_factory._action_types",
             {"hotkey": mock_class},
         ):
             result = create_action({"action": "hotkey"})
@@ -94,7 +115,7 @@ class TestCreateActions:
         mock_class = MagicMock()
 
         with patch(
-            "k2deck.core.mapping_engine.ACTION_TYPES",
+            "k2deck.core.action_factory._action_types",
             {"hotkey": mock_class},
         ):
             configs = [
@@ -110,7 +131,7 @@ class TestCreateActions:
         mock_class = MagicMock()
 
         with patch(
-            "k2deck.core.mapping_engine.ACTION_TYPES",
+            "k2deck.core.action_factory._action_types",
             {"hotkey": mock_class},
         ):
             configs = [
@@ -133,7 +154,7 @@ class TestCreateActions:
         mock_class = MagicMock()
 
         with patch(
-            "k2deck.core.mapping_engine.ACTION_TYPES",
+            "k2deck.core.action_factory._action_types",
             {"hotkey": mock_class},
         ):
             create_actions([{"action": "hotkey"}], depth=2)
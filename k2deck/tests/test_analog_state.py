@@ -2,10 +2,15 @@
 
 import json
 import tempfile
+import time
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from k2deck.core.analog_state import AnalogStateManager, get_analog_state_manager
+from k2deck.core.analog_state import (
+    AnalogStateManager,
+    _empty_positions,
+    get_analog_state_manager,
+)
 
 
 class TestAnalogStateManager:
@@ -31,8 +36,8 @@ class TestAnalogStateManager:
         AnalogStateManager._instance = None
         manager = AnalogStateManager()
         manager.configure(self.state_file)
-        manager._positions = {}  # Clear any loaded state
-        manager._callbacks = []  # Clear any callbacks
+        manager._positions = _empty_positions()  # Clear any loaded state
+        manager._callbacks = ()  # Clear any callbacks
         return manager
 
     def test_singleton_pattern(self):
@@ -144,6 +149,21 @@ class TestAnalogStateManager:
         bad_callback.assert_called_once()
         good_callback.assert_called_once()
 
+    def test_unregister_during_dispatch_keeps_others(self):
+        """A callback removing itself mid-dispatch should not skip the next."""
+        manager = self._get_fresh_manager()
+        other_callback = MagicMock()
+
+        def one_shot(cc: int, value: int) -> None:
+            manager.unregister_callback(one_shot)
+
+        manager.register_callback(one_shot)
+        manager.register_callback(other_callback)
+        manager.update(16, 64)
+
+        other_callback.assert_called_once_with(16, 64)
+        assert manager._callbacks == (other_callback,)
+
     def test_reset_clears_positions(self):
         """Should clear all positions on reset."""
         manager = self._get_fresh_manager()
@@ -185,6 +205,44 @@ class TestAnalogStateManager:
             assert manager2.get(16) == 50
             assert manager2.get(17) == 100
 
+    def test_save_skipped_when_unchanged(self):
+        """Should not rewrite the file if no position changed."""
+        manager = self._get_fresh_manager()
+        manager.update(16, 50)
+        assert self.state_file.exists()
+
+        self.state_file.unlink()
+        manager._do_save()
+
+        assert not self.state_file.exists()
+
+    def test_save_replaces_file_atomically(self):
+        """Should write through a temp file and leave no temp behind."""
+        manager = self._get_fresh_manager()
+        manager.update(16, 50)
+
+        assert json.loads(self.state_file.read_text()) == {"16": 50}
+        assert list(Path(self.tmp_dir).iterdir()) == [self.state_file]
+
+    def test_save_recreates_directory_after_failed_write(self):
+        """The directory is only created once, but re-checked after an error."""
+        import shutil
+
+        self.state_file = Path(self.tmp_dir) / "state" / "analog_state.json"
+        manager = self._get_fresh_manager()
+        manager.update(16, 50)
+        assert manager._dir_ensured
+
+        shutil.rmtree(self.state_file.parent)
+        manager._positions[16] = 60
+        manager._dirty = True
+        manager._do_save()  # directory is gone: write fails, flag resets
+        assert not manager._dir_ensured
+
+        manager._dirty = True
+        manager._do_save()
+        assert json.loads(self.state_file.read_text()) == {"16": 60}
+
     def test_configure_changes_state_file(self):
         """Should allow changing state file location."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -206,7 +264,7 @@ class TestAnalogStateManager:
             AnalogStateManager._instance = None
             manager = AnalogStateManager()
             # Clear positions that might have loaded from default location
-            manager._positions = {}
+            manager._positions = _empty_positions()
             # Now configure with nonexistent file
             manager.configure(state_file)
 
@@ -226,6 +284,17 @@ class TestAnalogStateManager:
             # Should start with empty positions
             assert manager.get_all() == {}
 
+    def test_load_skips_out_of_range_entries(self):
+        """Should ignore CC numbers or values outside 0-127."""
+        self.state_file.write_text(json.dumps({"16": 50, "200": 1, "-1": 5, "17": 300}))
+
+        AnalogStateManager._instance = None
+        manager = AnalogStateManager()
+        manager.configure(self.state_file)
+
+        assert manager.get_all() == {16: 50}
+        assert manager.get(127) == 0
+
     def test_save_debounce(self):
         """Should debounce rapid saves by scheduling timer."""
         manager = self._get_fresh_manager()
@@ -252,6 +321,41 @@ class TestAnalogStateManager:
         # Should have only 1 save so far (debounced)
         assert save_count[0] == 1, "Rapid updates should be debounced"
 
+    def test_update_skips_scheduling_while_save_pending(self):
+        """Updates during a pending delayed save should not reschedule it."""
+        manager = self._get_fresh_manager()
+        manager.update(16, 10)  # immediate save
+        manager.update(16, 11)  # schedules the delayed save
+        assert manager._pending_save
+
+        with patch.object(manager, "_save") as mock_save:
+            for i in range(5):
+                manager.update(16, 20 + i)
+
+        mock_save.assert_not_called()
+        assert manager._dirty
+        manager._pending_save = False  # cancel the delayed save
+
+    def test_delayed_saves_share_one_worker(self):
+        """Each burst's trailing save should be written by the same thread."""
+        manager = self._get_fresh_manager()
+
+        with patch("k2deck.core.analog_state.SAVE_DEBOUNCE_SECONDS", 0.05):
+            workers = []
+            for burst in range(2):
+                manager.update(16, 10 + burst * 10)
+                manager.update(16, 11 + burst * 10)  # delayed save
+                workers.append(manager._save_thread)
+
+                deadline = time.time() + 2
+                while manager._pending_save and time.time() < deadline:
+                    time.sleep(0.01)
+                assert not manager._pending_save
+                time.sleep(0.06)  # let the debounce window close
+
+        assert workers[0] is workers[1]
+        assert json.loads(self.state_file.read_text()) == {"16": 21}
+
 
 class TestAnalogStateIntegration:
     """Integration tests for analog state with other components."""
@@ -275,8 +379,8 @@ class TestAnalogStateIntegration:
         AnalogStateManager._instance = None
         manager = AnalogStateManager()
         manager.configure(self.state_file)
-        manager._positions = {}
-        manager._callbacks = []
+        manager._positions = _empty_positions()
+        manager._callbacks = ()
         return manager
 
     def test_callback_receives_correct_values(self):
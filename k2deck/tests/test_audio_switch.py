@@ -1,10 +1,16 @@
 """Tests for audio_switch.py and audio_devices.py - Audio device switching."""
 
 from dataclasses import dataclass
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from k2deck.actions.audio_switch import AudioListAction, AudioSwitchAction
-from k2deck.core.audio_devices import AudioDevice, cycle_audio_devices
+from k2deck.core import audio_devices
+from k2deck.core.audio_devices import (
+    AudioDevice,
+    cycle_audio_devices,
+    get_audio_devices,
+    invalidate_device_cache,
+)
 
 
 @dataclass
@@ -32,6 +38,183 @@ class TestAudioDevice:
         assert device.is_default is True
 
 
+class TestDeviceCache:
+    """Test get_audio_devices caching."""
+
+    def setup_method(self):
+        invalidate_device_cache()
+
+    def teardown_method(self):
+        invalidate_device_cache()
+
+    @patch("k2deck.core.audio_devices._enumerate_audio_devices")
+    def test_second_call_uses_cache(self, mock_enum):
+        """Should enumerate once within the TTL."""
+        mock_enum.return_value = [
+            AudioDevice(id="id1", name="Speakers", is_default=True)
+        ]
+
+        first = get_audio_devices("output")
+        second = get_audio_devices("output")
+
+        assert first == second
+        mock_enum.assert_called_once_with("output")
+
+    @patch("k2deck.core.audio_devices._enumerate_audio_devices")
+    def test_cache_is_per_device_type(self, mock_enum):
+        """Output and input lists should be cached separately."""
+        mock_enum.return_value = [AudioDevice(id="id1", name="Mic", is_default=True)]
+
+        get_audio_devices("output")
+        get_audio_devices("input")
+
+        assert mock_enum.call_count == 2
+
+    @patch("k2deck.core.audio_devices._enumerate_audio_devices")
+    def test_dirty_flag_forces_refresh(self, mock_enum):
+        """A device-change notification should invalidate the cache."""
+        mock_enum.return_value = [
+            AudioDevice(id="id1", name="Speakers", is_default=True)
+        ]
+
+        get_audio_devices("output")
+        audio_devices._mark_dirty()
+        get_audio_devices("output")
+
+        assert mock_enum.call_count == 2
+
+    @patch("k2deck.core.audio_devices._enumerate_audio_devices")
+    def test_ttl_expiry_forces_refresh(self, mock_enum):
+        """Should re-enumerate after the TTL expires."""
+        mock_enum.return_value = [
+            AudioDevice(id="id1", name="Speakers", is_default=True)
+        ]
+
+        with patch("k2deck.core.audio_devices.time.monotonic", return_value=100.0):
+            get_audio_devices("output")
+        with patch("k2deck.core.audio_devices.time.monotonic", return_value=106.0):
+            get_audio_devices("output")
+
+        assert mock_enum.call_count == 2
+
+    @patch("k2deck.core.audio_devices._enumerate_audio_devices")
+    def test_empty_result_not_cached(self, mock_enum):
+        """A failed enumeration should not be cached."""
+        mock_enum.return_value = []
+
+        get_audio_devices("output")
+        get_audio_devices("output")
+
+        assert mock_enum.call_count == 2
+
+
+class TestDeviceEnumerator:
+    """Test reuse of the shared IMMDeviceEnumerator."""
+
+    def setup_method(self):
+        audio_devices._device_enumerator = None
+        audio_devices._notification_client = None
+
+    def teardown_method(self):
+        self.setup_method()
+
+    @patch("k2deck.core.audio_devices._register_device_notifications")
+    @patch("k2deck.core.audio_devices.comtypes.CoCreateInstance")
+    def test_enumerator_created_once(self, mock_create, mock_register):
+        """Repeated enumerations should reuse one enumerator."""
+        enumerator = mock_create.return_value
+        enumerator.EnumAudioEndpoints.return_value.GetCount.return_value = 0
+
+        audio_devices._enumerate_audio_devices("output")
+        audio_devices._enumerate_audio_devices("input")
+
+        mock_create.assert_called_once()
+        mock_register.assert_called_once_with(enumerator)
+
+    @patch("k2deck.core.audio_devices.AudioUtilities")
+    @patch("k2deck.core.audio_devices._register_device_notifications")
+    @patch("k2deck.core.audio_devices.comtypes.CoCreateInstance")
+    def test_enumerator_dropped_on_failure(self, mock_create, mock_register, _):
+        """A failing enumerator should be recreated on the next call."""
+        mock_create.return_value.GetDefaultAudioEndpoint.side_effect = OSError
+
+        audio_devices._enumerate_audio_devices("output")
+        assert audio_devices._device_enumerator is None
+
+        audio_devices._enumerate_audio_devices("output")
+        assert mock_create.call_count == 2
+
+
+class TestSetDefaultAudioDevice:
+    """Test set_default_audio_device's IPolicyConfig reuse."""
+
+    def setup_method(self):
+        audio_devices._policy_config = None
+        self._defaults = {}
+        self._default_patch = patch(
+            "k2deck.core.audio_devices._get_default_device_id",
+            side_effect=lambda flow, role: self._defaults.get((flow, role)),
+        )
+        self._default_patch.start()
+
+    def teardown_method(self):
+        self._default_patch.stop()
+        audio_devices._policy_config = None
+        invalidate_device_cache()
+
+    @patch("k2deck.core.audio_devices.comtypes")
+    def test_policy_config_created_once(self, mock_comtypes):
+        """Switches should share one IPolicyConfig and set all three roles."""
+        policy_config = mock_comtypes.CoCreateInstance.return_value
+
+        assert audio_devices.set_default_audio_device("dev-1") is True
+        assert audio_devices.set_default_audio_device("dev-2") is True
+
+        mock_comtypes.CoCreateInstance.assert_called_once()
+        assert policy_config.SetDefaultEndpoint.call_count == 6
+
+    @patch("k2deck.core.audio_devices.comtypes")
+    def test_stale_policy_config_retried_once(self, mock_comtypes):
+        """A failing cached instance should be replaced and the call retried."""
+        stale, fresh = MagicMock(), MagicMock()
+        stale.SetDefaultEndpoint.side_effect = OSError("RPC server unavailable")
+        mock_comtypes.CoCreateInstance.side_effect = [stale, fresh]
+
+        assert audio_devices.set_default_audio_device("dev-1", role=0) is True
+
+        fresh.SetDefaultEndpoint.assert_called_once_with("dev-1", 0)
+        assert audio_devices._policy_config is fresh
+
+    @patch("k2deck.core.audio_devices.comtypes")
+    def test_skips_com_when_already_default(self, mock_comtypes):
+        """Re-selecting the default for every role should make no COM call."""
+        self._defaults = {(0, r): "dev-1" for r in (0, 1, 2)}
+
+        assert audio_devices.set_default_audio_device("dev-1") is True
+
+        mock_comtypes.CoCreateInstance.assert_not_called()
+
+    @patch("k2deck.core.audio_devices.comtypes")
+    def test_sets_only_roles_not_already_default(self, mock_comtypes):
+        """Only roles whose default differs should be switched."""
+        policy_config = mock_comtypes.CoCreateInstance.return_value
+        self._defaults = {(0, 0): "dev-1", (0, 1): "dev-1", (0, 2): "headset"}
+
+        assert audio_devices.set_default_audio_device("dev-1") is True
+
+        policy_config.SetDefaultEndpoint.assert_called_once_with("dev-1", 2)
+
+    @patch("k2deck.core.audio_devices.comtypes")
+    def test_input_devices_checked_against_capture_flow(self, mock_comtypes):
+        """An input device should be compared with the capture defaults."""
+        policy_config = mock_comtypes.CoCreateInstance.return_value
+        self._defaults = {(0, r): "mic-1" for r in (0, 1, 2)}
+
+        audio_devices.set_default_audio_device("mic-1", device_type="input")
+
+        assert policy_config.SetDefaultEndpoint.call_count == 3
+
+
 class TestCycleAudioDevices:
     """Test cycle_audio_devices function."""
 
@@ -48,7 +231,7 @@ class TestCycleAudioDevices:
         result = cycle_audio_devices(["Speakers", "Headphones"])
 
         assert result == "Headphones"
-        mock_set.assert_called_once_with("id2")
+        mock_set.assert_called_once_with("id2", device_type="output")
 
     @patch("k2deck.core.audio_devices.get_audio_devices")
     @patch("k2deck.core.audio_devices.set_default_audio_device")
@@ -63,7 +246,37 @@ class TestCycleAudioDevices:
         result = cycle_audio_devices(["Speakers", "Headphones"])
 
         assert result == "Speakers"
-        mock_set.assert_called_once_with("id1")
+        mock_set.assert_called_once_with("id1", device_type="output")
+
+    @patch("k2deck.core.audio_devices.get_audio_devices")
+    @patch("k2deck.core.audio_devices.set_default_audio_device")
+    def test_matching_is_case_insensitive(self, mock_set, mock_get):
+        """Patterns should match device names regardless of case."""
+        mock_get.return_value = [
+            AudioDevice(id="id1", name="Realtek Speakers", is_default=True),
+            AudioDevice(id="id2", name="USB HEADPHONES", is_default=False),
+        ]
+        mock_set.return_value = True
+
+        result = cycle_audio_devices(["SPEAKERS", "headphones"])
+
+        assert result == "USB HEADPHONES"
+        mock_set.assert_called_once_with("id2", device_type="output")
+
+    @patch("k2deck.core.audio_devices.get_audio_devices")
+    @patch("k2deck.core.audio_devices.set_default_audio_device")
+    def test_lowered_patterns_used_as_is(self, mock_set, mock_get):
+        """Pre-lowered patterns should still match mixed-case device names."""
+        mock_get.return_value = [
+            AudioDevice(id="id1", name="Realtek Speakers", is_default=True),
+            AudioDevice(id="id2", name="USB HEADPHONES", is_default=False),
+        ]
+        mock_set.return_value = True
+
+        result = cycle_audio_devices(("speakers", "headphones"), lowered=True)
+
+        assert result == "USB HEADPHONES"
+        mock_set.assert_called_once_with("id2", device_type="output")
 
     @patch("k2deck.core.audio_devices.get_audio_devices")
     def test_returns_none_if_no_devices(self, mock_get):
@@ -135,7 +348,7 @@ class TestAudioSwitchAction:
 
         action.execute(event)
 
-        mock_switch.assert_called_once_with("Headphones", "output")
+        mock_switch.assert_called_once_with("headphones", "output", lowered=True)
 
     @patch("k2deck.actions.audio_switch.cycle_audio_devices")
     def test_multiple_devices_cycles(self, mock_cycle):
@@ -151,7 +364,9 @@ class TestAudioSwitchAction:
 
         action.execute(event)
 
-        mock_cycle.assert_called_once_with(["Speakers", "Headphones"], "output")
+        mock_cycle.assert_called_once_with(
+            ("speakers", "headphones"), "output", lowered=True
+        )
 
     def test_default_type_is_output(self):
         """Should default to output device type."""
@@ -37,25 +37,25 @@ class TestEnableAutostart:
     def test_vbs_contains_wscript_shell(self, tmp_path):
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart()
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert 'CreateObject("WScript.Shell")' in content
 
     def test_vbs_contains_python_executable(self, tmp_path):
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart()
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert sys.executable in content
 
     def test_vbs_hidden_window_style(self, tmp_path):
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart()
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert ", 0, False" in content
 
     def test_vbs_contains_k2deck_module(self, tmp_path):
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart()
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert "k2deck" in content
             assert "-m" in content
 
@@ -63,28 +63,28 @@ class TestEnableAutostart:
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             config = Path("C:/my/config.json")
             enable_autostart(config_path=config)
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert "--config" in content
             assert str(config) in content
 
     def test_includes_device_arg(self, tmp_path):
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart(device_name="MY_K2")
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert "--device" in content
             assert "MY_K2" in content
 
     def test_includes_debug_flag(self, tmp_path):
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart(debug=True)
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert "--debug" in content
 
     def test_default_args_minimal(self, tmp_path):
         """Default invocation omits optional args."""
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart()
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert "--config" not in content
             assert "--device" not in content
             assert "--debug" not in content
@@ -98,15 +98,22 @@ class TestEnableAutostart:
         ):
             mock_sys.executable = spaced_path
             enable_autostart()
-            content = (tmp_path / STARTUP_FILENAME).read_text()
-            # Path should be in the VBS wrapped with chr(34)
-            assert "Program Files" in content
-            assert "chr(34)" in content
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
+            # Path should be quoted inside the single VBS string literal
+            assert f'WshShell.Run """{spaced_path}"" -m k2deck"' in content
+
+    def test_vbs_written_as_utf16_with_bom(self, tmp_path):
+        """WSH only reads non-ANSI scripts correctly with a BOM."""
+        with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
+            enable_autostart(device_name="K2_ñ")
+            raw = (tmp_path / STARTUP_FILENAME).read_bytes()
+            assert raw.startswith(b"\xff\xfe")
+            assert "K2_ñ" in raw[2:].decode("utf-16-le")
 
     def test_sets_current_directory(self, tmp_path):
         with patch("k2deck.core.autostart.STARTUP_DIR", tmp_path):
             enable_autostart()
-            content = (tmp_path / STARTUP_FILENAME).read_text()
+            content = (tmp_path / STARTUP_FILENAME).read_text(encoding="utf-16")
             assert "CurrentDirectory" in content
 
 
@@ -1,18 +1,19 @@
 """Tests for conditional.py - Context-aware conditional actions."""
 
+import time
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from k2deck.actions.conditional import ConditionalAction
-from k2deck.actions.multi import MultiToggleAction, _toggle_states
+from k2deck.actions.multi import MultiToggleAction
 from k2deck.core.action_factory import (
     MAX_ACTION_DEPTH,
     ActionCreationError,
     create_action,
 )
-from k2deck.core.context import ContextCache
+from k2deck.core.context import AppInfo, ContextCache, _list_processes
 
 
 @dataclass
@@ -32,7 +33,7 @@ class TestContextCache:
 
     def setup_method(self):
         """Reset state before each test."""
-        _toggle_states.clear()
+        MultiToggleAction.reset_all()
 
     @patch("k2deck.core.context.win32gui")
     @patch("k2deck.core.context.win32process")
@@ -58,6 +59,44 @@ class TestContextCache:
         assert result.pid == 1234
         assert result.hwnd == 12345
 
+    @patch("k2deck.core.context.win32gui")
+    @patch("k2deck.core.context.time")
+    def test_refresh_reads_clock_once(self, mock_time, mock_gui):
+        """A refreshing access should stamp the time it already read."""
+        mock_time.monotonic.return_value = 100.0
+        mock_gui.GetForegroundWindow.return_value = 0
+
+        cache = ContextCache(refresh_interval=0.1)
+        assert cache.get_foreground_app() is None
+
+        mock_time.monotonic.assert_called_once()
+        assert cache._last_refresh == 100.0
+
+    def test_fresh_foreground_read_takes_no_lock(self):
+        """A cached value within the interval should be returned lock-free."""
+        cache = ContextCache(refresh_interval=60)
+        app = AppInfo(name="Spotify.exe", title="", pid=1, hwnd=2)
+        cache._foreground_app = app
+        cache._last_refresh = time.monotonic()
+        cache._foreground_lock = MagicMock()
+
+        assert cache.get_foreground_app() is app
+        cache._foreground_lock.acquire.assert_not_called()
+
+    def test_stale_read_returns_previous_during_refresh(self):
+        """Callers should not wait behind another thread's refresh."""
+        cache = ContextCache(refresh_interval=0.01)
+        app = AppInfo(name="Spotify.exe", title="", pid=1, hwnd=2)
+        cache._foreground_app = app
+        cache._last_refresh = time.monotonic() - 1
+
+        with (
+            cache._foreground_lock,  # another thread is refreshing
+            patch.object(cache, "_refresh_foreground") as mock_refresh,
+        ):
+            assert cache.get_foreground_app() is app
+        mock_refresh.assert_not_called()
+
     @patch("k2deck.core.context.win32gui")
     @patch("k2deck.core.context.win32process")
     @patch("k2deck.core.context.psutil")
@@ -95,16 +134,10 @@ class TestContextCache:
         assert cache.is_app_focused("spot") is True
         assert cache.is_app_focused("chrome") is False
 
-    @patch("k2deck.core.context.psutil")
-    def test_is_app_running(self, mock_psutil):
+    @patch("k2deck.core.context._list_processes")
+    def test_is_app_running(self, mock_list):
         """Should detect running applications."""
-        # Create mock process iterator
-        mock_proc1 = MagicMock()
-        mock_proc1.info = {"pid": 1234, "name": "Spotify.exe"}
-        mock_proc2 = MagicMock()
-        mock_proc2.info = {"pid": 5678, "name": "chrome.exe"}
-
-        mock_psutil.process_iter.return_value = [mock_proc1, mock_proc2]
+        mock_list.return_value = [(1234, "Spotify.exe"), (5678, "chrome.exe")]
 
         cache = ContextCache(refresh_interval=0)
 
@@ -112,6 +145,35 @@ class TestContextCache:
         assert cache.is_app_running("chrome") is True
         assert cache.is_app_running("firefox") is False
 
+    @patch("k2deck.core.context._list_processes")
+    def test_is_app_running_does_not_match_across_names(self, mock_list):
+        """Partial matches should stay within a single process name."""
+        mock_list.return_value = [(1234, "Spotify.exe"), (5678, "chrome.exe")]
+
+        cache = ContextCache()
+
+        assert cache.is_app_running("spotify.exe") is True
+        assert cache.is_app_running("exe|chrome") is False
+        assert cache.is_app_running("exechrome") is False
+
+    def test_list_processes_walks_snapshot(self):
+        """Should read every snapshot entry and close the snapshot handle."""
+        entries = iter([(4, "System"), (1234, "Spotify.exe")])
+
+        def fill_entry(snapshot, entry_ref):
+            entry = next(entries, None)
+            if entry is None:
+                return False
+            entry_ref._obj.th32ProcessID, entry_ref._obj.szExeFile = entry
+            return True
+
+        close_handle = MagicMock()
+        toolhelp = (MagicMock(return_value=42), fill_entry, fill_entry, close_handle)
+        with patch("k2deck.core.context._get_toolhelp", return_value=toolhelp):
+            assert _list_processes() == [(4, "System"), (1234, "Spotify.exe")]
+
+        close_handle.assert_called_once_with(42)
+
 
 class TestActionFactory:
     """Test action factory functions."""
@@ -152,7 +214,7 @@ class TestConditionalAction:
 
     def setup_method(self):
         """Reset state before each test."""
-        _toggle_states.clear()
+        MultiToggleAction.reset_all()
 
     @patch("k2deck.actions.conditional.is_app_focused")
     def test_executes_matching_condition(self, mock_focused):
@@ -279,7 +341,7 @@ class TestConditionalAction:
     def test_toggle_state_condition_false(self):
         """Should check toggle state condition (false)."""
         # Toggle 42 is False by default
-        _toggle_states.clear()
+        MultiToggleAction.reset_all()
 
         action = ConditionalAction(
             {
@@ -328,6 +390,22 @@ class TestConditionalAction:
         )
         assert result is True
 
+    @patch("k2deck.actions.conditional.is_app_focused")
+    @patch("k2deck.actions.conditional.is_app_running")
+    def test_compiled_condition_short_circuits(self, mock_running, mock_focused):
+        """Compiled predicate should stop at the first failing check."""
+        mock_focused.return_value = False
+        mock_running.return_value = True
+
+        action = ConditionalAction({"conditions": []})
+        predicate = action._compile_condition(
+            {"app_focused": "Spotify.exe", "app_running": "OBS.exe"}
+        )
+
+        assert predicate() is False
+        mock_focused.assert_called_once_with("Spotify.exe")
+        mock_running.assert_not_called()
+
     def test_empty_condition_always_matches(self):
         """Empty condition should always match."""
         action = ConditionalAction({"conditions": []})
@@ -335,6 +413,49 @@ class TestConditionalAction:
         result = action._check_condition({})
         assert result is True
 
+    @patch("k2deck.actions.conditional.is_app_focused")
+    @patch("k2deck.actions.conditional.create_action")
+    def test_then_actions_created_once(self, mock_create, mock_focused):
+        """Then-actions should be created at init, not per event."""
+        mock_focused.return_value = True
+        mock_create.return_value = MagicMock()
+
+        action = ConditionalAction(
+            {"conditions": [{"app_focused": "Spotify.exe", "then": {"action": "noop"}}]}
+        )
+        assert mock_create.call_count == 1
+
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+        action.execute(event)
+        action.execute(event)
+
+        assert mock_create.call_count == 1
+        assert mock_create.return_value.execute.call_count == 2
+
+    @patch("k2deck.actions.conditional.is_app_focused")
+    def test_description_not_built_without_debug(self, mock_focused, caplog):
+        """Condition description should only be built for emitted records."""
+        mock_focused.return_value = True
+        action = ConditionalAction(
+            {"conditions": [{"app_focused": "Spotify.exe", "then": {"action": "noop"}}]}
+        )
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+
+        with patch.object(
+            ConditionalAction, "_describe_condition", return_value="desc"
+        ) as mock_describe:
+            caplog.set_level("INFO", logger="k2deck.actions.conditional")
+            action.execute(event)
+            mock_describe.assert_not_called()
+
+            caplog.set_level("DEBUG", logger="k2deck.actions.conditional")
+            action.execute(event)
+            assert mock_describe.called
+
     def test_depth_limit_prevents_execution(self):
         """Should not execute if at max depth."""
         action = ConditionalAction(
@@ -354,7 +475,7 @@ class TestConditionalActionIntegration:
 
     def setup_method(self):
         """Reset state before each test."""
-        _toggle_states.clear()
+        MultiToggleAction.reset_all()
 
     @patch("k2deck.actions.conditional.is_app_focused")
     @patch("k2deck.core.keyboard.execute_hotkey")
@@ -380,7 +501,7 @@ class TestConditionalActionIntegration:
 
         mock_hotkey.assert_called_once()
         call_args = mock_hotkey.call_args[0][0]
-        assert call_args == ["space"]
+        assert call_args == ("space",)
 
     @patch("k2deck.actions.conditional.is_app_focused")
     def test_nested_conditional_respects_depth(self, mock_focused):
@@ -167,6 +167,34 @@ class TestCounterManager:
             if temp_file.exists():
                 temp_file.unlink()
 
+    def test_rapid_changes_are_coalesced(self):
+        """Bursts should write once immediately and once on flush."""
+        temp_file = get_temp_file()
+        try:
+            with patch.object(CounterManager, "COUNTERS_FILE", temp_file):
+                mgr = CounterManager()
+                with patch.object(mgr, "_do_save", wraps=mgr._do_save) as mock_save:
+                    for _ in range(10):
+                        mgr.increment("burst")
+                    assert mock_save.call_count == 1
+
+                    mgr.flush()
+                    assert mock_save.call_count == 2
+
+                assert temp_file.read_text() == '{"burst":10}'
+                assert not temp_file.with_suffix(".json.tmp").exists()
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+    def test_flush_without_pending_is_noop(self):
+        """flush() should not write when nothing is pending."""
+        temp_file = get_temp_file()
+        with patch.object(CounterManager, "COUNTERS_FILE", temp_file):
+            mgr = CounterManager()
+            mgr.flush()
+            assert not temp_file.exists()
+
 
 class TestCounterAction:
     """Test CounterAction class."""
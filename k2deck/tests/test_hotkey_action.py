@@ -1,10 +1,13 @@
 """Tests for hotkey action."""
 
+import threading
 from unittest.mock import patch
 
 from k2deck.actions.hotkey import (
     HotkeyAction,
     HotkeyRelativeAction,
+    _focus_target_app,
+    execute_hotkey,
 )
 from k2deck.core.midi_listener import MidiEvent
 
@@ -28,7 +31,7 @@ class TestHotkeyAction:
                 timestamp=0.0,
             )
             action.execute(event)
-            mock.assert_called_once_with(["a"])
+            mock.assert_called_once_with(("a",))
 
     def test_ignores_note_off(self):
         """Should ignore Note Off events."""
@@ -97,6 +100,121 @@ class TestHotkeyAction:
             action.execute(release_event)
             mock_release.assert_called_once_with("v")
 
+    def test_hold_mode_releases_on_note_off(self):
+        """Should release held keys on a note_off event."""
+        config = {"name": "Test", "action": "hotkey", "keys": ["v"], "mode": "hold"}
+        action = HotkeyAction(config)
+        assert action.handles_release is True
+
+        with patch("k2deck.core.keyboard.release_key") as mock_release:
+            event = MidiEvent(
+                type="note_off",
+                channel=16,
+                note=36,
+                cc=None,
+                value=0,
+                timestamp=0.1,
+            )
+            action.execute(event)
+            mock_release.assert_called_once_with("v")
+
+    def test_tap_mode_does_not_handle_release(self):
+        """Tap mode should not opt in to release events."""
+        action = HotkeyAction({"name": "Test", "action": "hotkey", "keys": ["a"]})
+        assert action.handles_release is False
+
+    def test_toggle_mode_alternates_press_and_release(self):
+        """Toggle mode should hold on first press and release on the second."""
+        HotkeyAction.reset_toggle_states()
+        config = {"name": "Test", "action": "hotkey", "keys": ["v"], "mode": "toggle"}
+        action = HotkeyAction(config)
+        event = MidiEvent(
+            type="note_on", channel=16, note=40, cc=None, value=127, timestamp=0.0
+        )
+
+        with (
+            patch("k2deck.core.keyboard.press_key") as mock_press,
+            patch("k2deck.core.keyboard.release_key") as mock_release,
+        ):
+            action.execute(event)
+            mock_press.assert_called_once_with("v")
+            mock_release.assert_not_called()
+            assert HotkeyAction._toggle_states == 1 << 40
+
+            action.execute(event)
+            mock_release.assert_called_once_with("v")
+            assert HotkeyAction._toggle_states == 0
+
+    def test_concurrent_toggles_on_different_notes_keep_their_bits(self):
+        """Toggles racing on different notes must not drop each other's state."""
+        HotkeyAction.reset_toggle_states()
+        action = HotkeyAction(
+            {"name": "Test", "action": "hotkey", "keys": ["v"], "mode": "toggle"}
+        )
+
+        def press_many(note):
+            event = MidiEvent(
+                type="note_on", channel=16, note=note, cc=None, value=127, timestamp=0.0
+            )
+            for _ in range(201):
+                action.execute(event)
+
+        with (
+            patch("k2deck.core.keyboard.press_key"),
+            patch("k2deck.core.keyboard.release_key"),
+        ):
+            threads = [
+                threading.Thread(target=press_many, args=(note,))
+                for note in (36, 37, 38, 39)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        # 201 flips per note is odd, so every note ends up held
+        assert HotkeyAction._toggle_states == 0b1111 << 36
+        HotkeyAction.reset_toggle_states()
+
+    def test_instances_have_no_dict(self):
+        """Action attributes should live in slots, not a per-instance dict."""
+        action = HotkeyAction({"name": "Test", "action": "hotkey", "keys": ["a"]})
+        assert not hasattr(action, "__dict__")
+
+
+class TestExecuteHotkey:
+    """Tests for the execute_hotkey wrapper."""
+
+    def test_releases_all_modifiers_after_hotkey(self):
+        """Every hotkey should clear all modifiers, even ones it didn't use."""
+        with (
+            patch("k2deck.core.keyboard.execute_hotkey"),
+            patch("k2deck.core.keyboard.release_all_modifiers") as mock_release,
+        ):
+            execute_hotkey(["f5"])
+            mock_release.assert_called_once()
+
+    def test_chords_keep_gap_between_presses(self):
+        """Only single keys are batched; chords keep the 10ms gap."""
+        with (
+            patch("k2deck.core.keyboard.execute_hotkey") as mock_exec,
+            patch("k2deck.core.keyboard.release_all_modifiers"),
+        ):
+            execute_hotkey(("f5",))
+            execute_hotkey(("ctrl", "c"))
+
+        assert mock_exec.call_args_list[0].kwargs["between_ms"] == 0
+        assert mock_exec.call_args_list[1].kwargs["between_ms"] == 10
+
+    def test_release_after_false_keeps_modifiers(self):
+        """release_after=False should skip the safety release."""
+        with (
+            patch("k2deck.core.keyboard.execute_hotkey"),
+            patch("k2deck.core.keyboard.release_all_modifiers") as mock_release,
+        ):
+            execute_hotkey(["ctrl", "c"], release_after=False)
+            mock_release.assert_not_called()
+
 
 class TestHotkeyRelativeAction:
     """Tests for HotkeyRelativeAction."""
@@ -121,7 +239,7 @@ class TestHotkeyRelativeAction:
                 timestamp=0.0,
             )
             action.execute(event)
-            mock.assert_called_once_with(["ctrl", "tab"])
+            mock.assert_called_once_with(("ctrl", "tab"))
 
     def test_ccw_triggers_ccw_keys(self):
         """Should execute CCW keys on counter-clockwise turn."""
@@ -143,7 +261,7 @@ class TestHotkeyRelativeAction:
                 timestamp=0.0,
             )
             action.execute(event)
-            mock.assert_called_once_with(["ctrl", "shift", "tab"])
+            mock.assert_called_once_with(("ctrl", "shift", "tab"))
 
     def test_ignores_non_cc_events(self):
         """Should ignore non-CC events."""
@@ -166,3 +284,102 @@ class TestHotkeyRelativeAction:
             )
             action.execute(event)
             mock.assert_not_called()
+
+    def test_center_values_ignored(self):
+        """Values 0 and 64 carry no direction and should be ignored."""
+        config = {
+            "name": "Test",
+            "action": "hotkey_relative",
+            "cw": ["a"],
+            "ccw": ["b"],
+        }
+        action = HotkeyRelativeAction(config)
+
+        with patch("k2deck.actions.hotkey.execute_hotkey") as mock:
+            for value in (0, 64):
+                event = MidiEvent(
+                    type="cc", channel=16, note=None, cc=16, value=value, timestamp=0.0
+                )
+                action.execute(event)
+            mock.assert_not_called()
+
+    def test_direction_ranges(self):
+        """1-63 should map to CW and 65-127 to CCW."""
+        config = {
+            "name": "Test",
+            "action": "hotkey_relative",
+            "cw": ["a"],
+            "ccw": ["b"],
+        }
+        action = HotkeyRelativeAction(config)
+
+        with patch("k2deck.actions.hotkey.execute_hotkey") as mock:
+            for value in (1, 63, 65, 127):
+                event = MidiEvent(
+                    type="cc", channel=16, note=None, cc=16, value=value, timestamp=0.0
+                )
+                action.execute(event)
+            calls = [c[0][0] for c in mock.call_args_list]
+            assert calls == [("a",), ("a",), ("b",), ("b",)]
+
+    def test_coalesce_merges_same_direction_ticks(self):
+        """With coalesce_ms set, a burst should be sent as one batched call."""
+        config = {
+            "name": "Test",
+            "action": "hotkey_relative",
+            "cw": ["a"],
+            "ccw": ["b"],
+            "coalesce_ms": 1000,
+        }
+        action = HotkeyRelativeAction(config)
+
+        with patch("k2deck.core.keyboard.tap_hotkey_repeated") as mock_repeat:
+            for _ in range(3):
+                event = MidiEvent(
+                    type="cc", channel=16, note=None, cc=16, value=1, timestamp=0.0
+                )
+                action.execute(event)
+            mock_repeat.assert_not_called()
+
+            action._flush_timer.cancel()
+            action._flush()
+            mock_repeat.assert_called_once_with(("a",), 3)
+
+    def test_coalesce_flushes_on_direction_change(self):
+        """A direction change should flush the previous burst immediately."""
+        config = {
+            "name": "Test",
+            "action": "hotkey_relative",
+            "cw": ["a"],
+            "ccw": ["b"],
+            "coalesce_ms": 1000,
+        }
+        action = HotkeyRelativeAction(config)
+
+        with patch("k2deck.core.keyboard.tap_hotkey_repeated") as mock_repeat:
+            for value in (1, 1, 127):
+                event = MidiEvent(
+                    type="cc", channel=16, note=None, cc=16, value=value, timestamp=0.0
+                )
+                action.execute(event)
+            mock_repeat.assert_called_once_with(("a",), 2)
+
+            action._flush_timer.cancel()
+            action._flush()
+            assert mock_repeat.call_args_list[-1][0] == (("b",), 1)
+
+
+class TestFocusTargetApp:
+    """Tests for _focus_target_app."""
+
+    def test_no_target_is_noop(self):
+        """Should succeed without touching windows when no target is set."""
+        with patch("k2deck.actions.window.focus_app") as mock_focus:
+            assert _focus_target_app(None) is True
+            mock_focus.assert_not_called()
+
+    def test_focuses_with_bounded_wait(self):
+        """Should focus the target with a bounded settle wait."""
+        with patch("k2deck.actions.window.focus_app", return_value=True) as mock_focus:
+            assert _focus_target_app("brave.exe") is True
+            mock_focus.assert_called_once_with("brave.exe", settle_timeout=0.05)
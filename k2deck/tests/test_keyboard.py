@@ -225,6 +225,59 @@ class TestExecuteHotkey:
         # Only ctrl was pressed, so only ctrl should be released
         mock_release.assert_called_once_with("ctrl")
 
+    @patch.object(keyboard, "_send_input")
+    def test_batched_hotkey_sends_two_batches(self, mock_send):
+        """With between_ms=0, presses and releases are single SendInput calls."""
+        mock_send.return_value = 3
+
+        result = keyboard.execute_hotkey(
+            ["ctrl", "shift", "s"], hold_ms=0, between_ms=0
+        )
+
+        assert result is True
+        assert mock_send.call_count == 2
+        downs = mock_send.call_args_list[0][0][0]
+        ups = mock_send.call_args_list[1][0][0]
+        assert [i.union.ki.wScan for i in downs] == [0x1D, 0x2A, 0x1F]
+        assert [i.union.ki.wScan for i in ups] == [0x1F, 0x2A, 0x1D]
+        assert all(i.union.ki.dwFlags & keyboard.KEYEVENTF_KEYUP for i in ups)
+        assert "s" not in keyboard._held_keys
+
+    @patch.object(keyboard, "_send_input")
+    def test_batched_hotkey_unknown_key_sends_nothing(self, mock_send):
+        """An unknown key should abort the batch before anything is sent."""
+        result = keyboard.execute_hotkey(["ctrl", "notakey"], hold_ms=0, between_ms=0)
+
+        assert result is False
+        mock_send.assert_not_called()
+
+    @patch.object(keyboard, "_create_input_for_key")
+    @patch.object(keyboard, "_send_input")
+    def test_batched_hotkey_resolves_keys_once(self, mock_send, mock_create):
+        """Repeated batched hotkeys should reuse the resolved INPUTs."""
+        keyboard._resolve_hotkey.cache_clear()
+        mock_create.side_effect = lambda key, key_up: keyboard.INPUT()
+        mock_send.return_value = 2
+
+        keyboard.execute_hotkey(["ctrl", "f9"], hold_ms=0, between_ms=0)
+        keyboard.execute_hotkey(["ctrl", "f9"], hold_ms=0, between_ms=0)
+
+        # 2 keys x (press + release), resolved only for the first call
+        assert mock_create.call_count == 4
+        assert mock_send.call_count == 4
+        keyboard._resolve_hotkey.cache_clear()
+
+    @patch.object(keyboard, "_send_input")
+    def test_tap_hotkey_repeated_single_batch(self, mock_send):
+        """Repeated taps should go out in one SendInput call."""
+        mock_send.side_effect = lambda inputs: len(inputs)
+
+        result = keyboard.tap_hotkey_repeated(["ctrl", "tab"], 3)
+
+        assert result is True
+        mock_send.assert_called_once()
+        assert len(mock_send.call_args[0][0]) == 12
+
 
 class TestReleaseAllModifiers:
     """Test release_all_modifiers function."""
@@ -237,8 +290,8 @@ class TestReleaseAllModifiers:
 
         keyboard.release_all_modifiers()
 
-        # Should have called send_input multiple times for each modifier
-        assert mock_send.call_count > 0
+        # All modifier releases go out in a single batch
+        assert mock_send.call_count == 1
         # Held keys should not have modifiers
         assert "ctrl" not in keyboard._held_keys
         assert "alt" not in keyboard._held_keys
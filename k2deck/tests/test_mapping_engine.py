@@ -345,3 +345,106 @@ class TestMappingEngine:
             assert action is None
         finally:
             path.unlink()
+
+    def test_resolve_reuses_action_instance(self):
+        """Should return the same action instance for repeated events."""
+        config = {
+            "midi_channel": 16,
+            "mappings": {
+                "note_on": {"36": {"name": "Test", "action": "noop"}},
+            },
+        }
+        path = create_temp_config(config)
+        try:
+            engine = MappingEngine(path)
+            event = MidiEvent(
+                type="note_on",
+                channel=16,
+                note=36,
+                cc=None,
+                value=127,
+                timestamp=0.0,
+            )
+            first, _ = engine.resolve(event)
+            second, _ = engine.resolve(event)
+            assert first is second
+
+            # Reload drops cached instances
+            engine.load_config(path)
+            third, _ = engine.resolve(event)
+            assert third is not first
+        finally:
+            path.unlink()
+
+    def test_resolve_layer_specific_instances(self):
+        """Should cache a separate instance per layer."""
+        from k2deck.core import layers
+
+        config = {
+            "midi_channel": 16,
+            "mappings": {
+                "note_on": {
+                    "36": {
+                        "action": "noop",
+                        "layer_1": {"name": "L1", "action": "noop"},
+                        "layer_2": {"name": "L2", "action": "noop"},
+                    }
+                },
+            },
+        }
+        path = create_temp_config(config)
+        try:
+            engine = MappingEngine(path)
+            event = MidiEvent(
+                type="note_on",
+                channel=16,
+                note=36,
+                cc=None,
+                value=127,
+                timestamp=0.0,
+            )
+            layers.reset()
+            action, _ = engine.resolve(event)
+            assert action.name == "L1"
+
+            layers.set_layer(2)
+            action, _ = engine.resolve(event)
+            assert action.name == "L2"
+        finally:
+            layers.reset()
+            path.unlink()
+
+    def test_note_off_only_resolves_release_handlers(self):
+        """Note off should only reach actions that handle releases."""
+        config = {
+            "midi_channel": 16,
+            "mappings": {
+                "note_on": {
+                    "36": {"action": "hotkey", "keys": ["v"], "mode": "hold"},
+                    "37": {"action": "hotkey", "keys": ["a"]},
+                },
+            },
+        }
+        path = create_temp_config(config)
+        try:
+            engine = MappingEngine(path)
+
+            def note_off(note: int) -> MidiEvent:
+                return MidiEvent(
+                    type="note_off",
+                    channel=16,
+                    note=note,
+                    cc=None,
+                    value=0,
+                    timestamp=0.0,
+                )
+
+            action, _ = engine.resolve(note_off(36))
+            assert action is not None
+            assert action.handles_release is True
+
+            action, mapping = engine.resolve(note_off(37))
+            assert action is None
+            assert mapping is None
+        finally:
+            path.unlink()
@@ -0,0 +1,125 @@
+"""Tests for mouse scroll action."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from k2deck.actions import mouse_scroll
+from k2deck.actions.mouse_scroll import MouseScrollAction
+from k2deck.core.midi_listener import MidiEvent
+
+
+def _cc(value: int) -> MidiEvent:
+    return MidiEvent(
+        type="cc", channel=16, note=None, cc=16, value=value, timestamp=0.0
+    )
+
+
+@pytest.fixture
+def mock_mouse():
+    mouse = MagicMock()
+    with patch("k2deck.actions.mouse_scroll._get_mouse", return_value=mouse):
+        yield mouse
+
+
+class TestMouseScrollAction:
+    """Tests for MouseScrollAction."""
+
+    def test_default_cw_scrolls_down(self, mock_mouse):
+        """Default (inverted) CW rotation should scroll down by step."""
+        MouseScrollAction({"action": "mouse_scroll"}).execute(_cc(1))
+        mock_mouse.scroll.assert_called_once_with(0, -3)
+
+    def test_default_ccw_scrolls_up(self, mock_mouse):
+        """Default (inverted) CCW rotation should scroll up by step."""
+        MouseScrollAction({"action": "mouse_scroll"}).execute(_cc(127))
+        mock_mouse.scroll.assert_called_once_with(0, 3)
+
+    def test_not_inverted(self, mock_mouse):
+        """With invert off, CW scrolls up and CCW scrolls down."""
+        action = MouseScrollAction({"action": "mouse_scroll", "invert": False})
+        action.execute(_cc(1))
+        action.execute(_cc(127))
+        assert [c[0] for c in mock_mouse.scroll.call_args_list] == [(0, 3), (0, -3)]
+
+    def test_acceleration_scales_by_ticks(self, mock_mouse):
+        """Acceleration should multiply step by tick count, capped at 5."""
+        action = MouseScrollAction(
+            {"action": "mouse_scroll", "step": 2, "acceleration": True}
+        )
+        action.execute(_cc(3))
+        action.execute(_cc(20))
+        action.execute(_cc(126))
+        assert [c[0] for c in mock_mouse.scroll.call_args_list] == [
+            (0, -6),
+            (0, -10),
+            (0, 4),
+        ]
+
+    def test_ignores_center_and_non_cc(self, mock_mouse):
+        """Values 0/64 and non-CC events should not scroll."""
+        action = MouseScrollAction({"action": "mouse_scroll"})
+        action.execute(_cc(0))
+        action.execute(_cc(64))
+        action.execute(
+            MidiEvent(
+                type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+            )
+        )
+        mock_mouse.scroll.assert_not_called()
+
+    def test_coalesce_sums_ticks(self, mock_mouse):
+        """With coalesce_ms set, a burst should become one scroll call."""
+        action = MouseScrollAction({"action": "mouse_scroll", "coalesce_ms": 1000})
+        for value in (1, 1, 1, 127):
+            action.execute(_cc(value))
+        mock_mouse.scroll.assert_not_called()
+
+        action._flush_timer.cancel()
+        action._flush()
+        mock_mouse.scroll.assert_called_once_with(0, -6)
+
+    def test_scrolls_when_target_already_focused(self, mock_mouse):
+        """Should scroll immediately when the target is in the foreground."""
+        action = MouseScrollAction(
+            {"action": "mouse_scroll", "target_app": "Discord.exe"}
+        )
+        with (
+            patch("k2deck.actions.window.is_foreground", return_value=True),
+            patch("k2deck.actions.mouse_scroll.threading.Thread") as mock_thread,
+        ):
+            action.execute(_cc(1))
+        mock_thread.assert_not_called()
+        mock_mouse.scroll.assert_called_once_with(0, -3)
+
+    def test_drops_tick_and_focuses_in_background(self, mock_mouse):
+        """Should start one background focus and drop ticks until it lands."""
+        action = MouseScrollAction(
+            {"action": "mouse_scroll", "target_app": "Discord.exe"}
+        )
+        with (
+            patch("k2deck.actions.window.is_foreground", return_value=False),
+            patch("k2deck.actions.mouse_scroll.threading.Thread") as mock_thread,
+        ):
+            action.execute(_cc(1))
+            action.execute(_cc(1))
+        mouse_scroll._focus_pending.clear()
+
+        mock_thread.assert_called_once()
+        assert mock_thread.call_args.kwargs["args"] == ("Discord.exe",)
+        mock_mouse.scroll.assert_not_called()
+
+    def test_failed_focus_scrolls_current_window(self, mock_mouse):
+        """After a failed focus, ticks should scroll instead of being dropped."""
+        action = MouseScrollAction(
+            {"action": "mouse_scroll", "target_app": "Missing.exe"}
+        )
+        with (
+            patch("k2deck.actions.window.is_foreground", return_value=False),
+            patch("k2deck.actions.window.focus_app", return_value=False),
+        ):
+            mouse_scroll._focus_worker("Missing.exe")
+            action.execute(_cc(1))
+        mouse_scroll._focus_failed.clear()
+
+        mock_mouse.scroll.assert_called_once_with(0, -3)
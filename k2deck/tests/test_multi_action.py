@@ -1,12 +1,18 @@
 """Tests for multi.py - Multi-action and MultiToggle actions."""
 
+import threading
 from dataclasses import dataclass
 from unittest.mock import patch
 
+import pytest
+
+from k2deck.actions import multi
 from k2deck.actions.multi import (
     MultiAction,
     MultiToggleAction,
     _last_toggle_time,
+    _last_trigger_time,
+    _submit_sequence,
     _toggle_states,
 )
 
@@ -23,13 +29,32 @@ class MidiEvent:
     timestamp: float
 
 
+def _reset_state() -> None:
+    """Clear toggle states and debounce timestamps."""
+    MultiToggleAction.reset_all()
+    for times in (_last_toggle_time, _last_trigger_time):
+        for i in range(len(times)):
+            times[i] = 0
+
+
+@pytest.fixture(autouse=True)
+def run_sequences_inline():
+    """Play macro sequences synchronously instead of on the macro thread."""
+
+    def run(fn, *args, **kwargs):
+        fn(*args)
+        return True
+
+    with patch("k2deck.actions.multi._submit_sequence", side_effect=run):
+        yield
+
+
 class TestMultiAction:
     """Test MultiAction class."""
 
     def setup_method(self):
         """Reset state before each test."""
-        _toggle_states.clear()
-        _last_toggle_time.clear()
+        _reset_state()
 
     @patch("k2deck.actions.multi.keyboard")
     def test_only_triggers_on_note_on(self, mock_kb):
@@ -95,8 +120,22 @@ class TestMultiAction:
 
         action.execute(event)
 
-        # Should be called at least twice (before and after)
-        assert mock_kb.release_all_modifiers.call_count >= 2
+        # Called before and after the sequence
+        assert mock_kb.release_all_modifiers.call_count == 2
+
+    @patch("k2deck.actions.multi.keyboard")
+    @patch("k2deck.actions.multi.time.sleep")
+    def test_debounce_prevents_stacked_sequences(self, mock_sleep, mock_kb):
+        """A rapid second press should not run the sequence again."""
+        action = MultiAction({"sequence": [["ctrl", "a"]], "delay_ms": 1})
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+
+        action.execute(event)
+        action.execute(event)
+
+        assert mock_kb.execute_hotkey.call_count == 1
 
 
 class TestMultiToggleAction:
@@ -104,8 +143,7 @@ class TestMultiToggleAction:
 
     def setup_method(self):
         """Reset state before each test."""
-        _toggle_states.clear()
-        _last_toggle_time.clear()
+        _reset_state()
 
     @patch("k2deck.actions.multi.keyboard")
     def test_only_triggers_on_note_on(self, mock_kb):
@@ -152,7 +190,7 @@ class TestMultiToggleAction:
         mock_kb.execute_hotkey.assert_called_once()
         assert mock_kb.execute_hotkey.call_args[0][0] == ["ctrl", "m"]
         # State should be ON now
-        assert _toggle_states.get(36) is True
+        assert MultiToggleAction.get_state(36) is True
 
     @patch("k2deck.actions.multi.keyboard")
     @patch("k2deck.actions.multi.time.sleep")
@@ -183,7 +221,7 @@ class TestMultiToggleAction:
         mock_kb.execute_hotkey.assert_called_once()
         assert mock_kb.execute_hotkey.call_args[0][0] == ["ctrl", "u"]
         # State should be OFF now
-        assert _toggle_states.get(36) is False
+        assert MultiToggleAction.get_state(36) is False
 
     @patch("k2deck.actions.multi.keyboard")
     def test_debounce_prevents_rapid_toggles(self, mock_kb):
@@ -208,30 +246,36 @@ class TestMultiToggleAction:
 
     def test_get_state(self):
         """get_state should return current toggle state."""
-        _toggle_states[36] = True
-        _toggle_states[37] = False
+        _toggle_states[36] = 1
+        _toggle_states[37] = 0
 
         assert MultiToggleAction.get_state(36) is True
         assert MultiToggleAction.get_state(37) is False
         assert MultiToggleAction.get_state(99) is False  # Default
 
+    def test_get_state_invalid_note(self):
+        """Out-of-range or missing notes should read as OFF."""
+        assert MultiToggleAction.get_state(None) is False
+        assert MultiToggleAction.get_state(-1) is False
+        assert MultiToggleAction.get_state(200) is False
+
     def test_set_state(self):
         """set_state should manually set toggle state."""
         MultiToggleAction.set_state(36, True)
-        assert _toggle_states[36] is True
+        assert _toggle_states[36] == 1
 
         MultiToggleAction.set_state(36, False)
-        assert _toggle_states[36] is False
+        assert _toggle_states[36] == 0
 
     def test_reset_all(self):
         """reset_all should clear all toggle states."""
-        _toggle_states[36] = True
-        _toggle_states[37] = False
-        _toggle_states[38] = True
+        _toggle_states[36] = 1
+        _toggle_states[37] = 0
+        _toggle_states[38] = 1
 
         MultiToggleAction.reset_all()
 
-        assert len(_toggle_states) == 0
+        assert not any(_toggle_states)
 
     @patch("k2deck.actions.multi.keyboard")
     @patch("k2deck.actions.multi.time.sleep")
@@ -253,13 +297,13 @@ class TestMultiToggleAction:
 
         # Press note 36
         action1.execute(event36)
-        assert _toggle_states.get(36) is True
-        assert _toggle_states.get(37, False) is False
+        assert MultiToggleAction.get_state(36) is True
+        assert MultiToggleAction.get_state(37) is False
 
         # Press note 37
         action2.execute(event37)
-        assert _toggle_states.get(36) is True
-        assert _toggle_states.get(37) is True
+        assert MultiToggleAction.get_state(36) is True
+        assert MultiToggleAction.get_state(37) is True
 
     @patch("k2deck.actions.multi.keyboard")
     @patch("k2deck.actions.multi.time.sleep")
@@ -283,3 +327,51 @@ class TestMultiToggleAction:
         assert mock_kb.execute_hotkey.call_count == 2
         calls = [c[0][0] for c in mock_kb.execute_hotkey.call_args_list]
         assert calls == [["ctrl", "m"], ["ctrl", "space"]]
+
+
+class TestSequenceQueue:
+    """Test the macro thread backlog."""
+
+    def test_runs_on_macro_thread(self):
+        """Queued sequences should run on the dedicated macro thread."""
+        done = threading.Event()
+        names = []
+
+        def record():
+            names.append(threading.current_thread().name)
+            done.set()
+
+        assert _submit_sequence(record) is True
+        assert done.wait(1.0)
+        assert names[0].startswith("k2deck-macro")
+
+    def test_drops_when_backlog_full(self):
+        """Submissions beyond MAX_PENDING_SEQUENCES should be dropped."""
+        with patch.object(multi, "_seq_pending", multi.MAX_PENDING_SEQUENCES):
+            assert _submit_sequence(lambda: None) is False
+
+    def test_unbounded_submit_ignores_full_backlog(self):
+        """bounded=False should queue even past MAX_PENDING_SEQUENCES."""
+        done = threading.Event()
+        with patch.object(multi, "_seq_pending", multi.MAX_PENDING_SEQUENCES):
+            assert _submit_sequence(done.set, bounded=False) is True
+        assert done.wait(1.0)
+
+    @patch("k2deck.actions.multi.keyboard")
+    def test_toggle_presses_are_never_dropped(self, mock_kb):
+        """A toggle must flip its state even when the backlog is full."""
+        _reset_state()
+        action = MultiToggleAction({"on_sequence": [], "off_sequence": []})
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+
+        with (
+            patch.object(multi, "_submit_sequence", wraps=_submit_sequence),
+            patch.object(multi, "_seq_pending", multi.MAX_PENDING_SEQUENCES),
+            patch.object(multi, "_seq_executor") as mock_executor,
+        ):
+            action.execute(event)
+
+        mock_executor.submit.assert_called_once()
+        assert MultiToggleAction.get_state(36) is True
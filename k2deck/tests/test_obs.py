@@ -387,6 +387,24 @@ class TestOBSSceneAction:
 
         mock_client.set_scene.assert_called_once_with("Gaming")
 
+    @patch("k2deck.actions.obs.get_obs_client")
+    def test_resolves_client_once_at_init(self, mock_get):
+        """Availability is checked at init, not on every press."""
+        mock_client = MagicMock()
+        mock_client.is_available = False
+        mock_get.return_value = mock_client
+
+        action = OBSSceneAction({"scene": "Gaming"})
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+
+        action.execute(event)
+        action.execute(event)
+
+        assert mock_get.call_count == 1
+        assert not mock_client.set_scene.called
+
 
 class TestOBSSourceToggleAction:
     """Test OBSSourceToggleAction class."""
@@ -271,3 +271,59 @@ class TestOscSender:
     def test_repr(self):
         sender = OscSender("127.0.0.1", 9000)
         assert repr(sender) == "OscSender(127.0.0.1:9000)"
+
+    @patch("k2deck.core.osc.socket.socket")
+    def test_send_async_delivers_in_order(self, mock_socket_cls):
+        """Queued messages are sent by the worker in order before shutdown."""
+        mock_sock = MagicMock()
+        mock_socket_cls.return_value = mock_sock
+
+        sender = OscSender("127.0.0.1", 9000)
+        for i in range(5):
+            sender.send_async("/pd/param", "cutoff", float(i))
+        OscSender.close_all()
+
+        sent = [c[0][0] for c in mock_sock.sendto.call_args_list]
+        assert sent == [
+            build_osc_message("/pd/param", "cutoff", float(i)) for i in range(5)
+        ]
+        assert OscSender._worker is None
+
+    @patch("k2deck.core.osc.socket.socket")
+    def test_send_packet_async_sends_prebuilt_bytes(self, mock_socket_cls):
+        """Prebuilt packets are sent as-is, interleaved with other messages."""
+        mock_sock = MagicMock()
+        mock_socket_cls.return_value = mock_sock
+
+        sender = OscSender("127.0.0.1", 9000)
+        bang = build_osc_message("/pd/bang", 1.0)
+        sender.send_packet_async(bang)
+        sender.send_async("/pd/param", "cutoff", 0.5)
+        sender.send_packet_async(bang)
+        OscSender.close_all()
+
+        sent = [c[0][0] for c in mock_sock.sendto.call_args_list]
+        assert sent == [bang, build_osc_message("/pd/param", "cutoff", 0.5), bang]
+
+    @patch("k2deck.core.osc.socket.socket")
+    def test_worker_coalesces_absolute_values(self, mock_socket_cls):
+        """Newest value per parameter wins; bangs are never dropped."""
+        mock_sock = MagicMock()
+        mock_socket_cls.return_value = mock_sock
+
+        sender = OscSender("127.0.0.1", 9000)
+        # Queue a burst without a running worker, then drain it synchronously
+        with patch.object(OscSender, "_worker", MagicMock()):
+            for value in (1.0, 2.0, 3.0):
+                sender.send_async("/pd/param", "cutoff", value, coalesce=True)
+            sender.send_async("/pd/bang", 1.0)
+            sender.send_async("/pd/bang", 1.0)
+            OscSender._queue.put(None)
+            OscSender._run_worker()
+
+        sent = [c[0][0] for c in mock_sock.sendto.call_args_list]
+        assert sent == [
+            build_osc_message("/pd/param", "cutoff", 3.0),
+            build_osc_message("/pd/bang", 1.0),
+            build_osc_message("/pd/bang", 1.0),
+        ]
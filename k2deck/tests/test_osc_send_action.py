@@ -1,5 +1,6 @@
 """Tests for k2deck.actions.osc_send — OSC Send action classes."""
 
+import threading
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
@@ -12,6 +13,7 @@ from k2deck.actions.osc_send import (
     _apply_curve,
     _scale_to_range,
 )
+from k2deck.core.osc import build_osc_message
 
 
 @dataclass
@@ -71,7 +73,7 @@ class TestOscSendAction:
         action = OscSendAction({"action": "osc_send", "osc_port": 9000})
         event = FakeMidiEvent(type="note_on", note=36, value=127)
         action.execute(event)
-        mock_sender_cls.return_value.send.assert_not_called()
+        mock_sender_cls.return_value.send_async.assert_not_called()
 
     def test_midi_0_maps_to_min(self, mock_sender_cls):
         """MIDI value 0 → min output value."""
@@ -90,8 +92,8 @@ class TestOscSendAction:
         event = FakeMidiEvent(type="cc", cc=16, value=0)
         action.execute(event)
 
-        mock_sender.send.assert_called_once()
-        args = mock_sender.send.call_args[0]
+        mock_sender.send_async.assert_called_once()
+        args = mock_sender.send_async.call_args[0]
         assert args[0] == "/pd/param"
         assert args[1] == "cutoff"
         assert args[2] == pytest.approx(200.0, abs=0.1)
@@ -113,7 +115,7 @@ class TestOscSendAction:
         event = FakeMidiEvent(type="cc", cc=16, value=127)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(12000.0, abs=0.1)
 
     def test_midi_64_linear_midpoint(self, mock_sender_cls):
@@ -134,7 +136,7 @@ class TestOscSendAction:
         event = FakeMidiEvent(type="cc", cc=16, value=64)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(50.39, abs=0.5)
 
     def test_exponential_curve(self, mock_sender_cls):
@@ -155,7 +157,7 @@ class TestOscSendAction:
         event = FakeMidiEvent(type="cc", cc=16, value=64)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         # (64/127)^3 ≈ 0.128 → 12.8
         assert args[2] == pytest.approx(12.8, abs=1.0)
 
@@ -173,10 +175,21 @@ class TestOscSendAction:
         event = FakeMidiEvent(type="cc", cc=16, value=64)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[0] == "/pd/param"
         assert len(args) == 2  # address + value only
 
+    def test_lookup_table_matches_curve_and_range(self, mock_sender_cls):
+        """Precomputed table should equal the curve+scale formula per value."""
+        action = OscSendAction(
+            {"action": "osc_send", "min": 20.0, "max": 2000.0, "curve": "exponential"}
+        )
+        for value in (0, 1, 64, 100, 127):
+            expected = _scale_to_range(
+                _apply_curve(value / 127.0, "exponential"), 20.0, 2000.0
+            )
+            assert action._lut[value] == pytest.approx(expected)
+
     def test_default_config_values(self, mock_sender_cls):
         """Verify defaults: host=127.0.0.1, port=9000, min=0, max=1."""
         action = OscSendAction({"action": "osc_send"})
@@ -205,13 +218,13 @@ class TestOscSendAction:
         action.execute(event)
 
         mock_sender_cls.assert_called_with("192.168.1.10", 8000)
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[0] == "/custom/path"
 
     def test_error_handling(self, mock_sender_cls):
         """OscSender.send raising doesn't crash the action."""
         mock_sender = MagicMock()
-        mock_sender.send.side_effect = OSError("fail")
+        mock_sender.send_async.side_effect = OSError("fail")
         mock_sender_cls.return_value = mock_sender
 
         action = OscSendAction(
@@ -244,7 +257,7 @@ class TestOscSendRelativeAction:
         )
         event = FakeMidiEvent(type="note_on", note=36, value=127)
         action.execute(event)
-        mock_sender_cls.return_value.send.assert_not_called()
+        mock_sender_cls.return_value.send_async.assert_not_called()
 
     def test_cw_increments(self, mock_sender_cls):
         """CW rotation (value=1) increments by step."""
@@ -264,7 +277,7 @@ class TestOscSendRelativeAction:
         event = FakeMidiEvent(type="cc", cc=0, value=1)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(51.0)
 
     def test_ccw_decrements(self, mock_sender_cls):
@@ -285,7 +298,7 @@ class TestOscSendRelativeAction:
         event = FakeMidiEvent(type="cc", cc=0, value=127)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(49.0)
 
     def test_fast_cw_multiple_steps(self, mock_sender_cls):
@@ -306,7 +319,7 @@ class TestOscSendRelativeAction:
         event = FakeMidiEvent(type="cc", cc=0, value=3)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         # 50 + 3*2 = 56
         assert args[2] == pytest.approx(56.0)
 
@@ -328,7 +341,7 @@ class TestOscSendRelativeAction:
         event = FakeMidiEvent(type="cc", cc=0, value=5)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(10.0)
 
     def test_clips_to_min(self, mock_sender_cls):
@@ -349,7 +362,7 @@ class TestOscSendRelativeAction:
         event = FakeMidiEvent(type="cc", cc=0, value=126)  # -2
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(0.0)
 
     def test_default_initial_is_midpoint(self, mock_sender_cls):
@@ -387,7 +400,7 @@ class TestOscSendRelativeAction:
         )
         event = FakeMidiEvent(type="cc", cc=0, value=0)
         action.execute(event)
-        mock_sender_cls.return_value.send.assert_not_called()
+        mock_sender_cls.return_value.send_async.assert_not_called()
 
     def test_value_64_ignored(self, mock_sender_cls):
         """CC value 64 does nothing."""
@@ -399,7 +412,19 @@ class TestOscSendRelativeAction:
         )
         event = FakeMidiEvent(type="cc", cc=0, value=64)
         action.execute(event)
-        mock_sender_cls.return_value.send.assert_not_called()
+        mock_sender_cls.return_value.send_async.assert_not_called()
+
+    def test_delta_table_decodes_twos_complement(self, mock_sender_cls):
+        """Precomputed deltas should match two's complement times step."""
+        action = OscSendRelativeAction(
+            {"action": "osc_send_relative", "osc_param": "lut", "step": 0.5}
+        )
+        assert action._delta_lut[1] == 0.5
+        assert action._delta_lut[63] == 31.5
+        assert action._delta_lut[65] == -31.5
+        assert action._delta_lut[127] == -0.5
+        assert action._delta_lut[0] == 0.0
+        assert action._delta_lut[64] == 0.0
 
     def test_state_persists_across_instances(self, mock_sender_cls):
         """Class-level accumulator works across new Action instances."""
@@ -424,7 +449,7 @@ class TestOscSendRelativeAction:
         action2.execute(FakeMidiEvent(type="cc", cc=0, value=1))
 
         # Should be 52 (50 + 1 + 1), not 51
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(52.0)
 
     def test_different_params_independent(self, mock_sender_cls):
@@ -456,7 +481,7 @@ class TestOscSendRelativeAction:
         action_a.execute(FakeMidiEvent(type="cc", cc=0, value=1))
         action_b.execute(FakeMidiEvent(type="cc", cc=1, value=1))
 
-        calls = mock_sender.send.call_args_list
+        calls = mock_sender.send_async.call_args_list
         # param_a: 50 + 10 = 60
         assert calls[0][0][2] == pytest.approx(60.0)
         # param_b: 0 + 1 = 1
@@ -484,7 +509,7 @@ class TestOscSendRelativeAction:
         action2 = OscSendRelativeAction(config)
         action2.execute(FakeMidiEvent(type="cc", cc=0, value=1))  # Back to 51, not 52
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert args[2] == pytest.approx(51.0)
 
     def test_sends_without_param(self, mock_sender_cls):
@@ -504,13 +529,13 @@ class TestOscSendRelativeAction:
         event = FakeMidiEvent(type="cc", cc=0, value=1)
         action.execute(event)
 
-        args = mock_sender.send.call_args[0]
+        args = mock_sender.send_async.call_args[0]
         assert len(args) == 2  # address + value only
 
     def test_error_handling(self, mock_sender_cls):
         """OscSender errors don't crash the action."""
         mock_sender = MagicMock()
-        mock_sender.send.side_effect = OSError("fail")
+        mock_sender.send_async.side_effect = OSError("fail")
         mock_sender_cls.return_value = mock_sender
 
         action = OscSendRelativeAction(
@@ -543,7 +568,7 @@ class TestOscSendTriggerAction:
         )
         event = FakeMidiEvent(type="cc", cc=16, value=64)
         action.execute(event)
-        mock_sender_cls.return_value.send.assert_not_called()
+        mock_sender_cls.return_value.send_packet_async.assert_not_called()
 
     def test_ignores_zero_velocity(self, mock_sender_cls):
         """Note on with velocity 0 (release) is ignored."""
@@ -555,7 +580,7 @@ class TestOscSendTriggerAction:
         )
         event = FakeMidiEvent(type="note_on", note=48, value=0)
         action.execute(event)
-        mock_sender_cls.return_value.send.assert_not_called()
+        mock_sender_cls.return_value.send_packet_async.assert_not_called()
 
     def test_bang_mode_sends_one(self, mock_sender_cls):
         """Bang mode always sends 1.0."""
@@ -575,8 +600,10 @@ class TestOscSendTriggerAction:
             action.execute(FakeMidiEvent(type="note_on", note=48, value=127))
 
         # Both sends should be 1.0
-        for call in mock_sender.send.call_args_list:
-            assert call[0][2] == pytest.approx(1.0)
+        calls = mock_sender.send_packet_async.call_args_list
+        assert len(calls) == 2
+        for call in calls:
+            assert call[0][0] == build_osc_message("/pd/param", "bang_test", 1.0)
 
     def test_toggle_mode_alternates(self, mock_sender_cls):
         """Toggle mode alternates between 1.0 and 0.0."""
@@ -596,10 +623,10 @@ class TestOscSendTriggerAction:
         action.execute(press)  # 2nd: off
         action.execute(press)  # 3rd: on
 
-        calls = mock_sender.send.call_args_list
-        assert calls[0][0][2] == pytest.approx(1.0)
-        assert calls[1][0][2] == pytest.approx(0.0)
-        assert calls[2][0][2] == pytest.approx(1.0)
+        on = build_osc_message("/pd/param", "toggle_test", 1.0)
+        off = build_osc_message("/pd/param", "toggle_test", 0.0)
+        calls = mock_sender.send_packet_async.call_args_list
+        assert [c[0][0] for c in calls] == [on, off, on]
 
     def test_default_mode_is_bang(self, mock_sender_cls):
         """Default mode is bang."""
@@ -625,10 +652,8 @@ class TestOscSendTriggerAction:
         )
         action.execute(FakeMidiEvent(type="note_on", note=48, value=127))
 
-        args = mock_sender.send.call_args[0]
-        assert args[0] == "/pd/param"
-        assert args[1] == "mixer__p__mute"
-        assert args[2] == pytest.approx(1.0)
+        packet = mock_sender.send_packet_async.call_args[0][0]
+        assert packet == build_osc_message("/pd/param", "mixer__p__mute", 1.0)
 
     def test_sends_without_param(self, mock_sender_cls):
         """When osc_param is empty, send value only."""
@@ -642,8 +667,8 @@ class TestOscSendTriggerAction:
         )
         action.execute(FakeMidiEvent(type="note_on", note=48, value=127))
 
-        args = mock_sender.send.call_args[0]
-        assert len(args) == 2  # address + value
+        packet = mock_sender.send_packet_async.call_args[0][0]
+        assert packet == build_osc_message("/pd/param", 1.0)  # address + value
 
     def test_reset_toggle_states(self, mock_sender_cls):
         """reset_toggle_states clears all state."""
@@ -666,9 +691,9 @@ class TestOscSendTriggerAction:
             FakeMidiEvent(type="note_on", note=48, value=127)
         )  # → 1.0 again (reset)
 
-        calls = mock_sender.send.call_args_list
-        assert calls[0][0][2] == pytest.approx(1.0)
-        assert calls[1][0][2] == pytest.approx(1.0)
+        on = build_osc_message("/pd/param", "reset_t", 1.0)
+        calls = mock_sender.send_packet_async.call_args_list
+        assert [c[0][0] for c in calls] == [on, on]
 
     def test_different_params_independent_toggles(self, mock_sender_cls):
         """Different params have independent toggle states."""
@@ -695,15 +720,15 @@ class TestOscSendTriggerAction:
         action_a.execute(press)  # a → 0.0
         action_b.execute(press)  # b → 1.0 (independent)
 
-        calls = mock_sender.send.call_args_list
-        assert calls[0][0][2] == pytest.approx(1.0)  # a on
-        assert calls[1][0][2] == pytest.approx(0.0)  # a off
-        assert calls[2][0][2] == pytest.approx(1.0)  # b on (not off)
+        calls = [c[0][0] for c in mock_sender.send_packet_async.call_args_list]
+        assert calls[0] == build_osc_message("/pd/param", "mute_a", 1.0)  # a on
+        assert calls[1] == build_osc_message("/pd/param", "mute_a", 0.0)  # a off
+        assert calls[2] == build_osc_message("/pd/param", "mute_b", 1.0)  # b on
 
     def test_error_handling(self, mock_sender_cls):
         """OscSender errors don't crash the action."""
         mock_sender = MagicMock()
-        mock_sender.send.side_effect = OSError("fail")
+        mock_sender.send_packet_async.side_effect = OSError("fail")
         mock_sender_cls.return_value = mock_sender
 
         action = OscSendTriggerAction(
@@ -714,3 +739,41 @@ class TestOscSendTriggerAction:
         )
         # Should not raise
         action.execute(FakeMidiEvent(type="note_on", note=48, value=127))
+
+    def test_unsupported_param_type_disables_action(self, mock_sender_cls):
+        """A bad osc_param should warn at creation, not raise."""
+        action = OscSendTriggerAction(
+            {
+                "action": "osc_send_trigger",
+                "osc_param": ["not", "a", "name"],
+                "mode": "toggle",
+            }
+        )
+        action.execute(FakeMidiEvent(type="note_on", note=48, value=127))
+
+        mock_sender_cls.return_value.send_packet_async.assert_not_called()
+        assert OscSendTriggerAction._toggle_states == {}
+
+    def test_concurrent_toggles_are_not_lost(self, mock_sender_cls):
+        """Presses from several threads each flip the state exactly once."""
+        action = OscSendTriggerAction(
+            {
+                "action": "osc_send_trigger",
+                "osc_param": "race",
+                "mode": "toggle",
+            }
+        )
+        press = FakeMidiEvent(type="note_on", note=48, value=127)
+
+        def press_many():
+            for _ in range(200):
+                action.execute(press)
+
+        threads = [threading.Thread(target=press_many) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 800 flips is an even number, so the toggle ends up OFF
+        assert OscSendTriggerAction._toggle_states["race"] is False
@@ -112,6 +112,7 @@ class TestSoundPlayAction:
             action.execute(event)
             assert not mock_play.called
 
+    @patch("k2deck.actions.sound._pygame_available", False)
     @patch("k2deck.actions.sound.Path")
     @patch("k2deck.actions.sound.play_wav")
     def test_plays_wav_file(self, mock_play, mock_path):
@@ -129,6 +130,48 @@ class TestSoundPlayAction:
 
         mock_play.assert_called_once()
 
+    @patch("k2deck.actions.sound._pygame_available", True)
+    @patch("k2deck.actions.sound._preload_executor")
+    @patch("k2deck.actions.sound._load_sound")
+    @patch("k2deck.actions.sound.Path")
+    @patch("k2deck.actions.sound.play_wav")
+    @patch("k2deck.actions.sound.play_with_pygame")
+    def test_plays_wav_with_pygame_when_available(
+        self, mock_pygame, mock_wav, mock_path, mock_load, mock_executor
+    ):
+        """WAV should go through the preloaded pygame mixer if installed."""
+        mock_path.return_value.exists.return_value = True
+        mock_path.return_value.suffix = ".wav"
+        mock_executor.submit.side_effect = lambda fn: fn()
+
+        action = SoundPlayAction({"file": "C:/sounds/alert.wav", "volume": 50})
+        mock_load.assert_called_once()  # decoded by the preload
+        assert action._preloaded
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+
+        action.execute(event)
+
+        mock_wav.assert_not_called()
+        assert mock_pygame.call_args[0][1] == 0.5
+
+    @patch("k2deck.actions.sound._preload_executor")
+    @patch("k2deck.actions.sound._ensure_pygame")
+    @patch("k2deck.actions.sound.Path")
+    def test_preload_runs_off_the_creating_thread(
+        self, mock_path, mock_ensure, mock_executor
+    ):
+        """Creating the action should only queue the mixer open and decode."""
+        mock_path.return_value.exists.return_value = True
+        mock_path.return_value.suffix = ".ogg"
+
+        action = SoundPlayAction({"file": "C:/sounds/alert.ogg"})
+
+        mock_ensure.assert_not_called()
+        mock_executor.submit.assert_called_once_with(action._preload)
+        assert not action._preloaded
+
     @patch("k2deck.actions.sound.Path")
     @patch("k2deck.actions.sound.play_with_pygame")
     def test_plays_mp3_with_pygame(self, mock_pygame, mock_path):
@@ -149,6 +192,45 @@ class TestSoundPlayAction:
         call_args = mock_pygame.call_args[0]
         assert call_args[1] == 0.8
 
+    @patch("k2deck.actions.sound._pygame_available", False)
+    @patch("k2deck.actions.sound.Path")
+    @patch("k2deck.actions.sound.play_wav")
+    def test_checks_file_once_at_init(self, mock_play, mock_path):
+        """An existing file should not be stat'ed again on each press."""
+        mock_path.return_value.exists.return_value = True
+        mock_path.return_value.suffix = ".wav"
+
+        action = SoundPlayAction({"file": "C:/sounds/alert.wav"})
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+        action.execute(event)
+        action.execute(event)
+
+        assert mock_path.return_value.exists.call_count == 1
+        assert mock_play.call_count == 2
+
+    @patch("k2deck.actions.sound._pygame_available", False)
+    @patch("k2deck.actions.sound.time")
+    @patch("k2deck.actions.sound.Path")
+    @patch("k2deck.actions.sound.play_wav")
+    def test_rechecks_file_after_ttl(self, mock_play, mock_path, mock_time):
+        """A deleted file should be noticed once the existence TTL expires."""
+        mock_path.return_value.exists.return_value = True
+        mock_path.return_value.suffix = ".wav"
+        mock_time.monotonic_ns.return_value = 0
+
+        action = SoundPlayAction({"file": "C:/sounds/alert.wav"})
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+
+        mock_path.return_value.exists.return_value = False
+        mock_time.monotonic_ns.return_value = 6_000_000_000
+        action.execute(event)
+
+        mock_play.assert_not_called()
+
     @patch("k2deck.actions.sound.Path")
     def test_warns_if_file_not_found(self, mock_path):
         """Should warn if file doesn't exist."""
@@ -163,6 +245,7 @@ class TestSoundPlayAction:
             action.execute(event)
             assert not mock_play.called
 
+    @patch("k2deck.actions.sound._pygame_available", False)
     @patch("k2deck.actions.sound.Path")
     @patch("k2deck.actions.sound.stop_playback")
     @patch("k2deck.actions.sound.play_wav")
@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 
 from k2deck.actions.sound import (
     SoundPlayAction,
+    _ensure_pygame,
+    _load_sound,
     play_with_pygame,
     stop_playback,
 )
@@ -26,6 +28,10 @@ class MidiEvent:
 class TestPlayWithPygame:
     """Test play_with_pygame function."""
 
+    def setup_method(self):
+        """Drop sounds decoded by earlier tests."""
+        _load_sound.cache_clear()
+
     def test_returns_false_without_pygame(self):
         """Should return False when pygame not available."""
         with patch("k2deck.actions.sound._pygame_available", False):
@@ -40,60 +46,75 @@ class TestPlayWithPygame:
             with patch.dict(
                 sys.modules, {"pygame": mock_pygame, "pygame.mixer": mock_pygame.mixer}
             ):
-                # Re-bind in module
-                import k2deck.actions.sound as snd
-
-                original = getattr(snd, "pygame", None)
-                snd.pygame = mock_pygame
-                try:
+                with patch("k2deck.actions.sound.pygame", mock_pygame):
                     result = play_with_pygame("test.mp3")
                     assert result is True
-                    mock_pygame.mixer.music.load.assert_called_once_with("test.mp3")
-                    mock_pygame.mixer.music.set_volume.assert_called_once_with(1.0)
-                    mock_pygame.mixer.music.play.assert_called_once()
-                finally:
-                    if original is None:
-                        delattr(snd, "pygame")
-                    else:
-                        snd.pygame = original
+                    mock_pygame.mixer.Sound.assert_called_once_with("test.mp3")
+                    sound = mock_pygame.mixer.Sound.return_value
+                    sound.play.assert_called_once()
+                    sound.play.return_value.set_volume.assert_called_once_with(1.0)
 
     def test_plays_with_custom_volume(self):
         """Should play file with custom volume."""
         mock_pygame = MagicMock()
 
         with patch("k2deck.actions.sound._pygame_available", True):
-            import k2deck.actions.sound as snd
-
-            original = getattr(snd, "pygame", None)
-            snd.pygame = mock_pygame
-            try:
+            with patch("k2deck.actions.sound.pygame", mock_pygame):
                 result = play_with_pygame("test.mp3", volume=0.5)
                 assert result is True
-                mock_pygame.mixer.music.set_volume.assert_called_once_with(0.5)
-            finally:
-                if original is None:
-                    delattr(snd, "pygame")
-                else:
-                    snd.pygame = original
+                sound = mock_pygame.mixer.Sound.return_value
+                sound.play.return_value.set_volume.assert_called_once_with(0.5)
+                sound.set_volume.assert_not_called()  # shared between actions
 
     def test_returns_false_on_error(self):
         """Should return False on playback error."""
         mock_pygame = MagicMock()
-        mock_pygame.mixer.music.load.side_effect = Exception("file error")
+        mock_pygame.mixer.Sound.side_effect = Exception("file error")
 
         with patch("k2deck.actions.sound._pygame_available", True):
-            import k2deck.actions.sound as snd
-
-            original = getattr(snd, "pygame", None)
-            snd.pygame = mock_pygame
-            try:
+            with patch("k2deck.actions.sound.pygame", mock_pygame):
                 result = play_with_pygame("bad.mp3")
                 assert result is False
-            finally:
-                if original is None:
-                    delattr(snd, "pygame")
-                else:
-                    snd.pygame = original
+
+    def test_decodes_each_file_once(self):
+        """Repeat plays of one file should reuse the decoded sound."""
+        mock_pygame = MagicMock()
+
+        with patch("k2deck.actions.sound._pygame_available", True):
+            with patch("k2deck.actions.sound.pygame", mock_pygame):
+                play_with_pygame("test.ogg")
+                play_with_pygame("test.ogg", volume=0.5)
+                mock_pygame.mixer.Sound.assert_called_once_with("test.ogg")
+                assert mock_pygame.mixer.Sound.return_value.play.call_count == 2
+
+    def test_no_free_channel_still_succeeds(self):
+        """A busy mixer (play() returns None) should not raise."""
+        mock_pygame = MagicMock()
+        mock_pygame.mixer.Sound.return_value.play.return_value = None
+
+        with patch("k2deck.actions.sound._pygame_available", True):
+            with patch("k2deck.actions.sound.pygame", mock_pygame):
+                assert play_with_pygame("test.ogg", volume=0.5) is True
+
+
+class TestEnsurePygame:
+    """Test lazy pygame initialization."""
+
+    def test_initializes_mixer_once(self):
+        """The mixer should be opened on first use, not on every call."""
+        mock_pygame = MagicMock()
+        with (
+            patch("k2deck.actions.sound._pygame_available", None),
+            patch("k2deck.actions.sound.pygame", None),
+            patch.dict(
+                sys.modules, {"pygame": mock_pygame, "pygame.mixer": mock_pygame.mixer}
+            ),
+        ):
+            assert _ensure_pygame() is True
+            assert _ensure_pygame() is True
+
+        mock_pygame.mixer.init.assert_called_once()
+        assert mock_pygame.mixer.pre_init.call_args.kwargs["buffer"] == 512
 
 
 class TestStopPlaybackExtended:
@@ -105,19 +126,10 @@ class TestStopPlaybackExtended:
 
         with patch("k2deck.actions.sound._pygame_available", True):
             with patch("k2deck.actions.sound.winsound") as mock_winsound:
-                import k2deck.actions.sound as snd
-
-                original = getattr(snd, "pygame", None)
-                snd.pygame = mock_pygame
-                try:
+                with patch("k2deck.actions.sound.pygame", mock_pygame):
                     stop_playback()
                     mock_winsound.PlaySound.assert_called_once()
-                    mock_pygame.mixer.music.stop.assert_called_once()
-                finally:
-                    if original is None:
-                        delattr(snd, "pygame")
-                    else:
-                        snd.pygame = original
+                    mock_pygame.mixer.stop.assert_called_once()
 
     def test_handles_winsound_error(self):
         """Should continue even if winsound fails."""
@@ -126,37 +138,19 @@ class TestStopPlaybackExtended:
         with patch("k2deck.actions.sound._pygame_available", True):
             with patch("k2deck.actions.sound.winsound") as mock_winsound:
                 mock_winsound.PlaySound.side_effect = Exception("winsound error")
-                import k2deck.actions.sound as snd
-
-                original = getattr(snd, "pygame", None)
-                snd.pygame = mock_pygame
-                try:
+                with patch("k2deck.actions.sound.pygame", mock_pygame):
                     stop_playback()  # should not raise
-                    mock_pygame.mixer.music.stop.assert_called_once()
-                finally:
-                    if original is None:
-                        delattr(snd, "pygame")
-                    else:
-                        snd.pygame = original
+                    mock_pygame.mixer.stop.assert_called_once()
 
     def test_handles_pygame_error(self):
         """Should continue even if pygame fails."""
         mock_pygame = MagicMock()
-        mock_pygame.mixer.music.stop.side_effect = Exception("pygame error")
+        mock_pygame.mixer.stop.side_effect = Exception("pygame error")
 
         with patch("k2deck.actions.sound._pygame_available", True):
             with patch("k2deck.actions.sound.winsound"):
-                import k2deck.actions.sound as snd
-
-                original = getattr(snd, "pygame", None)
-                snd.pygame = mock_pygame
-                try:
+                with patch("k2deck.actions.sound.pygame", mock_pygame):
                     stop_playback()  # should not raise
-                finally:
-                    if original is None:
-                        delattr(snd, "pygame")
-                    else:
-                        snd.pygame = original
 
 
 class TestSoundPlayActionExtended:
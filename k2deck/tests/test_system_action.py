@@ -4,6 +4,8 @@
 All tests MUST mock these functions properly to avoid actually executing them!
 """
 
+import sys
+import threading
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
@@ -14,12 +16,15 @@ from k2deck.actions.system import (
     NoopAction,
     OpenURLAction,
     SystemAction,
+    _ensure_com_initialized,
     hibernate_computer,
     lock_workstation,
     open_url,
+    paste_to_clipboard,
     restart_computer,
     shutdown_computer,
     sleep_computer,
+    take_screenshot,
 )
 
 
@@ -89,6 +94,39 @@ class TestSystemCommands:
         result = restart_computer(force=False)
         assert result is True
 
+    @pytest.mark.parametrize(("code", "expected"), [(42, True), (2, False)])
+    def test_screenshot_uses_shell_execute(self, code, expected):
+        """take_screenshot should open the URI directly, checking the result."""
+        shell_execute = MagicMock(return_value=code)
+        with (
+            patch(
+                "k2deck.actions.system._get_shell_execute", return_value=shell_execute
+            ),
+            patch("k2deck.actions.system._ensure_com_initialized") as mock_com,
+        ):
+            assert take_screenshot() is expected
+
+        mock_com.assert_called_once()
+        shell_execute.assert_called_once_with(
+            None, "open", "ms-screenclip:", None, None, 1
+        )
+
+    def test_com_initialized_once_per_thread(self):
+        """ShellExecute threads should enter a COM apartment only once."""
+        with (
+            patch("k2deck.actions.system.ctypes") as mock_ctypes,
+            patch("k2deck.actions.system._com_thread_state", threading.local()),
+        ):
+            mock_ctypes.windll.ole32.CoInitializeEx.return_value = 0
+            _ensure_com_initialized()
+            _ensure_com_initialized()
+
+            worker = threading.Thread(target=_ensure_com_initialized)
+            worker.start()
+            worker.join()
+
+        assert mock_ctypes.windll.ole32.CoInitializeEx.call_count == 2
+
 
 class TestSystemAction:
     """Test SystemAction class."""
@@ -181,7 +219,7 @@ class TestOpenURLAction:
         """Should only execute on note_on events."""
         action = OpenURLAction({"url": "https://example.com"})
 
-        with patch("k2deck.actions.system.open_url") as mock:
+        with patch("k2deck.actions.system._launch_url") as mock:
             event = MidiEvent(
                 type="note_off", channel=16, note=36, cc=None, value=127, timestamp=0.0
             )
@@ -192,14 +230,14 @@ class TestOpenURLAction:
         """Should ignore note_on with velocity 0."""
         action = OpenURLAction({"url": "https://example.com"})
 
-        with patch("k2deck.actions.system.open_url") as mock:
+        with patch("k2deck.actions.system._launch_url") as mock:
             event = MidiEvent(
                 type="note_on", channel=16, note=36, cc=None, value=0, timestamp=0.0
             )
             action.execute(event)
             assert not mock.called
 
-    @patch("k2deck.actions.system.open_url")
+    @patch("k2deck.actions.system._launch_url")
     def test_opens_configured_url(self, mock_open):
         """Should open the configured URL."""
         action = OpenURLAction({"url": "https://github.com"})
@@ -211,6 +249,19 @@ class TestOpenURLAction:
 
         mock_open.assert_called_once_with("https://github.com")
 
+    @patch("k2deck.actions.system._launch_url")
+    def test_blocks_non_http_url(self, mock_launch):
+        """Non-HTTP schemes should be rejected when the action is created."""
+        action = OpenURLAction({"url": "file:///C:/Windows/System32/cmd.exe"})
+        assert action._valid is False
+
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+        action.execute(event)
+
+        mock_launch.assert_not_called()
+
     def test_warns_if_no_url_configured(self):
         """Should log warning if no URL configured."""
         action = OpenURLAction({})
@@ -218,7 +269,7 @@ class TestOpenURLAction:
             type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
         )
 
-        with patch("k2deck.actions.system.open_url") as mock:
+        with patch("k2deck.actions.system._launch_url") as mock:
             action.execute(event)
             assert not mock.called
 
@@ -277,6 +328,22 @@ class TestClipboardPasteAction:
         call_args = mock_hotkey.call_args[0][0]
         assert call_args == ["ctrl", "v"]
 
+    @patch("k2deck.core.keyboard.execute_hotkey")
+    @patch("k2deck.actions.system.paste_to_clipboard")
+    def test_pastes_without_settle_delay(self, mock_clipboard, mock_hotkey):
+        """Ctrl+V should follow the copy without sleeping."""
+        mock_clipboard.return_value = True
+        action = ClipboardPasteAction({"text": "hello", "paste": True})
+        event = MidiEvent(
+            type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+        )
+
+        with patch("time.sleep") as mock_sleep:
+            action.execute(event)
+
+        assert not mock_sleep.called
+        mock_hotkey.assert_called_once()
+
     @patch("k2deck.core.keyboard.execute_hotkey")
     @patch("k2deck.actions.system.paste_to_clipboard")
     def test_does_not_paste_by_default(self, mock_clipboard, mock_hotkey):
@@ -303,6 +370,23 @@ class TestClipboardPasteAction:
             assert not mock.called
 
 
+class TestPasteToClipboard:
+    """Test paste_to_clipboard clipboard format selection."""
+
+    @pytest.mark.parametrize(
+        ("text", "fmt"), [("user@example.com", "CF_TEXT"), ("café", "CF_UNICODETEXT")]
+    )
+    def test_picks_format_by_text(self, text, fmt):
+        """ASCII text should use CF_TEXT, anything else CF_UNICODETEXT."""
+        clipboard = MagicMock()
+        con = MagicMock()
+        with patch.dict(sys.modules, {"win32clipboard": clipboard, "win32con": con}):
+            assert paste_to_clipboard(text) is True
+
+        clipboard.SetClipboardText.assert_called_once_with(text, getattr(con, fmt))
+        clipboard.CloseClipboard.assert_called_once()
+
+
 class TestNoopAction:
     """Test NoopAction class."""
 
@@ -326,16 +410,28 @@ class TestOpenURLFunction:
     """Test open_url function."""
 
     @patch("k2deck.actions.system.webbrowser")
-    def test_opens_url_in_browser(self, mock_wb):
-        """Should call webbrowser.open with URL."""
+    @patch("k2deck.actions.system._shell_open", return_value=True)
+    def test_opens_url_with_shell_execute(self, mock_shell, mock_wb):
+        """Should hand the URL straight to ShellExecuteW."""
+        result = open_url("https://example.com")
+
+        assert result is True
+        mock_shell.assert_called_once_with("https://example.com")
+        assert not mock_wb.open.called
+
+    @patch("k2deck.actions.system.webbrowser")
+    @patch("k2deck.actions.system._shell_open", return_value=False)
+    def test_falls_back_to_webbrowser(self, mock_shell, mock_wb):
+        """Should call webbrowser.open if ShellExecuteW fails."""
         result = open_url("https://example.com")
 
         assert result is True
         mock_wb.open.assert_called_once_with("https://example.com")
 
     @patch("k2deck.actions.system.webbrowser")
-    def test_returns_false_on_error(self, mock_wb):
-        """Should return False if webbrowser.open fails."""
+    @patch("k2deck.actions.system._shell_open", return_value=False)
+    def test_returns_false_on_error(self, mock_shell, mock_wb):
+        """Should return False if both launch paths fail."""
         mock_wb.open.side_effect = Exception("Browser error")
 
         result = open_url("https://example.com")
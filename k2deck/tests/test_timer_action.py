@@ -79,9 +79,7 @@ class TestTimerStartAction:
         """on_complete config creates and executes an action."""
         mock_action = MagicMock()
 
-        with patch(
-            "k2deck.core.action_factory.create_action", return_value=mock_action
-        ):
+        with patch("k2deck.actions.timer.create_action", return_value=mock_action):
             action = TimerStartAction(
                 {
                     "name": "test",
@@ -100,6 +98,22 @@ class TestTimerStartAction:
 
             mock_action.execute.assert_called_once()
 
+    def test_on_complete_action_created_once(self):
+        """The completion action is built at init and reused on every fire."""
+        mock_action = MagicMock()
+
+        with patch(
+            "k2deck.actions.timer.create_action", return_value=mock_action
+        ) as mock_create:
+            action = TimerStartAction(
+                {"name": "test", "on_complete": {"action": "noop"}}
+            )
+            action._on_complete_cb()
+            action._on_complete_cb()
+
+        mock_create.assert_called_once()
+        assert mock_action.execute.call_count == 2
+
     def test_on_complete_none_when_missing(self):
         """No callback when on_complete not specified."""
         action = TimerStartAction({"name": "test", "seconds": 60})
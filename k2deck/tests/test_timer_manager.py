@@ -217,3 +217,55 @@ class TestTimerManager:
         assert errors == []
         # Should have 40 timers
         assert len(mgr.get_all()) == 40
+
+    def test_timers_share_one_worker_thread(self):
+        """Concurrent timers tick on a single worker that exits when idle."""
+        mgr = get_timer_manager()
+        for i in range(10):
+            mgr.start_timer(f"t{i}", 60)
+
+        worker = mgr._worker
+        assert worker is not None and worker.is_alive()
+        names = [t.name for t in threading.enumerate()]
+        assert names.count("k2deck-timers") >= 1
+        assert not any(n.startswith("timer-") for n in names)
+
+        mgr.stop_all()
+        worker.join(timeout=1)
+        assert not worker.is_alive()
+        assert mgr._worker is None
+
+    def test_ticks_fire_in_deadline_order(self):
+        """A shorter timer completes before a longer one started earlier."""
+        mgr = get_timer_manager()
+        order = []
+        done = threading.Event()
+
+        def finish(name):
+            order.append(name)
+            if len(order) == 2:
+                done.set()
+
+        mgr.start_timer("slow", 2, on_complete=lambda: finish("slow"))
+        mgr.start_timer("fast", 1, on_complete=lambda: finish("fast"))
+        assert done.wait(timeout=5)
+        assert order == ["fast", "slow"]
+
+    def test_slow_on_complete_does_not_delay_other_timers(self):
+        """A blocking completion runs off the tick thread."""
+        mgr = get_timer_manager()
+        release = threading.Event()
+        other_done = threading.Event()
+        threads = []
+
+        def blocking_complete():
+            threads.append(threading.current_thread().name)
+            release.wait(timeout=5)
+
+        mgr.start_timer("slow_cb", 1, on_complete=blocking_complete)
+        mgr.start_timer("other", 2, on_complete=other_done.set)
+        try:
+            assert other_done.wait(timeout=5)
+        finally:
+            release.set()
+        assert threads[0].startswith("k2deck-timer-complete")
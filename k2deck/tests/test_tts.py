@@ -1,9 +1,12 @@
 """Tests for tts.py - Text-to-Speech action."""
 
+import threading
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
-from k2deck.actions.tts import TTSAction
+import pytest
+
+from k2deck.actions.tts import TTSAction, _speak
 
 
 @dataclass
@@ -18,6 +21,13 @@ class MidiEvent:
     timestamp: float
 
 
+@pytest.fixture
+def speak_inline():
+    """Speak synchronously instead of on the speech worker thread."""
+    with patch("k2deck.actions.tts._submit_speech", side_effect=_speak):
+        yield
+
+
 class TestTTSAction:
     """Test TTSAction class."""
 
@@ -70,6 +80,7 @@ class TestTTSAction:
             assert not mock_engine.called
 
     @patch("k2deck.actions.tts.HAS_TTS", True)
+    @pytest.mark.usefixtures("speak_inline")
     def test_speaks_text(self):
         """Should speak configured text."""
         mock_engine = MagicMock()
@@ -91,6 +102,7 @@ class TestTTSAction:
         TTSAction._engine = None
 
     @patch("k2deck.actions.tts.HAS_TTS", True)
+    @pytest.mark.usefixtures("speak_inline")
     def test_default_rate_and_volume(self):
         """Should use default rate and volume."""
         mock_engine = MagicMock()
@@ -110,6 +122,7 @@ class TestTTSAction:
         TTSAction._engine = None
 
     @patch("k2deck.actions.tts.HAS_TTS", True)
+    @pytest.mark.usefixtures("speak_inline")
     def test_handles_engine_error(self):
         """Should handle TTS engine errors gracefully."""
         mock_engine = MagicMock()
@@ -126,3 +139,27 @@ class TestTTSAction:
 
         # Clean up
         TTSAction._engine = None
+
+    @patch("k2deck.actions.tts.HAS_TTS", True)
+    def test_speaks_on_worker_thread(self):
+        """execute should return at once and speak on the TTS thread."""
+        spoken = threading.Event()
+        threads = []
+
+        def run_and_wait():
+            threads.append(threading.current_thread().name)
+            spoken.set()
+
+        mock_engine = MagicMock()
+        mock_engine.runAndWait.side_effect = run_and_wait
+
+        with patch.object(TTSAction, "_get_engine", return_value=mock_engine):
+            action = TTSAction({"text": "Queued"})
+            event = MidiEvent(
+                type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
+            )
+            action.execute(event)
+            assert spoken.wait(1.0)
+
+        mock_engine.say.assert_called_once_with("Queued")
+        assert threads == ["k2deck-tts"]
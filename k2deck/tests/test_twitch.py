@@ -1,7 +1,7 @@
 """Tests for twitch.py and twitch_client.py - Twitch integration."""
 
 from dataclasses import dataclass
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -107,6 +107,26 @@ class TestTwitchClient:
         client._last_action_time = time.time() - 2.0  # 2 seconds ago
         assert client._rate_limit() is True
 
+    def test_update_game_looks_up_id_once(self):
+        """Repeat game updates should reuse the cached category ID."""
+        client = TwitchClient()
+        client._connected = True
+        client._twitch = MagicMock()
+        client._twitch.get_games = AsyncMock(
+            return_value=MagicMock(data=[MagicMock(id="509658")])
+        )
+        client._twitch.modify_channel_information = AsyncMock()
+
+        assert client.update_game("Just Chatting") is True
+        client._last_action_time = 0.0
+        assert client.update_game("Just Chatting") is True
+
+        client._twitch.get_games.assert_awaited_once()
+        assert client._twitch.modify_channel_information.await_count == 2
+        client._twitch.modify_channel_information.assert_awaited_with(
+            broadcaster_id=None, game_id="509658"
+        )
+
 
 class TestTwitchMarkerAction:
     """Test TwitchMarkerAction class."""
@@ -122,7 +142,7 @@ class TestTwitchMarkerAction:
             type="cc", channel=16, note=None, cc=1, value=64, timestamp=0.0
         )
 
-        with patch("k2deck.core.twitch_client.get_twitch_client") as mock_get:
+        with patch("k2deck.actions.twitch.get_twitch_client") as mock_get:
             action.execute(event)
             mock_get.assert_not_called()
 
@@ -133,7 +153,7 @@ class TestTwitchMarkerAction:
             type="note_on", channel=16, note=36, cc=None, value=0, timestamp=0.0
         )
 
-        with patch("k2deck.core.twitch_client.get_twitch_client") as mock_get:
+        with patch("k2deck.actions.twitch.get_twitch_client") as mock_get:
             action.execute(event)
             mock_get.assert_not_called()
 
@@ -148,9 +168,7 @@ class TestTwitchMarkerAction:
         mock_client.is_available = True
         mock_client.is_connected = True
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.create_marker.assert_called_once_with("highlight")
 
@@ -164,9 +182,7 @@ class TestTwitchMarkerAction:
         mock_client = MagicMock()
         mock_client.is_available = False
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.create_marker.assert_not_called()
 
@@ -181,9 +197,7 @@ class TestTwitchMarkerAction:
         mock_client.is_available = True
         mock_client.is_connected = False
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.create_marker.assert_not_called()
 
@@ -202,7 +216,7 @@ class TestTwitchClipAction:
             type="cc", channel=16, note=None, cc=1, value=64, timestamp=0.0
         )
 
-        with patch("k2deck.core.twitch_client.get_twitch_client") as mock_get:
+        with patch("k2deck.actions.twitch.get_twitch_client") as mock_get:
             action.execute(event)
             mock_get.assert_not_called()
 
@@ -218,9 +232,7 @@ class TestTwitchClipAction:
         mock_client.is_connected = True
         mock_client.create_clip.return_value = "https://clips.twitch.tv/test123"
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.create_clip.assert_called_once()
 
@@ -239,7 +251,7 @@ class TestTwitchChatAction:
             type="cc", channel=16, note=None, cc=1, value=64, timestamp=0.0
         )
 
-        with patch("k2deck.core.twitch_client.get_twitch_client") as mock_get:
+        with patch("k2deck.actions.twitch.get_twitch_client") as mock_get:
             action.execute(event)
             mock_get.assert_not_called()
 
@@ -254,9 +266,7 @@ class TestTwitchChatAction:
         mock_client.is_available = True
         mock_client.is_connected = True
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.send_chat.assert_called_once_with("Thanks for watching!")
 
@@ -271,9 +281,7 @@ class TestTwitchChatAction:
         mock_client.is_available = True
         mock_client.is_connected = True
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.send_chat.assert_not_called()
 
@@ -292,7 +300,7 @@ class TestTwitchTitleAction:
             type="cc", channel=16, note=None, cc=1, value=64, timestamp=0.0
         )
 
-        with patch("k2deck.core.twitch_client.get_twitch_client") as mock_get:
+        with patch("k2deck.actions.twitch.get_twitch_client") as mock_get:
             action.execute(event)
             mock_get.assert_not_called()
 
@@ -307,9 +315,7 @@ class TestTwitchTitleAction:
         mock_client.is_available = True
         mock_client.is_connected = True
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.update_title.assert_called_once_with("Just Chatting!")
 
@@ -324,9 +330,7 @@ class TestTwitchTitleAction:
         mock_client.is_available = True
         mock_client.is_connected = True
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.update_title.assert_not_called()
 
@@ -345,7 +349,7 @@ class TestTwitchGameAction:
             type="cc", channel=16, note=None, cc=1, value=64, timestamp=0.0
         )
 
-        with patch("k2deck.core.twitch_client.get_twitch_client") as mock_get:
+        with patch("k2deck.actions.twitch.get_twitch_client") as mock_get:
             action.execute(event)
             mock_get.assert_not_called()
 
@@ -360,9 +364,7 @@ class TestTwitchGameAction:
         mock_client.is_available = True
         mock_client.is_connected = True
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.update_game.assert_called_once_with("Just Chatting")
 
@@ -377,8 +379,21 @@ class TestTwitchGameAction:
         mock_client.is_available = True
         mock_client.is_connected = True
 
-        with patch(
-            "k2deck.core.twitch_client.get_twitch_client", return_value=mock_client
-        ):
+        with patch("k2deck.actions.twitch.get_twitch_client", return_value=mock_client):
             action.execute(event)
             mock_client.update_game.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "action_class",
+    [
+        TwitchMarkerAction,
+        TwitchClipAction,
+        TwitchChatAction,
+        TwitchTitleAction,
+        TwitchGameAction,
+    ],
+)
+def test_actions_dispatch_only_note_on(action_class):
+    """The app should skip CC events before queuing Twitch actions."""
+    assert action_class.handles_type == "note_on"
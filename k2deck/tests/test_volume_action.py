@@ -1,10 +1,19 @@
 """Tests for volume.py - Volume control action and session cache."""
 
+import threading
 import time
 from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
-from k2deck.actions.volume import SessionCache, VolumeAction
+from k2deck.actions.volume import (
+    SessionCache,
+    VolumeAction,
+    _com_executor,
+    _set_process_volume,
+    invalidate_session_cache,
+    set_master_volume,
+    set_process_volume,
+)
 
 
 @dataclass
@@ -19,6 +28,11 @@ class MidiEvent:
     timestamp: float
 
 
+def _wait_for_com():
+    """Block until jobs already queued on the COM worker have run."""
+    _com_executor.submit(lambda: None).result()
+
+
 class TestSessionCache:
     """Test SessionCache class."""
 
@@ -41,6 +55,18 @@ class TestSessionCache:
 
         assert cache._last_refresh == 0.0
 
+    def test_invalidate_keeps_com_objects(self):
+        """invalidate() must not drop COM pointers from the calling thread."""
+        cache = SessionCache()
+        endpoint = MagicMock()
+        cache._endpoint = endpoint
+        cache._endpoint_refresh = 1000.0
+
+        cache.invalidate()
+
+        assert cache._endpoint is endpoint
+        assert cache._endpoint_refresh == 0.0
+
     @patch("k2deck.actions.volume.AudioUtilities")
     @patch("k2deck.actions.volume.pythoncom")
     def test_get_sessions_returns_empty_list_for_unknown_process(
@@ -56,8 +82,8 @@ class TestSessionCache:
 
     @patch("k2deck.actions.volume.AudioUtilities")
     @patch("k2deck.actions.volume.pythoncom")
-    def test_get_sessions_case_insensitive(self, mock_com, mock_audio):
-        """Process lookup should be case insensitive."""
+    def test_get_sessions_keyed_by_lowercase_name(self, mock_com, mock_audio):
+        """Sessions should be stored under the lowercased process name."""
         # Create mock session
         mock_session = MagicMock()
         mock_session.Process.name.return_value = "Spotify.exe"
@@ -65,8 +91,8 @@ class TestSessionCache:
 
         cache = SessionCache()
 
-        # Lookup with different case
-        result = cache.get_sessions("SPOTIFY.EXE")
+        # Callers pass the name already lowercased
+        result = cache.get_sessions("spotify.exe")
 
         # Should find it (stored as lowercase)
         assert len(result) == 1
@@ -105,12 +131,82 @@ class TestSessionCache:
 
         assert second_call_count > first_call_count
 
+    @patch("k2deck.actions.volume.AudioUtilities")
+    @patch("k2deck.actions.volume.pythoncom")
+    def test_volume_interface_queried_once_per_refresh(self, mock_com, mock_audio):
+        """Repeated volume writes should reuse the cached ISimpleAudioVolume."""
+        mock_session = MagicMock()
+        mock_session.Process.name.return_value = "Spotify.exe"
+        mock_audio.GetAllSessions.return_value = [mock_session]
+        cache = SessionCache()
+
+        with patch("k2deck.actions.volume._session_cache", cache):
+            for volume in (0.2, 0.4, 0.6):
+                assert _set_process_volume("spotify.exe", volume) is True
+
+        mock_session._ctl.QueryInterface.assert_called_once()
+        volume_interface = mock_session._ctl.QueryInterface.return_value
+        assert volume_interface.SetMasterVolume.call_count == 3
+
+
+class TestComWorker:
+    """Test that pycaw calls run on the shared COM thread."""
+
+    def teardown_method(self):
+        invalidate_session_cache()
+
+    def test_process_volume_runs_on_com_thread(self):
+        """Session volume should be set from the k2deck-com worker."""
+        threads = []
+
+        def record(process_name, volume):
+            threads.append(threading.current_thread().name)
+            return True
+
+        with patch("k2deck.actions.volume._set_process_volume", side_effect=record):
+            assert set_process_volume("Spotify.exe", 0.5) is True
+
+        assert threads[0].startswith("k2deck-com")
+
+    def test_set_process_volume_lowercases_name(self):
+        """The public setter should accept any casing of the process name."""
+        with patch(
+            "k2deck.actions.volume._set_process_volume", return_value=True
+        ) as mock_set:
+            set_process_volume("SPOTIFY.EXE", 0.5)
+
+        mock_set.assert_called_once_with("spotify.exe", 0.5)
+
+    @patch("k2deck.actions.volume._activate_endpoint_volume")
+    def test_master_endpoint_activated_once(self, mock_activate):
+        """The endpoint interface should be reused across calls."""
+        invalidate_session_cache()
+
+        assert set_master_volume(0.25) is True
+        assert set_master_volume(0.75) is True
+
+        mock_activate.assert_called_once()
+        endpoint = mock_activate.return_value
+        assert endpoint.SetMasterVolumeLevelScalar.call_count == 2
+
+    @patch("k2deck.actions.volume._activate_endpoint_volume")
+    def test_master_endpoint_dropped_on_error(self, mock_activate):
+        """A failing endpoint should be re-activated on the next call."""
+        invalidate_session_cache()
+        endpoint = mock_activate.return_value
+        endpoint.SetMasterVolumeLevelScalar.side_effect = OSError("gone")
+
+        assert set_master_volume(0.5) is False
+        endpoint.SetMasterVolumeLevelScalar.side_effect = None
+        assert set_master_volume(0.5) is True
+        assert mock_activate.call_count == 2
+
 
 class TestVolumeAction:
     """Test VolumeAction class."""
 
-    @patch("k2deck.actions.volume.set_master_volume")
-    @patch("k2deck.actions.volume.set_process_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
+    @patch("k2deck.actions.volume._set_process_volume")
     def test_only_triggers_on_cc(self, mock_process_vol, mock_master_vol):
         """Should only execute on CC events."""
         action = VolumeAction({"target_process": "__master__"})
@@ -120,6 +216,7 @@ class TestVolumeAction:
             type="note_on", channel=16, note=36, cc=None, value=127, timestamp=0.0
         )
         action.execute(event)
+        _wait_for_com()
         assert not mock_master_vol.called
         assert not mock_process_vol.called
 
@@ -128,9 +225,10 @@ class TestVolumeAction:
             type="note_off", channel=16, note=36, cc=None, value=0, timestamp=0.0
         )
         action.execute(event)
+        _wait_for_com()
         assert not mock_master_vol.called
 
-    @patch("k2deck.actions.volume.set_master_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
     def test_maps_midi_0_to_volume_0(self, mock_master):
         """MIDI value 0 should map to volume 0.0."""
         action = VolumeAction({"target_process": "__master__"})
@@ -140,9 +238,11 @@ class TestVolumeAction:
 
         action.execute(event)
 
+        _wait_for_com()
+
         mock_master.assert_called_once_with(0.0)
 
-    @patch("k2deck.actions.volume.set_master_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
     def test_maps_midi_127_to_volume_1(self, mock_master):
         """MIDI value 127 should map to volume 1.0."""
         action = VolumeAction({"target_process": "__master__"})
@@ -152,9 +252,11 @@ class TestVolumeAction:
 
         action.execute(event)
 
+        _wait_for_com()
+
         mock_master.assert_called_once_with(1.0)
 
-    @patch("k2deck.actions.volume.set_master_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
     def test_maps_midi_64_to_volume_half(self, mock_master):
         """MIDI value 64 should map to ~50% volume."""
         action = VolumeAction({"target_process": "__master__"})
@@ -164,12 +266,14 @@ class TestVolumeAction:
 
         action.execute(event)
 
+        _wait_for_com()
+
         # 64/127 ≈ 0.504
         args = mock_master.call_args[0]
         assert 0.50 <= args[0] <= 0.51
 
-    @patch("k2deck.actions.volume.set_master_volume")
-    @patch("k2deck.actions.volume.set_process_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
+    @patch("k2deck.actions.volume._set_process_volume")
     def test_uses_master_volume_for_master_target(self, mock_process, mock_master):
         """Should use set_master_volume for __master__ target."""
         action = VolumeAction({"target_process": "__master__"})
@@ -179,11 +283,13 @@ class TestVolumeAction:
 
         action.execute(event)
 
+        _wait_for_com()
+
         assert mock_master.called
         assert not mock_process.called
 
-    @patch("k2deck.actions.volume.set_master_volume")
-    @patch("k2deck.actions.volume.set_process_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
+    @patch("k2deck.actions.volume._set_process_volume")
     def test_uses_process_volume_for_specific_process(self, mock_process, mock_master):
         """Should use set_process_volume for specific process."""
         action = VolumeAction({"target_process": "Spotify.exe"})
@@ -193,13 +299,15 @@ class TestVolumeAction:
 
         action.execute(event)
 
+        _wait_for_com()
+
         assert mock_process.called
         assert not mock_master.called
-        # Check process name was passed
+        # Check process name was passed, lowercased at init
         args = mock_process.call_args[0]
-        assert args[0] == "Spotify.exe"
+        assert args[0] == "spotify.exe"
 
-    @patch("k2deck.actions.volume.set_master_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
     def test_default_target_is_master(self, mock_master):
         """Default target should be __master__ if not specified."""
         action = VolumeAction({})  # No target_process
@@ -209,13 +317,15 @@ class TestVolumeAction:
 
         action.execute(event)
 
+        _wait_for_com()
+
         assert mock_master.called
 
 
 class TestMidiToVolumeMapping:
     """Test MIDI value to volume mapping edge cases."""
 
-    @patch("k2deck.actions.volume.set_master_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
     def test_full_range_mapping(self, mock_master):
         """Test several points across the MIDI range."""
         action = VolumeAction({"target_process": "__master__"})
@@ -237,7 +347,35 @@ class TestMidiToVolumeMapping:
 
             action.execute(event)
 
+            _wait_for_com()
+
             actual_vol = mock_master.call_args[0][0]
             assert abs(actual_vol - expected_vol) < 0.001, (
                 f"MIDI {midi_val}: expected {expected_vol}, got {actual_vol}"
             )
+
+
+class TestVolumeCoalescing:
+    """Test that fader sweeps are coalesced before touching COM."""
+
+    @patch("k2deck.actions.volume._set_process_volume")
+    @patch("k2deck.actions.volume._set_master_volume")
+    def test_sweep_applies_newest_value_per_target(self, mock_master, mock_process):
+        """Values queued before a drain should collapse to the last one."""
+        master = VolumeAction({"target_process": "__master__"})
+        spotify = VolumeAction({"target_process": "Spotify.exe"})
+        gate = threading.Event()
+
+        # Hold the COM worker so the whole sweep lands in one drain
+        _com_executor.submit(gate.wait)
+        for value in range(0, 128, 16):
+            event = MidiEvent(
+                type="cc", channel=16, note=None, cc=16, value=value, timestamp=0.0
+            )
+            master.execute(event)
+            spotify.execute(event)
+        gate.set()
+        _wait_for_com()
+
+        mock_master.assert_called_once_with(112 / 127)
+        mock_process.assert_called_once_with("spotify.exe", 112 / 127)
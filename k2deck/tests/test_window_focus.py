@@ -0,0 +1,118 @@
+"""Tests for window focus helpers."""
+
+from unittest.mock import patch
+
+from k2deck.actions import window
+from k2deck.core.context import AppInfo
+
+
+def _foreground(name: str) -> AppInfo:
+    return AppInfo(name=name, title="Title", pid=1234, hwnd=42)
+
+
+class TestFocusApp:
+    """Tests for focus_app."""
+
+    def test_skips_enumeration_when_already_foreground(self):
+        """Should not enumerate windows if the app is already in front."""
+        with (
+            patch.object(
+                window, "get_foreground_app", return_value=_foreground("Brave.exe")
+            ),
+            patch.object(window, "find_window_by_process") as mock_find,
+            patch.object(window, "wait_for_foreground") as mock_wait,
+        ):
+            assert window.focus_app("brave.exe", settle_timeout=0.05) is True
+            mock_find.assert_not_called()
+            mock_wait.assert_not_called()
+
+    def test_focuses_and_waits_when_in_background(self):
+        """Should focus the window and wait for it to reach the foreground."""
+        with (
+            patch.object(
+                window, "get_foreground_app", return_value=_foreground("code.exe")
+            ),
+            patch.object(window, "find_window_by_process", return_value=99),
+            patch.object(window, "focus_window", return_value=True),
+            patch.object(window, "wait_for_foreground") as mock_wait,
+        ):
+            assert window.focus_app("brave.exe", settle_timeout=0.05) is True
+            mock_wait.assert_called_once_with(99, 0.05)
+
+    def test_missing_window_fails(self):
+        """Should return False when no window is found."""
+        with (
+            patch.object(window, "get_foreground_app", return_value=None),
+            patch.object(window, "find_window_by_process", return_value=None),
+        ):
+            assert window.focus_app("brave.exe") is False
+
+
+class TestFindWindowByProcess:
+    """Tests for find_window_by_process."""
+
+    def setup_method(self):
+        window._hwnd_cache.clear()
+
+    def teardown_method(self):
+        window._hwnd_cache.clear()
+
+    def test_cache_hit_skips_enumeration(self):
+        """A still-valid cached window should be returned without EnumWindows."""
+        window._hwnd_cache["spotify.exe"] = (77, 1234)
+        with (
+            patch.object(window.win32gui, "IsWindow", return_value=True),
+            patch.object(window.win32gui, "IsWindowVisible", return_value=True),
+            patch.object(
+                window.win32process, "GetWindowThreadProcessId", return_value=(1, 1234)
+            ),
+            patch.object(window.win32gui, "EnumWindows") as mock_enum,
+        ):
+            assert window.find_window_by_process("Spotify.exe") == 77
+            mock_enum.assert_not_called()
+
+    def test_stale_cache_rescans(self):
+        """A cached hwnd now owned by another pid should trigger a new scan."""
+        window._hwnd_cache["spotify.exe"] = (77, 1234)
+        with (
+            patch.object(window.win32gui, "IsWindow", return_value=True),
+            patch.object(window.win32gui, "IsWindowVisible", return_value=True),
+            patch.object(
+                window.win32process, "GetWindowThreadProcessId", return_value=(1, 999)
+            ),
+            patch.object(window.win32gui, "EnumWindows") as mock_enum,
+        ):
+            assert window.find_window_by_process("Spotify.exe") is None
+            mock_enum.assert_called_once()
+        assert "spotify.exe" not in window._hwnd_cache
+
+    def test_stale_entry_already_dropped_by_another_thread(self):
+        """Invalidating an entry another thread just removed should not raise."""
+        window._hwnd_cache["spotify.exe"] = (77, 1234)
+
+        def racing_is_window(hwnd):
+            window._hwnd_cache.pop("spotify.exe", None)  # the other thread
+            return False
+
+        with patch.object(window.win32gui, "IsWindow", side_effect=racing_is_window):
+            assert window._cached_window("spotify.exe") is None
+
+
+class TestWaitForForeground:
+    """Tests for wait_for_foreground."""
+
+    def test_returns_as_soon_as_focused(self):
+        """Should stop polling once the window is in the foreground."""
+        with (
+            patch.object(
+                window.win32gui, "GetForegroundWindow", side_effect=[1, 1, 99]
+            ),
+            patch.object(window.time, "sleep") as mock_sleep,
+        ):
+            assert window.wait_for_foreground(99, timeout=1.0) is True
+            assert mock_sleep.call_count == 2
+
+    def test_times_out(self):
+        """Should give up after the timeout."""
+        with patch.object(window.win32gui, "GetForegroundWindow", return_value=1):
+            assert window.wait_for_foreground(99, timeout=0.01) is False
@@ -598,7 +598,7 @@ async def trigger_action(body: TriggerActionRequest) -> dict[str, str]:
         HTTPException: If action type is unknown.
     """
     from k2deck.core.action_factory import create_action
-    from k2deck.core.midi_listener import MidiEvent
+    from k2deck.core.midi_listener import NOTE_ON, MidiEvent
 
     action_config = {**body.config, "action": body.action}
     action = create_action(action_config)
@@ -608,7 +608,7 @@ async def trigger_action(body: TriggerActionRequest) -> dict[str, str]:
         )
 
     event = MidiEvent(
-        type="note_on", channel=16, note=0, cc=None, value=127, timestamp=0.0
+        type=NOTE_ON, channel=16, note=0, cc=None, value=127, timestamp=0.0
     )
 
     import asyncio
@@ -181,14 +181,14 @@ def handle_client_message(data: dict, websocket: WebSocket) -> None:
 
         if action_type:
             from k2deck.core.action_factory import create_action
-            from k2deck.core.midi_listener import MidiEvent
+            from k2deck.core.midi_listener import NOTE_ON, MidiEvent
 
             try:
                 action = create_action({"action": action_type, **action_config})
                 if action:
                     # Create a fake note_on event
                     event = MidiEvent(
-                        type="note_on",
+                        type=NOTE_ON,
                         channel=16,
                         note=0,
                         cc=None,